@@ -0,0 +1,35 @@
+from typing import Callable, Sequence
+
+# Attribute the decorator leaves on a handler, CommandService builds its commands from it
+COMMAND_OPTIONS = "command_options"
+
+
+def command(
+    name: str,
+    description: str,
+    args: Sequence[str] | None = None,
+    aliases: Sequence[str] = (),
+    requires_data: bool = True,
+) -> Callable[[Callable], Callable]:
+    def register(func: Callable) -> Callable:
+        setattr(func, COMMAND_OPTIONS, {
+            "name": name,
+            "description": description,
+            "args": args,
+            "aliases": aliases,
+            "requires_data": requires_data,
+        })
+        return func
+
+    return register
+
+
+def get_registered_commands(cls: type) -> list[tuple[str, dict]]:
+    # Attribute names and options of every decorated handler, base classes first
+    registered = {}
+    for klass in reversed(cls.__mro__):
+        for attribute, value in vars(klass).items():
+            options = getattr(value, COMMAND_OPTIONS, None)
+            if options is not None:
+                registered[attribute] = options
+    return list(registered.items())
@@ -1,44 +1,64 @@
+from contextlib import contextmanager
 from functools import wraps
-from typing import Callable
+from typing import Callable, Iterator
 
 from DAL.Exceptions.ExitBotException import ExitBotException
 from DAL.Exceptions.InvalidException import InvalidException
 from DAL.Exceptions.NotFoundException import NotFoundException
 
 
+# Same flag inspect.isgeneratorfunction checks; inspect is slow to import and every command module needs this
+CO_GENERATOR = 0x20
+
+
 def command_handler_decorator(func: Callable) -> Callable:
+    if func.__code__.co_flags & CO_GENERATOR:
+        # Streaming handlers fail while being iterated, not when called
+        @wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            with _translate_errors():
+                yield from func(*args, **kwargs)
+
+        return generator_wrapper
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        try:
+        with _translate_errors():
             return func(*args, **kwargs)
 
-        except ExitBotException:
-            raise
+    return wrapper
 
-        except KeyError as ex:
-            missing = str(ex).strip("'") if ex.args else "Unknown"
-            raise NotFoundException(f"'{missing}' not found. Please check the name and try again.")
 
-        except IndexError:
-            raise InvalidException(
-                "Invalid command format. It looks like you missed one or more arguments.\n"
-                "Tip: Use 'help' to see how to use each command properly."
-            )
+@contextmanager
+def _translate_errors() -> Iterator[None]:
+    try:
+        yield
 
-        except ValueError:
-            raise InvalidException(
-                "Invalid data format. Please make sure you entered the correct number of arguments "
-                "and separated them with spaces.\n"
-                "Tip: Use 'help' to see how to use each command properly."
-            )
+    except ExitBotException:
+        raise
 
-        except TypeError:
-            raise InvalidException(
-                "This command was used incorrectly. Some arguments may be missing or extra.\n"
-                "Tip: Use 'help' to see how to use each command properly."
-            )
+    except KeyError as ex:
+        missing = str(ex).strip("'") if ex.args else "Unknown"
+        raise NotFoundException(f"'{missing}' not found. Please check the name and try again.")
 
-        except Exception as ex:
-            raise InvalidException(f"Unexpected error: {ex}")
+    except IndexError:
+        raise InvalidException(
+            "Invalid command format. It looks like you missed one or more arguments.\n"
+            "Tip: Use 'help' to see how to use each command properly."
+        )
 
-    return wrapper
+    except ValueError:
+        raise InvalidException(
+            "Invalid data format. Please make sure you entered the correct number of arguments "
+            "and separated them with spaces.\n"
+            "Tip: Use 'help' to see how to use each command properly."
+        )
+
+    except TypeError:
+        raise InvalidException(
+            "This command was used incorrectly. Some arguments may be missing or extra.\n"
+            "Tip: Use 'help' to see how to use each command properly."
+        )
+
+    except Exception as ex:
+        raise InvalidException(f"Unexpected error: {ex}")
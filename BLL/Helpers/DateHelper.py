@@ -18,14 +18,31 @@ class DateHelper:
         next_week = today_date + timedelta(days=7)
 
         adjusted_date = DateHelper.set_date_with_feb_edge_case(event_date_parsed, today_date.year)
-
-        if adjusted_date.weekday() == 5:  # Saturday
-            adjusted_date += timedelta(days=2)
-        elif adjusted_date.weekday() == 6:  # Sunday
-            adjusted_date += timedelta(days=1)
+        adjusted_date = DateHelper.shift_from_weekend(adjusted_date)
 
         return today_date <= adjusted_date <= next_week
 
+    @staticmethod
+    def shift_from_weekend(value: date) -> date:
+        if value.weekday() == 5:  # Saturday
+            return value + timedelta(days=2)
+        if value.weekday() == 6:  # Sunday
+            return value + timedelta(days=1)
+        return value
+
+    @staticmethod
+    def get_birthday_keys(celebration_date: date) -> tuple[tuple[int, int], ...]:
+        # (month, day) keys of birthdays celebrated on the given date:
+        # in non-leap years 29 February is celebrated on 28 February.
+        key = (celebration_date.month, celebration_date.day)
+        if key == (2, 28) and not DateHelper.is_leap_year(celebration_date.year):
+            return key, (2, 29)
+        return (key,)
+
+    @staticmethod
+    def is_leap_year(year: int) -> bool:
+        return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
     @staticmethod
     def parse_to_date(value: Union[str, datetime, date]) -> date:
         if not value:
@@ -45,9 +62,7 @@ class DateHelper:
 
     @staticmethod
     def set_date_with_feb_edge_case(birthday_date: date, target_year: int) -> date:
-        is_leap = (target_year % 4 == 0 and (target_year % 100 != 0 or target_year % 400 == 0))
-
-        if birthday_date.month == 2 and birthday_date.day == 29 and not is_leap:
+        if birthday_date.month == 2 and birthday_date.day == 29 and not DateHelper.is_leap_year(target_year):
             return date(target_year, 2, 28)
 
         return date(target_year, birthday_date.month, birthday_date.day)
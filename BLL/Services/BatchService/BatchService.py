@@ -0,0 +1,94 @@
+import time
+from typing import Callable, Iterable
+
+from BLL.Services.BatchService.IBatchService import IBatchService
+from BLL.Services.InputService.IInputService import IInputService
+from BLL.Services.PickleFileService.IPickleFileService import IPickleFileService
+from DAL.Entities.BatchReport import BatchReport
+from DAL.Exceptions.AlreadyExistException import AlreadyExistException
+from DAL.Exceptions.ExitBotException import ExitBotException
+from DAL.Exceptions.InvalidException import InvalidException
+from DAL.Exceptions.NotFoundException import NotFoundException
+
+
+class BatchService(IBatchService):
+    # Lines starting with it are skipped, like empty lines
+    COMMENT_PREFIX = "#"
+
+    def __init__(
+        self,
+        input_service: IInputService,
+        file_service: IPickleFileService | None = None,
+        save_every: int = 0,
+        stop_on_error: bool = False,
+        output: Callable[[str], None] | None = None,
+        error_output: Callable[[str], None] | None = None,
+    ) -> None:
+        if save_every < 0:
+            raise InvalidException("save_every cannot be negative")
+        self.input_service = input_service
+        # None when the storage persists every change itself, as SQLite and the journal do
+        self.file_service = file_service
+        # 0 saves once when the script ends
+        self.save_every = save_every
+        self.stop_on_error = stop_on_error
+        # Command results and failures, None drops them; failures are in the report either way
+        self.output = output
+        self.error_output = error_output
+
+    def run(self, lines: Iterable[str]) -> BatchReport:
+        report = BatchReport()
+        started = time.perf_counter()
+
+        for line_number, line in enumerate(lines, start=1):
+            user_input = line.strip()
+            if not user_input or user_input.startswith(self.COMMENT_PREFIX):
+                continue
+
+            report.executed += 1
+            try:
+                self._execute(user_input)
+            except ExitBotException as eb:
+                self._print(str(eb))
+                break
+            except (InvalidException, AlreadyExistException, NotFoundException) as e:
+                report.add_failure(line_number, str(e))
+                if self.error_output is not None:
+                    self.error_output(f"Line {line_number}: {e}")
+                if self.stop_on_error:
+                    report.stopped_at = line_number
+                    break
+
+            if self.save_every and report.executed % self.save_every == 0:
+                self._save(report)
+
+        self._save(report)
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _execute(self, user_input: str) -> None:
+        result = self.input_service.handle(user_input)
+        if isinstance(result, str):
+            self._print(result)
+        elif result is not None:
+            # Streaming results are consumed even when nothing is printed, errors surface while iterating
+            for chunk in result:
+                self._print(chunk)
+
+    def _save(self, report: BatchReport) -> None:
+        if self.file_service is None or not self.file_service.is_save_able():
+            return
+
+        try:
+            self.file_service.save_with_name()
+        except (InvalidException, OSError) as e:
+            # The script goes on, the next save retries with the same changes
+            report.save_errors.append(str(e))
+            if self.error_output is not None:
+                self.error_output(f"Save failed: {e}")
+            return
+        report.saves += 1
+
+    def _print(self, text: str) -> None:
+        if self.output is not None:
+            self.output(text)
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from DAL.Entities.BatchReport import BatchReport
+
+
+class IBatchService(ABC):
+
+    @abstractmethod
+    def run(self, lines: Iterable[str]) -> BatchReport:
+        pass
@@ -1,41 +1,47 @@
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 
 from BLL.Services.CommandService.ICommandService import ICommandService
+from BLL.Services.ExportService.ExportService import ExportService
+from BLL.Services.ExportService.IExportService import IExportService
+from BLL.Services.ImportService.IImportService import IImportService
+from BLL.Services.ImportService.ImportService import ImportService
 from BLL.Services.PickleFileService.IPickleFileService import IPickleFileService
 from BLL.Services.RecordService.IRecordService import IRecordService
 from DAL.Entities.Command import Command
 from DAL.Entities.Record import Record
 from DAL.Exceptions.ExitBotException import ExitBotException
+from DAL.Exceptions.InvalidException import InvalidException
+from BLL.Decorators.CommandDecorator import command, get_registered_commands
 from BLL.Decorators.CommandHandlerDecorator import command_handler_decorator
 from DAL.Storages.IStorage import IStorage
 
 
 class CommandService(ICommandService):
-    def __init__(self, record_service: IRecordService, file_service: IPickleFileService[IStorage[str, Record]]) -> None:
+    STREAM_CHUNK_SIZE = 100
+
+    def __init__(
+        self,
+        record_service: IRecordService,
+        file_service: IPickleFileService[IStorage[str, Record]],
+        autosave_on_exit: bool = True,
+        import_service: IImportService | None = None,
+        export_service: IExportService | None = None,
+    ) -> None:
         self.record_service = record_service
         self.file_service = file_service
+        self.autosave_on_exit = autosave_on_exit
+        self.import_service = import_service or ImportService(record_service)
+        self.export_service = export_service or ExportService(record_service)
         self._help_text = None
 
-        self.commands: dict[str, Command] = {
-            'hello': Command('hello', self.hello, 'Greet the bot'),
-            'add-contact': Command('add-contact', self.add_contact, 'Add a new contact: add-contact [name] [phone]'),
-            'add-phone': Command('add-phone', self.add_phone, "Add new phone to contact: add-phone [name] [new_phone]."),
-            'show-phone': Command('show-phone', self.show_phone, "Show a contact's phone by name: show-phone [name]"),
-            'show-all-contacts': Command('show-all-contacts', self.show_all, 'Show all contacts'),
-            'help': Command('help', self.help_command, 'Show this help message'),
-            'exit': Command('exit', self.exit_bot, 'Exit the program'),
-            'close': Command('close', self.exit_bot, 'Close the program'),
-            'add-birthday': Command('add-birthday', self.add_birthday,"Add birthday to contact: add-birthday [name] [birthday]. Note it will replace birthday if exist"),
-            'show-birthday': Command('show-birthday', self.show_birthday,"Show birthday to contact: show-birthday [name]"),
-            'upcoming-birthdays': Command('upcoming-birthdays', self.birthdays, 'Show upcoming birthdays for next week'),
-            'delete-contact': Command('delete-contact', self.delete_contact, 'Delete a contact: delete-contact [name]'),
-            'save': Command('save', self.save_state, 'Save current state to file: save [name] or "save" without name for autosave'),
-            'load': Command('load', self.load_state, 'Load state from file: load [name]'),
-            'delete-file': Command('delete-file', self.delete_file, 'Delete the data file: delete-file [name]'),
-            'show-all-files': Command('show-all-files', self.show_all_files, 'Show all data files')
-        }
+        self.commands: dict[str, Command] = {}
+        for attribute, options in get_registered_commands(type(self)):
+            registered = Command(handler=getattr(self, attribute), **options)
+            for name in (registered.name, *registered.aliases):
+                self.commands[name] = registered
 
+    @command('add-contact', 'Add a new contact: add-contact [name] [phone]', args=("name", "phone"))
     @command_handler_decorator
     def add_contact(self, arguments: list[str]) -> str:
         name, phone = [arg.strip() for arg in arguments]
@@ -44,6 +50,7 @@ class CommandService(ICommandService):
 
         return f"Contact added. {new_contact}"
 
+    @command('add-phone', "Add new phone to contact: add-phone [name] [new_phone].", args=("name", "new_phone"))
     @command_handler_decorator
     def add_phone(self, arguments: list[str]) -> str:
         name, new_phone = [arg.strip() for arg in arguments]
@@ -53,6 +60,7 @@ class CommandService(ICommandService):
 
         return f"Contact updated. {contact}"
 
+    @command('show-phone', "Show a contact's phone by name: show-phone [name]", args=("name",))
     @command_handler_decorator
     def show_phone(self, arguments: list[str]) -> str:
         name = arguments[0]
@@ -60,6 +68,27 @@ class CommandService(ICommandService):
 
         return ", ".join(p.value for p in contact.phones)
 
+    @command('find-by-phone', "Find contacts by a phone or its beginning, e.g. a country code: find-by-phone [phone]", args=("phone",))
+    @command_handler_decorator
+    def find_by_phone(self, arguments: list[str]) -> str:
+        phone = arguments[0].strip()
+        contacts = self.record_service.get_by_phone(phone)
+
+        return "\n".join([f"{contact}" for contact in contacts])
+
+    @command('search', 'Find contacts whose name starts with a prefix: search [prefix] [limit]', args=("prefix", "limit?"))
+    @command_handler_decorator
+    def search(self, arguments: list[str]) -> str:
+        prefix = arguments[0]
+        limit = int(arguments[1]) if len(arguments) > 1 else None
+        contacts = self.record_service.search(prefix, limit)
+
+        if not contacts:
+            return "No contacts found."
+
+        return "\n".join([f"{contact}" for contact in contacts])
+
+    @command('add-birthday', "Add birthday to contact: add-birthday [name] [birthday]. Note it will replace birthday if exist", args=("name", "birthday"))
     @command_handler_decorator
     def add_birthday(self, arguments: list[str]) -> str:
         name, birthday = arguments
@@ -72,6 +101,7 @@ class CommandService(ICommandService):
 
         return f"Contact updated. {name}"
 
+    @command('show-birthday', "Show birthday to contact: show-birthday [name]", args=("name",))
     @command_handler_decorator
     def show_birthday(self, arguments: list[str]) -> str:
         name = arguments[0]
@@ -79,6 +109,7 @@ class CommandService(ICommandService):
 
         return f"Contact birthday: {contact.birthday}"
 
+    @command('upcoming-birthdays', 'Show upcoming birthdays for next week')
     @command_handler_decorator
     def birthdays(self) -> str:
         contacts_with_upcoming_birthdays = self.record_service.get_with_upcoming_birthdays()
@@ -88,27 +119,53 @@ class CommandService(ICommandService):
 
         return "\n".join([f"Contact: {contact.name} - {contact.birthday}" for contact in contacts_with_upcoming_birthdays])
 
+    @command('show-all-contacts', 'Show all contacts: show-all-contacts [page_size] [cursor] or without arguments to list the whole book', args=("page_size?", "cursor*"))
     @command_handler_decorator
-    def show_all(self) -> str:
-        contacts = self.record_service.get_all()
+    def show_all(self, arguments: list[str]) -> str | Iterator[str]:
+        if not arguments:
+            return self._stream_all()
+
+        page_size = int(arguments[0])
+        # The cursor is the rest of the line, a name from an older snapshot may contain spaces
+        cursor = " ".join(arguments[1:]) or None
+        contacts = self.record_service.get_page(page_size, cursor)
 
         if not contacts:
             return "No contacts found."
 
-        return "\n".join([f"{contact}" for contact in contacts])
+        lines = [f"{contact}" for contact in contacts]
+        last_name = contacts[-1].name.value
+        if self.record_service.get_page(1, last_name):
+            lines.append(f"Next page: show-all-contacts {page_size} {last_name}")
+
+        return "\n".join(lines)
 
+    @command_handler_decorator
+    def _stream_all(self) -> Iterator[str]:
+        is_empty = True
+        for contacts in self.record_service.iter_pages(self.STREAM_CHUNK_SIZE):
+            is_empty = False
+            yield "\n".join([f"{contact}" for contact in contacts])
+
+        if is_empty:
+            yield "No contacts found."
+
+    @command('hello', 'Greet the bot', requires_data=False)
     @command_handler_decorator
     def hello(self) -> str:
         return "How can I help you?"
 
+    @command('help', 'Show this help message', requires_data=False)
     @command_handler_decorator
     def help_command(self) -> str:
         if not self._help_text:
             sections = {
-                "Contacts": ["add-contact", "add-phone", "show-phone", "delete-contact", "show-all-contacts"],
+                "Contacts": ["add-contact", "add-phone", "show-phone", "find-by-phone", "search", "delete-contact", "show-all-contacts"],
                 "Birthdays": ["add-birthday", "show-birthday", "upcoming-birthdays"],
-                "Files": ["save", "load", "delete-file", "show-all-files"],
-                "System": ["hello", "help", "exit", "close"],
+                "Transactions": ["begin", "commit", "rollback"],
+                "History": ["undo", "redo"],
+                "Files": ["import", "export", "save", "load", "delete-file", "show-all-files", "gc-files", "autosave-status"],
+                "System": ["hello", "help", "exit"],
             }
             lines = []
             for title, cmds in sections.items():
@@ -116,51 +173,142 @@ class CommandService(ICommandService):
                 for cmd in cmds:
                     if cmd in self.commands:
                         c = self.commands[cmd]
-                        lines.append(f" - {c.name}: {c.description}")
+                        lines.append(f" - {', '.join((c.name, *c.aliases))}: {c.description}")
             self._help_text = "Available commands:\n" + "\n".join(lines)
         return self._help_text
 
+    @command('exit', 'Exit the program', aliases=("close",))
     @command_handler_decorator
     def exit_bot(self) -> None:
-        if self.file_service.is_save_able():
+        # Messages travel with the exception, the caller decides whether to print them
+        messages = []
+        if self.record_service.in_transaction():
+            count = self.record_service.rollback()
+            messages.append(f"Open transaction rolled back, {count} changes discarded.")
+
+        if self.autosave_on_exit and self.file_service.is_save_able():
             saved_file_name = self.file_service.save_with_name()
-            print(f"State saved to {saved_file_name}")
+            messages.append(f"State saved to {saved_file_name}")
 
-        raise ExitBotException("\nGood bye!")
+        raise ExitBotException("\n".join([*messages, "\nGood bye!"]))
 
+    @command('delete-contact', 'Delete a contact: delete-contact [name]', args=("name",))
     @command_handler_decorator
     def delete_contact(self, arguments: list[str]) -> str:
         name = arguments[0]
         self.record_service.delete(name)
         return f"Contact '{name}' deleted."
 
+    @command('import', 'Import contacts from a file: import [path] [format]. Formats: csv, jsonl, vcard, detected from the extension when omitted', args=("path", "format?"))
+    @command_handler_decorator
+    def import_contacts(self, arguments: list[str]) -> str:
+        self._ensure_no_transaction("import")
+        path = arguments[0]
+        format_name = arguments[1] if len(arguments) > 1 else None
+        return str(self.import_service.import_file(path, format_name))
+
+    @command('export', 'Export contacts to a file: export [path] [format] [prefix=NAME] [has-birthday]. Formats: csv, jsonl, vcard', args=("path", "options*"))
+    @command_handler_decorator
+    def export_contacts(self, arguments: list[str]) -> str:
+        path = arguments[0]
+        options = arguments[1:]
+        format_name = None
+        if options and options[0] != "has-birthday" and "=" not in options[0]:
+            format_name = options.pop(0)
+
+        name_prefix = None
+        has_birthday = False
+        for option in options:
+            if option == "has-birthday":
+                has_birthday = True
+            elif option.startswith("prefix="):
+                name_prefix = option.removeprefix("prefix=")
+            else:
+                raise InvalidException(f"Unknown export filter '{option}', use prefix=NAME or has-birthday")
+
+        return str(self.export_service.export_file(path, format_name, name_prefix, has_birthday))
+
+    @command('begin', 'Start a transaction: the next changes stay invisible and are not saved until commit')
+    @command_handler_decorator
+    def begin_transaction(self) -> str:
+        self.record_service.begin()
+        return "Transaction started. Use 'commit' to apply the changes or 'rollback' to discard them."
+
+    @command('commit', 'Apply all changes of the open transaction at once')
+    @command_handler_decorator
+    def commit_transaction(self) -> str:
+        count = self.record_service.commit()
+        return f"Transaction committed, {count} changes applied."
+
+    @command('rollback', 'Discard all changes of the open transaction')
+    @command_handler_decorator
+    def rollback_transaction(self) -> str:
+        count = self.record_service.rollback()
+        return f"Transaction rolled back, {count} changes discarded."
+
+    @command('undo', 'Undo the last change of the contacts: an add, edit, rename, delete, import batch or committed transaction')
+    @command_handler_decorator
+    def undo(self) -> str:
+        return f"Undone: {self.record_service.undo()}."
+
+    @command('redo', 'Redo the last undone change')
+    @command_handler_decorator
+    def redo(self) -> str:
+        return f"Redone: {self.record_service.redo()}."
+
+    @command('save', 'Save current state to file: save [name] [codec] or "save" without name for autosave. Codecs: none, gzip, bz2, lzma', args=("name?", "codec?"))
     @command_handler_decorator
     def save_state(self, arguments: list[str]) -> str:
         try :
             file_name = arguments[0]
         except IndexError:
             file_name = f"autosave"
+        codec = arguments[1] if len(arguments) > 1 else None
 
-        self.file_service.save_with_name(file_name)
+        self.file_service.save_with_name(file_name, codec)
         return f"State saved to file '{file_name}'."
 
+    @command('load', 'Load state from file: load [name]', args=("name",))
     @command_handler_decorator
     def load_state(self, arguments: list[str]) -> str:
+        # A commit would apply the open transaction on top of the loaded book
+        self._ensure_no_transaction("load")
         file_name = arguments[0]
         self.file_service.load_by_name(file_name)
+        # Not every storage reports a reset, the recorded diffs belong to the replaced book
+        self.record_service.clear_history()
 
         return f"State loaded from file '{file_name}'."
 
+    @command('delete-file', 'Delete the data file: delete-file [name]', args=("name",))
     @command_handler_decorator
     def delete_file(self, arguments: list[str]) -> str:
         file_name = arguments[0]
         self.file_service.delete_by_name(file_name)
         return f"File '{file_name}' deleted."
 
+    @command('show-all-files', 'Show all data files', requires_data=False)
     @command_handler_decorator
     def show_all_files(self) -> str:
-        file_names = self.file_service.get_file_list()
-        return "Available files:\n" + "\n".join(file_names)
+        snapshots = self.file_service.get_file_details()
+        return "Available files:\n" + "\n".join(f"{snapshot}" for snapshot in snapshots)
+
+    @command('gc-files', 'Delete old data files by the retention policy and show the reclaimed space')
+    @command_handler_decorator
+    def gc_files(self) -> str:
+        return str(self.file_service.collect_garbage())
+
+    @command('autosave-status', 'Show whether background autosave is on and when it last saved', requires_data=False)
+    @command_handler_decorator
+    def autosave_status(self) -> str:
+        return str(self.file_service.get_autosave_status())
 
     def get_command(self, command: str) -> Optional[Command]:
         return self.commands.get(command)
+
+    def get_command_names(self) -> list[str]:
+        return sorted(self.commands)
+
+    def _ensure_no_transaction(self, action: str) -> None:
+        if self.record_service.in_transaction():
+            raise InvalidException(f"Commit or roll back the open transaction before {action}")
@@ -34,4 +34,8 @@ class ICommandService(ABC):
 
     @abstractmethod
     def get_command(self, command_name: str) -> Command | None:
+        pass
+
+    @abstractmethod
+    def get_command_names(self) -> list[str]:
         pass
\ No newline at end of file
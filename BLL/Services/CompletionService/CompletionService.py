@@ -0,0 +1,18 @@
+from BLL.Services.CommandService.ICommandService import ICommandService
+from BLL.Services.CompletionService.ICompletionService import ICompletionService
+from BLL.Services.RecordService.IRecordService import IRecordService
+
+
+class CompletionService(ICompletionService):
+    def __init__(self, command_service: ICommandService, record_service: IRecordService, limit: int = 50) -> None:
+        self.command_service = command_service
+        self.record_service = record_service
+        self.limit = limit
+
+    def get_candidates(self, line_before: str, text: str) -> list[str]:
+        # The first word is a command, every following word is completed as a contact name.
+        if not line_before.strip():
+            lowered = text.lower()
+            return [name for name in self.command_service.get_command_names() if name.startswith(lowered)]
+
+        return self.record_service.get_names_by_prefix(text, self.limit)
@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+
+class ICompletionService(ABC):
+
+    @abstractmethod
+    def get_candidates(self, line_before: str, text: str) -> list[str]:
+        pass
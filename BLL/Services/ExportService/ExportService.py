@@ -0,0 +1,55 @@
+import os
+import time
+from typing import Iterable, Iterator
+
+from BLL.Services.ExportService.IExportService import IExportService
+from BLL.Services.RecordService.IRecordService import IRecordService
+from DAL.ContactFormats.ContactFormatRegistry import ContactFormatRegistry
+from DAL.Entities.ExportReport import ExportReport
+from DAL.Entities.Record import Record
+
+
+class ExportService(IExportService):
+    # Rows go straight from the storage snapshot to a buffered file, the output is never held in memory
+    WRITE_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, record_service: IRecordService) -> None:
+        self.record_service = record_service
+
+    def export_file(
+        self,
+        path: str,
+        format_name: str | None = None,
+        name_prefix: str | None = None,
+        has_birthday: bool = False,
+    ) -> ExportReport:
+        contact_format = ContactFormatRegistry.resolve(path, format_name)
+        started = time.perf_counter()
+        records = self._filter(self.record_service.iter_snapshot(), name_prefix, has_birthday)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Written next to the target and renamed at the end, a failed export leaves no half-written file
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8", newline="", buffering=self.WRITE_BUFFER_SIZE) as file:
+                exported = contact_format.write(file, records)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        os.replace(temp_path, path)
+
+        return ExportReport(path, exported, time.perf_counter() - started)
+
+    @staticmethod
+    def _filter(records: Iterable[Record], name_prefix: str | None, has_birthday: bool) -> Iterator[Record]:
+        prefix = name_prefix.casefold() if name_prefix else None
+        for record in records:
+            if prefix is not None and not record.name.value.casefold().startswith(prefix):
+                continue
+            if has_birthday and record.birthday is None:
+                continue
+            yield record
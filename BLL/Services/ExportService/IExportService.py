@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+from DAL.Entities.ExportReport import ExportReport
+
+
+class IExportService(ABC):
+
+    @abstractmethod
+    def export_file(
+        self,
+        path: str,
+        format_name: str | None = None,
+        name_prefix: str | None = None,
+        has_birthday: bool = False,
+    ) -> ExportReport:
+        pass
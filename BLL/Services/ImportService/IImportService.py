@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from DAL.Entities.ImportReport import ImportReport
+
+
+class IImportService(ABC):
+
+    @abstractmethod
+    def import_file(self, path: str, format_name: str | None = None) -> ImportReport:
+        pass
@@ -0,0 +1,138 @@
+import os
+import re
+import time
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
+from BLL.Services.ImportService.IImportService import IImportService
+from BLL.Services.RecordService.IRecordService import IRecordService
+from DAL.ContactFormats.ContactFormatRegistry import ContactFormatRegistry
+from DAL.Entities.ContactRow import ContactRow
+from DAL.Entities.ImportReport import ImportReport
+from DAL.Entities.Record import Record
+from DAL.Exceptions.InvalidException import InvalidException
+
+T = TypeVar("T")
+# A row as it is sent to a worker process: line, name, phones, birthday, read error
+RawRow = tuple[int, str | None, list[str], object, str | None]
+
+
+class ImportService(IImportService):
+    # Rows are read, validated and stored as a stream; only one batch is held at a time
+    BATCH_SIZE = 1000
+    # Rows per task for a worker process, large enough to outweigh pickling the task and its result
+    SHARD_SIZE = 5000
+    # Smaller files are imported before a process pool would even start
+    PARALLEL_MIN_BYTES = 1024 * 1024
+    # Spaces, dashes, dots and brackets other systems use to format phone numbers
+    PHONE_FORMATTING = re.compile(r"[\s\-().]")
+    # Commands split their arguments on whitespace, so "John Smith" is stored as John_Smith
+    NAME_SEPARATOR = "_"
+
+    def __init__(self, record_service: IRecordService, workers: int = 1) -> None:
+        if workers < 1:
+            raise InvalidException("Import needs at least one worker")
+        self.record_service = record_service
+        self.workers = workers
+
+    def import_file(self, path: str, format_name: str | None = None) -> ImportReport:
+        if not os.path.isfile(path):
+            raise InvalidException(f"File '{path}' does not exist")
+
+        contact_format = ContactFormatRegistry.resolve(path, format_name)
+        report = ImportReport(path)
+        started = time.perf_counter()
+
+        # utf-8-sig also reads files saved with a byte order mark, as spreadsheet programs do
+        with open(path, "r", encoding="utf-8-sig", newline="") as file:
+            rows = contact_format.read(file)
+            if self.workers > 1 and os.path.getsize(path) >= self.PARALLEL_MIN_BYTES:
+                self._import_in_workers(rows, report)
+            else:
+                self._store(self._validate_here(rows), report)
+
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def _import_in_workers(self, rows: Iterable[ContactRow], report: ImportReport) -> None:
+        # Only parallel imports start processes, the bot's startup does not pay for multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(self.workers) as executor:
+            try:
+                self._store(self._validate_in_workers(rows, executor), report)
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+
+    def _validate_here(self, rows: Iterable[ContactRow]) -> Iterator[tuple[int, Record | str]]:
+        for row in rows:
+            yield row.line, self._validate(row.name, row.phones, row.birthday, row.error)
+
+    def _validate_in_workers(self, rows: Iterable[ContactRow], executor) -> Iterator[tuple[int, Record | str]]:
+        # Workers validate whole shards, the results are merged in file order so the report
+        # and the duplicate checks match a single process import
+        raw_rows = ((row.line, row.name, row.phones, row.birthday, row.error) for row in rows)
+        pending = deque()
+        for shard in self._batches(raw_rows, self.SHARD_SIZE):
+            pending.append(executor.submit(self._validate_shard, shard))
+            # Two shards per worker keep every process busy without reading the whole file ahead
+            if len(pending) >= self.workers * 2:
+                yield from self._from_normalized(pending.popleft().result())
+        while pending:
+            yield from self._from_normalized(pending.popleft().result())
+
+    def _store(self, results: Iterable[tuple[int, Record | str]], report: ImportReport) -> None:
+        for batch in self._batches(self._to_records(results, report), self.BATCH_SIZE):
+            report.imported += self.record_service.save_many(batch)
+
+    def _to_records(self, results: Iterable[tuple[int, Record | str]], report: ImportReport) -> Iterator[Record]:
+        seen_names: set[str] = set()
+        for line, result in results:
+            if isinstance(result, str):
+                report.add_error(line, result)
+                continue
+
+            name = result.name.value
+            if name in seen_names or self.record_service.has(name):
+                report.add_error(line, f"Record '{name}' already exists")
+                continue
+
+            seen_names.add(name)
+            yield result
+
+    @classmethod
+    def _validate(cls, name: str | None, phones: list[str], birthday: object, error: str | None) -> Record | str:
+        if error:
+            return error
+        if not name or not name.split():
+            return "Name is required"
+
+        try:
+            return Record(cls.NAME_SEPARATOR.join(name.split()), *(cls.PHONE_FORMATTING.sub("", phone) for phone in phones), birthday=birthday)
+        except (InvalidException, ValueError, TypeError) as e:
+            return str(e)
+
+    @classmethod
+    def _validate_shard(cls, shard: list[RawRow]) -> list[tuple[int, tuple | str]]:
+        # Runs in a worker process; plain tuples go back, they pickle much faster than records
+        results = []
+        for line, *fields in shard:
+            result = cls._validate(*fields)
+            if isinstance(result, Record):
+                birthday = result.birthday.value if result.birthday else None
+                result = (result.name.value, tuple(phone.value for phone in result.phones), birthday)
+            results.append((line, result))
+        return results
+
+    @staticmethod
+    def _from_normalized(results: list[tuple[int, tuple | str]]) -> Iterator[tuple[int, Record | str]]:
+        for line, result in results:
+            yield line, result if isinstance(result, str) else Record.from_normalized(*result)
+
+    @staticmethod
+    def _batches(items: Iterable[T], size: int) -> Iterator[list[T]]:
+        iterator = iter(items)
+        while batch := list(islice(iterator, size)):
+            yield batch
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 class IInputService(ABC):
 
     @abstractmethod
-    def handle(self, user_input: str) -> str:
+    def handle(self, user_input: str) -> str | Iterator[str]:
         pass
\ No newline at end of file
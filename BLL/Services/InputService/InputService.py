@@ -1,14 +1,16 @@
-import inspect
+from typing import Iterator
 
 from BLL.Services.CommandService.ICommandService import ICommandService
 from BLL.Services.InputService.IInputService import IInputService
+from BLL.Services.StartupService.IStartupService import IStartupService
 from DAL.Exceptions.InvalidException import InvalidException
 
 class InputService(IInputService):
-    def __init__(self, command_service: ICommandService):
+    def __init__(self, command_service: ICommandService, startup_service: IStartupService | None = None):
         self.command_service = command_service
+        self.startup_service = startup_service
 
-    def handle(self, user_input: str) -> str:
+    def handle(self, user_input: str) -> str | Iterator[str]:
         command_name, arguments = self._parse_input(user_input)
 
         command = self.command_service.get_command(command_name)
@@ -16,12 +18,11 @@ class InputService(IInputService):
         if not command:
             raise InvalidException('Invalid command')
 
-        handler = command.handler
+        if self.startup_service is not None and command.requires_data:
+            self.startup_service.wait()
 
-        sig = inspect.signature(handler)
-        param_count = len(sig.parameters)
-
-        return handler() if param_count == 0 else handler(arguments)
+        # The argument schema was compiled when the command was registered, nothing is inspected per call
+        return command.execute(arguments)
 
     @staticmethod
     def _parse_input(user_input: str) -> tuple[str, list]:
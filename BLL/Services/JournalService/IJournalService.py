@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+class IJournalService(ABC):
+
+    @abstractmethod
+    def restore(self) -> int:
+        pass
+
+    @abstractmethod
+    def checkpoint(self) -> None:
+        pass
+
+    @abstractmethod
+    def compact(self, wait: bool = False) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
@@ -0,0 +1,111 @@
+import threading
+from datetime import date
+
+from BLL.Services.JournalService.IJournalService import IJournalService
+from DAL.Entities.Record import Record
+from DAL.Entities.StorageChange import StorageChange
+from DAL.FileManagers.IJournalFileManager import IJournalFileManager
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+
+
+class JournalService(IJournalService):
+    UPSERT = "u"
+    DELETE = "d"
+
+    def __init__(
+        self,
+        journal_manager: IJournalFileManager,
+        storage: AddressBookStorage,
+        compaction_threshold: int = 4 * 1024 * 1024,
+    ) -> None:
+        self.journal_manager = journal_manager
+        self.storage = storage
+        self.compaction_threshold = compaction_threshold
+        self.last_error: Exception | None = None
+        self._compaction_lock = threading.Lock()
+        self._compaction_thread: threading.Thread | None = None
+
+    def restore(self) -> int:
+        segment, records = self.journal_manager.load_checkpoint()
+        for entry in self.journal_manager.read_entries(segment):
+            self._apply(records, entry)
+
+        self.storage.import_state({name: self._hydrate(name, state) for name, state in records.items()})
+        self.storage.add_listener(self._on_change)
+        return len(records)
+
+    def checkpoint(self) -> None:
+        self._wait_for_compaction()
+        with self._compaction_lock:
+            sealed_segment = self.journal_manager.rotate()
+            records = {name: self._compact(record) for name, record in self.storage.export_state().items()}
+            self.journal_manager.save_checkpoint(sealed_segment, records)
+            self.journal_manager.delete_segments(sealed_segment)
+
+    def compact(self, wait: bool = False) -> None:
+        if self._compaction_thread is None or not self._compaction_thread.is_alive():
+            sealed_segment = self.journal_manager.rotate()
+            self._compaction_thread = threading.Thread(
+                target=self._fold, args=(sealed_segment,), name="journal-compaction", daemon=True
+            )
+            self._compaction_thread.start()
+
+        if wait:
+            self._wait_for_compaction()
+
+    def close(self) -> None:
+        self.storage.remove_listener(self._on_change)
+        self._wait_for_compaction()
+        self.journal_manager.close()
+
+    def _on_change(self, changes: list[StorageChange]) -> None:
+        entries = []
+        for change in changes:
+            if change.operation == StorageChange.RESET:
+                # The whole book was replaced (e.g. by 'load'), a checkpoint is cheaper than replaying it
+                self.checkpoint()
+                entries = []
+            elif change.operation == StorageChange.UPSERT:
+                entries.append([self.UPSERT, change.record_name, *self._compact(change.record)])
+            elif change.operation == StorageChange.DELETE:
+                entries.append([self.DELETE, change.record_name])
+
+        if not entries:
+            return
+
+        journal_size = self.journal_manager.append(entries)
+        if journal_size >= self.compaction_threshold:
+            self.compact()
+
+    def _fold(self, up_to_segment: int) -> None:
+        # Works only with files, so the live address book is never locked while compacting
+        try:
+            with self._compaction_lock:
+                segment, records = self.journal_manager.load_checkpoint()
+                for entry in self.journal_manager.read_entries(segment, up_to_segment):
+                    self._apply(records, entry)
+                self.journal_manager.save_checkpoint(up_to_segment, records)
+                self.journal_manager.delete_segments(up_to_segment)
+        except Exception as ex:
+            self.last_error = ex
+
+    def _wait_for_compaction(self) -> None:
+        if self._compaction_thread is not None:
+            self._compaction_thread.join()
+
+    @classmethod
+    def _apply(cls, records: dict[str, tuple], entry: list) -> None:
+        if entry[0] == cls.UPSERT:
+            records[entry[1]] = (tuple(entry[2]), entry[3])
+        elif entry[0] == cls.DELETE:
+            records.pop(entry[1], None)
+
+    @staticmethod
+    def _compact(record: Record) -> tuple:
+        birthday = record.birthday.value.isoformat() if record.birthday else None
+        return tuple(phone.value for phone in record.phones), birthday
+
+    @staticmethod
+    def _hydrate(name: str, state: tuple) -> Record:
+        phones, birthday = state
+        return Record(name, *phones, birthday=date.fromisoformat(birthday) if birthday else None)
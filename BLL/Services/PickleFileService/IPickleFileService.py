@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
+from DAL.Entities.AutosaveStatus import AutosaveStatus
+from DAL.Entities.RetentionReport import RetentionReport
+from DAL.Entities.SnapshotInfo import SnapshotInfo
+
 T = TypeVar("T")
 
 class IPickleFileService(ABC, Generic[T]):
 
     @abstractmethod
-    def save_with_name(self, name: str = 'autosave') -> str:
+    def save_with_name(self, name: str = 'autosave', codec: str | None = None) -> str:
         pass
 
     @abstractmethod
@@ -21,10 +25,30 @@ class IPickleFileService(ABC, Generic[T]):
     def get_file_list(self) -> list[str]:
         pass
 
+    @abstractmethod
+    def get_file_details(self) -> list[SnapshotInfo]:
+        pass
+
     @abstractmethod
     def get_latest_file_name(self) -> str:
         pass
 
+    @abstractmethod
+    def collect_garbage(self) -> RetentionReport:
+        pass
+
     @abstractmethod
     def is_save_able(self) -> bool:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def start_autosave(self, delay: float = 5.0, max_delay: float = 60.0, name: str = 'autosave') -> None:
+        pass
+
+    @abstractmethod
+    def stop_autosave(self) -> None:
+        pass
+
+    @abstractmethod
+    def get_autosave_status(self) -> AutosaveStatus:
+        pass
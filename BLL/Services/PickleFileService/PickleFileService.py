@@ -1,67 +1,171 @@
 import pickle
+import threading
+import time
 from datetime import datetime
 from typing import Generic, TypeVar
 from BLL.Services.PickleFileService.IPickleFileService import IPickleFileService
+from BLL.Services.RetentionService.IRetentionService import IRetentionService
+from DAL.Entities.AutosaveStatus import AutosaveStatus
+from DAL.Entities.RetentionReport import RetentionReport
+from DAL.Entities.SnapshotDelta import SnapshotDelta
+from DAL.Entities.SnapshotInfo import SnapshotInfo
+from DAL.Entities.StorageChange import StorageChange
 from DAL.Exceptions.InvalidException import InvalidException
 from DAL.FileManagers.IFileManager import IFileManager
+from DAL.Storages.IObservableStorage import IObservableStorage
 from DAL.Storages.ISerializableStorage import ISerializableStorage
 
 T = TypeVar("T")
 R = TypeVar("R")
 
 class PickleFileService(IPickleFileService[T], Generic[T, R]):
+    # Saves without a name are written as autosave_<timestamp>, only those are pruned after a save
+    AUTOSAVE_PREFIX = "autosave_"
 
-    def __init__(self, file_manager: IFileManager[T], storage: ISerializableStorage[R]) -> None:
+    def __init__(
+        self,
+        file_manager: IFileManager[T],
+        storage: ISerializableStorage[R],
+        max_delta_chain: int = 0,
+        retention_service: IRetentionService | None = None,
+    ) -> None:
         self.file_manager = file_manager
         self.storage = storage
-        self._last_loaded_bytes: bytes | None = None
+        # Old snapshots are pruned after every save when a retention policy is configured
+        self.retention_service = retention_service
+        self.last_retention_report: RetentionReport | None = None
+        # How many delta snapshots may follow a full one, 0 always writes full snapshots
+        self.max_delta_chain = max_delta_chain
+        self._saved_generation: int | None = None
         self._last_loaded_name: str | None = None
+        self._chain_depth = 0
+        # Saves and loads may come from the command loop and the autosave thread at the same time
+        self._file_lock = threading.Lock()
 
-    def save_with_name(self, name: str = 'autosave') -> str:
+        self.autosave_delay = 0.0
+        self.autosave_max_delay = 0.0
+        self._autosave_thread: threading.Thread | None = None
+        self._autosave_wakeup = threading.Event()
+        self._autosave_stop = threading.Event()
+        self._autosave_count = 0
+        self._autosave_last_name: str | None = None
+        self._autosave_last_at: datetime | None = None
+        self._autosave_last_error: str | None = None
+
+    def save_with_name(self, name: str = 'autosave', codec: str | None = None) -> str:
         self._validate_name(name)
-        data_to_save = self.storage.export_state()
 
-        if not data_to_save:
-            raise InvalidException("Data to save cannot be None or empty")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        extension = self.file_manager.FILE_EXTENSION
+        if not name.endswith(extension):
+            name = f"{name}_{timestamp}{extension}"
+        # A file saved by name has to load on its own, so only autosaves are written as deltas
+        allow_delta = name.startswith(self.AUTOSAVE_PREFIX)
 
-        try:
-            current_bytes = pickle.dumps(data_to_save)
-        except Exception as e:
-            raise InvalidException(f"Cannot serialize data: {e}")
+        with self._file_lock:
+            # The state is captured under the storage lock and written after releasing it,
+            # so a background save never sees half of a command and does not block the next one
+            with self.storage.get_lock():
+                data_to_save = self.storage.export_state()
 
-        if self._last_loaded_bytes == current_bytes:
-            # Немає змін — не перезаписуємо
-            return self._last_loaded_name or name
+                if not data_to_save:
+                    raise InvalidException("Data to save cannot be None or empty")
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        if not name.endswith(".pkl"):
-            name = f"{name}_{timestamp}.pkl"
+                generation = self.storage.get_generation()
+                if self._saved_generation == generation:
+                    # Немає змін — не перезаписуємо
+                    return self._last_loaded_name or name
 
-        self.file_manager.save(data_to_save, name)
-        self._last_loaded_bytes = current_bytes
-        self._last_loaded_name = name
-        return name
+                snapshot, depth = self._build_snapshot(data_to_save, allow_delta)
+                self.storage.mark_clean()
+
+            try:
+                name = self.file_manager.save(snapshot, name, codec)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                self._break_delta_chain()
+                raise InvalidException(f"Cannot serialize data: {e}")
+            except Exception:
+                self._break_delta_chain()
+                raise
+
+            self._saved_generation = generation
+            self._last_loaded_name = name
+            self._chain_depth = depth
+
+            if self.retention_service is not None:
+                try:
+                    self.last_retention_report = self._collect_garbage(self.AUTOSAVE_PREFIX)
+                except OSError:
+                    # The snapshot is already written, files that could not be removed wait for the next run
+                    pass
+            return name
 
     def load_by_name(self, name: str) -> None:
         self._validate_name(name)
 
-        if not self.file_manager.has_file_with_name(name):
-            raise InvalidException(f"File with name '{name}' does not exist")
+        with self._file_lock:
+            if not self.file_manager.has_file_with_name(name):
+                raise InvalidException(f"File with name '{name}' does not exist")
+
+            loaded_data = self.file_manager.load(name)
+            deltas = []
+            while isinstance(loaded_data, SnapshotDelta):
+                deltas.append(loaded_data)
+                if not self.file_manager.has_file_with_name(loaded_data.parent):
+                    raise InvalidException(f"File '{name}' depends on missing file '{loaded_data.parent}'")
+                loaded_data = self.file_manager.load(loaded_data.parent)
 
-        loaded_data = self.file_manager.load(name)
-        self.storage.import_state(loaded_data)
-        self._last_loaded_bytes = pickle.dumps(loaded_data)
-        self._last_loaded_name = name
+            for delta in reversed(deltas):
+                delta.apply_to(loaded_data)
+
+            with self.storage.get_lock():
+                self.storage.import_state(loaded_data)
+                self._saved_generation = self.storage.get_generation()
+                self.storage.mark_clean()
+            self._last_loaded_name = name
+            self._chain_depth = len(deltas)
 
     def is_save_able(self) -> bool:
-        data_to_save = self.storage.export_state()
-        if not data_to_save:
+        # Called on every autosave tick and on exit, so it never builds the book
+        if self.storage.get_generation() == self._saved_generation:
             return False
-        try:
-            current_bytes = pickle.dumps(data_to_save)
-            return current_bytes != self._last_loaded_bytes
-        except Exception:
-            return True
+        with self.storage.get_lock():
+            return not self.storage.is_empty()
+
+    def start_autosave(self, delay: float = 5.0, max_delay: float = 60.0, name: str = 'autosave') -> None:
+        if self._autosave_thread is not None:
+            return
+
+        self.autosave_delay = delay
+        self.autosave_max_delay = max(delay, max_delay)
+        self._autosave_stop.clear()
+        if isinstance(self.storage, IObservableStorage):
+            self.storage.add_listener(self._on_storage_change)
+
+        self._autosave_thread = threading.Thread(target=self._autosave_loop, args=(name,), name="autosave", daemon=True)
+        self._autosave_thread.start()
+
+    def stop_autosave(self) -> None:
+        if self._autosave_thread is None:
+            return
+
+        self._autosave_stop.set()
+        self._autosave_wakeup.set()
+        self._autosave_thread.join()
+        self._autosave_thread = None
+        if isinstance(self.storage, IObservableStorage):
+            self.storage.remove_listener(self._on_storage_change)
+
+    def get_autosave_status(self) -> AutosaveStatus:
+        return AutosaveStatus(
+            enabled=self._autosave_thread is not None,
+            delay=self.autosave_delay,
+            pending=self.storage.get_generation() != self._saved_generation,
+            save_count=self._autosave_count,
+            last_saved_name=self._autosave_last_name,
+            last_saved_at=self._autosave_last_at,
+            last_error=self._autosave_last_error,
+        )
 
     def get_file_list(self) -> list[str]:
         names = self.file_manager.get_all_names()
@@ -69,16 +173,135 @@ class PickleFileService(IPickleFileService[T], Generic[T, R]):
             raise InvalidException("No files available")
         return names
 
+    def get_file_details(self) -> list[SnapshotInfo]:
+        snapshots = self.file_manager.get_snapshots()
+        if not snapshots:
+            raise InvalidException("No files available")
+        return snapshots
+
     def get_latest_file_name(self) -> str:
-        names = self.get_file_list()
-        return sorted(names)[-1]
+        # The latest by creation time, names of manual saves do not sort by time.
+        # Files removed outside the bot drop out of the catalog when they are checked
+        name = self.file_manager.get_latest_name()
+        missing: set[str] = set()
+        while name is not None and name not in missing and not self.file_manager.has_file_with_name(name):
+            missing.add(name)
+            name = self.file_manager.get_latest_name()
+        if name is None or name in missing:
+            raise InvalidException("No files available")
+        return name
+
+    def collect_garbage(self) -> RetentionReport:
+        if self.retention_service is None:
+            raise InvalidException("Retention policy is not configured")
+
+        with self._file_lock:
+            self.last_retention_report = self._collect_garbage()
+            return self.last_retention_report
 
     def delete_by_name(self, name: str) -> None:
         self._validate_name(name)
         if not self.file_manager.has_file_with_name(name):
             raise InvalidException(f"File with name '{name}' does not exist")
+
+        dependents = self._get_dependents(name)
+        if dependents:
+            raise InvalidException(f"File '{name}' cannot be deleted, {', '.join(dependents)} depend on it")
         self.file_manager.delete(name)
 
+    def _collect_garbage(self, name_prefix: str | None = None) -> RetentionReport:
+        # The file the book was loaded from or last saved to is the parent of the next delta
+        protected = [self._last_loaded_name] if self._last_loaded_name else []
+        return self.retention_service.collect(protected=protected, name_prefix=name_prefix)
+
+    def _on_storage_change(self, changes: list[StorageChange]) -> None:
+        self._autosave_wakeup.set()
+
+    def _autosave_loop(self, name: str) -> None:
+        while not self._autosave_stop.is_set():
+            # Observable storages wake the thread on every change, others are polled
+            self._autosave_wakeup.wait(self.autosave_delay)
+            self._autosave_wakeup.clear()
+            if self._autosave_stop.is_set():
+                return
+
+            if self.storage.get_generation() == self._saved_generation:
+                continue
+
+            if self._wait_for_quiet_period():
+                self._autosave(name)
+
+    def _wait_for_quiet_period(self) -> bool:
+        # Debounce: save once no change arrived for autosave_delay seconds,
+        # or autosave_max_delay after the first change if changes keep coming
+        deadline = time.monotonic() + self.autosave_max_delay
+        generation = self.storage.get_generation()
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+
+            self._autosave_stop.wait(min(self.autosave_delay, remaining))
+            if self._autosave_stop.is_set():
+                return False
+
+            current_generation = self.storage.get_generation()
+            if current_generation == generation:
+                return True
+            generation = current_generation
+
+    def _autosave(self, name: str) -> None:
+        try:
+            if not self.is_save_able():
+                return
+            saved_name = self.save_with_name(name)
+        except Exception as e:
+            self._autosave_last_error = str(e)
+            return
+
+        self._autosave_count += 1
+        self._autosave_last_name = saved_name
+        self._autosave_last_at = datetime.now()
+        self._autosave_last_error = None
+
+    def _break_delta_chain(self) -> None:
+        # Dirty keys were cleared for the failed snapshot, so the next save has to be a full one
+        self._chain_depth = self.max_delta_chain
+
+    def _get_dependents(self, name: str) -> list[str]:
+        # Deltas written on top of the file, and files of unknown origin saved after it
+        snapshots = self.file_manager.get_snapshots()
+        target = next((info for info in snapshots if info.name in (name, name + self.file_manager.FILE_EXTENSION)), None)
+        if target is None:
+            return []
+        return [
+            info.name for info in snapshots
+            if info.parent == target.name or (not info.parent_known and info.created_at > target.created_at)
+        ]
+
+    def _build_snapshot(self, data_to_save: dict, allow_delta: bool = True) -> tuple[dict | SnapshotDelta, int]:
+        dirty_keys = self.storage.get_dirty_keys()
+
+        can_write_delta = (
+            allow_delta
+            and dirty_keys is not None
+            and self._last_loaded_name is not None
+            and self._chain_depth < self.max_delta_chain
+            and self.file_manager.has_file_with_name(self._last_loaded_name)
+        )
+        if not can_write_delta:
+            # Start a new chain from a full snapshot, copied so it can be written outside the storage lock
+            return dict(data_to_save), 0
+
+        delta = SnapshotDelta(
+            parent=self._last_loaded_name,
+            depth=self._chain_depth + 1,
+            upserts={key: data_to_save[key] for key in dirty_keys if key in data_to_save},
+            deletes=[key for key in dirty_keys if key not in data_to_save],
+        )
+        return delta, delta.depth
+
     @staticmethod
     def _validate_name(name: str) -> None:
         if not isinstance(name, str):
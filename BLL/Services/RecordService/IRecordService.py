@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from datetime import date
+from typing import Iterator
+
 from DAL.Entities.Record import Record
 
 class IRecordService(ABC):
@@ -6,6 +9,10 @@ class IRecordService(ABC):
     def save(self, new_record: Record) -> Record:
         pass
 
+    @abstractmethod
+    def save_many(self, new_records: list[Record]) -> int:
+        pass
+
     @abstractmethod
     def update(self, record_name: str, new_record: Record) -> Record:
         pass
@@ -14,10 +21,34 @@ class IRecordService(ABC):
     def get_by_name(self, record_name: str) -> Record | None:
         pass
 
+    @abstractmethod
+    def get_by_phone(self, phone: str) -> list[Record]:
+        pass
+
+    @abstractmethod
+    def search(self, prefix: str, limit: int | None = None) -> list[Record]:
+        pass
+
+    @abstractmethod
+    def get_names_by_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        pass
+
     @abstractmethod
     def get_all(self) -> list[Record] | None:
         pass
 
+    @abstractmethod
+    def get_page(self, page_size: int, after: str | None = None) -> list[Record]:
+        pass
+
+    @abstractmethod
+    def iter_pages(self, page_size: int) -> Iterator[list[Record]]:
+        pass
+
+    @abstractmethod
+    def iter_snapshot(self) -> Iterator[Record]:
+        pass
+
     @abstractmethod
     def rename(self, record_name: str, new_name: str) -> Record:
         pass
@@ -31,5 +62,33 @@ class IRecordService(ABC):
         pass
 
     @abstractmethod
-    def get_with_upcoming_birthdays(self) -> list[Record]:
+    def get_with_upcoming_birthdays(self, today: date | None = None) -> list[Record]:
+        pass
+
+    @abstractmethod
+    def begin(self) -> None:
+        pass
+
+    @abstractmethod
+    def commit(self) -> int:
+        pass
+
+    @abstractmethod
+    def rollback(self) -> int:
+        pass
+
+    @abstractmethod
+    def in_transaction(self) -> bool:
+        pass
+
+    @abstractmethod
+    def undo(self) -> str:
+        pass
+
+    @abstractmethod
+    def redo(self) -> str:
+        pass
+
+    @abstractmethod
+    def clear_history(self) -> None:
         pass
@@ -0,0 +1,51 @@
+from collections import deque
+
+from DAL.Entities.RecordDiff import RecordDiff
+
+# One user action: the diffs of one command, import batch or transaction, in the order they were made
+HistoryEntry = tuple[RecordDiff, ...]
+
+
+class RecordHistory:
+    # Bounded undo and redo stacks; the oldest actions are forgotten first, so memory stays flat
+    def __init__(self, limit: int = 100):
+        self._undo: deque[HistoryEntry] = deque(maxlen=limit)
+        self._redo: deque[HistoryEntry] = deque(maxlen=limit)
+        # Diffs of an open transaction, kept as one action when it is committed
+        self._group: list[RecordDiff] | None = None
+
+    def record(self, *diffs: RecordDiff) -> None:
+        if self._group is not None:
+            self._group.extend(diffs)
+            return
+
+        self._undo.append(diffs)
+        # A new action starts a new branch, the undone actions cannot be replayed on top of it
+        self._redo.clear()
+
+    def begin_group(self) -> None:
+        self._group = []
+
+    def end_group(self, keep: bool) -> None:
+        group, self._group = self._group, None
+        if keep and group:
+            self.record(*group)
+
+    def take_undo(self) -> HistoryEntry | None:
+        return self._undo.pop() if self._undo else None
+
+    def take_redo(self) -> HistoryEntry | None:
+        return self._redo.pop() if self._redo else None
+
+    def push_undo(self, entry: HistoryEntry) -> None:
+        self._undo.append(entry)
+
+    def push_redo(self, entry: HistoryEntry) -> None:
+        self._redo.append(entry)
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+
+    def __len__(self) -> int:
+        return len(self._undo)
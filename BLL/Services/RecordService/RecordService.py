@@ -1,17 +1,80 @@
-from datetime import date
+from datetime import date, timedelta
+from typing import Iterator
 
 from BLL.Helpers.DateHelper import DateHelper
 from BLL.Services.RecordService.IRecordService import IRecordService
+from BLL.Services.RecordService.RecordHistory import HistoryEntry, RecordHistory
+from DAL.Entities.Phone import Phone
 from DAL.Entities.Record import Record
+from DAL.Entities.RecordDiff import RecordDiff
+from DAL.Entities.StorageChange import StorageChange
 from DAL.Exceptions.AlreadyExistException import AlreadyExistException
 from DAL.Exceptions.InvalidException import InvalidException
 from DAL.Exceptions.NotFoundException import NotFoundException
-from DAL.Storages.IStorage import IStorage
+from DAL.Storages.IObservableStorage import IObservableStorage
+from DAL.Storages.IRecordStorage import IRecordStorage
+from DAL.Storages.Predicates.BirthdayWindowPredicate import BirthdayWindowPredicate
+from DAL.Storages.Predicates.PhonePrefixPredicate import PhonePrefixPredicate
+from DAL.Storages.TransactionOverlay import TransactionOverlay
 
 
 class RecordService(IRecordService):
-    def __init__(self, storage: IStorage[str, Record]):
+    HISTORY_LIMIT = 100
+
+    def __init__(self, storage: IRecordStorage, history_limit: int = HISTORY_LIMIT):
         self.storage = storage
+        self._transaction: TransactionOverlay | None = None
+        self.history = RecordHistory(history_limit)
+        if isinstance(storage, IObservableStorage):
+            storage.add_listener(self._on_storage_change)
+
+    def begin(self) -> None:
+        if self._transaction is not None:
+            raise InvalidException("A transaction is already open, commit or roll it back first")
+
+        # Until commit every read and write of this service goes through the overlay
+        self._transaction = TransactionOverlay(self.storage)
+        self.storage = self._transaction
+        self.history.begin_group()
+
+    def commit(self) -> int:
+        # The transaction stays open if applying fails, so it can still be rolled back
+        count = self._open_transaction().commit()
+        self._close_transaction()
+        self.history.end_group(keep=True)
+        return count
+
+    def rollback(self) -> int:
+        count = self._close_transaction().change_count
+        self.history.end_group(keep=False)
+        return count
+
+    def in_transaction(self) -> bool:
+        return self._transaction is not None
+
+    def undo(self) -> str:
+        entry = self._take_history_entry(self.history.take_undo, "undo")
+        try:
+            # The inverse of each diff, newest first
+            self._apply_history([diff.inverted() for diff in reversed(entry)])
+        except Exception:
+            self.history.push_undo(entry)
+            raise
+        self.history.push_redo(entry)
+        return self._describe(entry)
+
+    def redo(self) -> str:
+        entry = self._take_history_entry(self.history.take_redo, "redo")
+        try:
+            self._apply_history(list(entry))
+        except Exception:
+            self.history.push_redo(entry)
+            raise
+        self.history.push_undo(entry)
+        return self._describe(entry)
+
+    def clear_history(self) -> None:
+        self.history.clear()
 
     def save(self, new_record: Record) -> None:
         self._validate_record(new_record)
@@ -20,6 +83,20 @@ class RecordService(IRecordService):
             raise AlreadyExistException(f"Record '{new_record.name.value}' already exists")
 
         self.storage.add(new_record)
+        self.history.record(RecordDiff.added(new_record))
+
+    def save_many(self, new_records: list[Record]) -> int:
+        names = set()
+        for new_record in new_records:
+            self._validate_record(new_record)
+            if new_record.name.value in names or self.has(new_record.name.value):
+                raise AlreadyExistException(f"Record '{new_record.name.value}' already exists")
+            names.add(new_record.name.value)
+
+        count = self.storage.add_many(new_records)
+        # An import batch is undone as a whole
+        self.history.record(*(RecordDiff.added(new_record) for new_record in new_records))
+        return count
 
     def update(self, record_name: str, new_record: Record) -> Record:
         self._validate_record(new_record)
@@ -27,7 +104,10 @@ class RecordService(IRecordService):
         if not self.has(record_name):
             raise NotFoundException(f"Record '{record_name}' not found")
 
+        diff = RecordDiff.updated(record_name, self.storage.find(record_name), new_record)
         self.storage.update_item(record_name, new_record)
+        if diff is not None:
+            self.history.record(diff)
 
         return new_record
 
@@ -37,18 +117,63 @@ class RecordService(IRecordService):
 
         return self.storage.find(record_name)
 
+    def get_by_phone(self, phone: str) -> list[Record]:
+        if not phone or not isinstance(phone, str):
+            raise InvalidException("Phone must be a non-empty string")
+
+        # A complete number is looked up in the phone index, a shorter one, e.g. a country code, is a prefix
+        if Phone.PHONE_PATTERN.match(phone):
+            records = self.storage.find_by_phone(phone)
+        else:
+            records = sorted(self.storage.filter(PhonePrefixPredicate(phone)), key=lambda record: record.name.value)
+        if not records:
+            raise NotFoundException(f"No contacts with phone '{phone}'")
+
+        return records
+
+    def search(self, prefix: str, limit: int | None = None) -> list[Record]:
+        return [self.storage.find(name) for name in self.get_names_by_prefix(prefix, limit)]
+
+    def get_names_by_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        if not isinstance(prefix, str):
+            raise InvalidException("Prefix has invalid type")
+
+        if limit is not None and limit <= 0:
+            raise InvalidException("Limit must be a positive number")
+
+        return self.storage.find_names_by_prefix(prefix, limit)
+
     def get_all(self) -> list[Record]:
         return self.storage.all_values()
 
+    def get_page(self, page_size: int, after: str | None = None) -> list[Record]:
+        if page_size <= 0:
+            raise InvalidException("Page size must be a positive number")
+
+        return [self.storage.find(name) for name in self.storage.find_names_after(after, page_size)]
+
+    def iter_pages(self, page_size: int) -> Iterator[list[Record]]:
+        # Keyset pagination: each page starts after the last name of the previous one,
+        # so only one page is held in memory and changes between pages do not shift it.
+        after = None
+        while page := self.get_page(page_size, after):
+            yield page
+            after = page[-1].name.value
+
+    def iter_snapshot(self) -> Iterator[Record]:
+        return self.storage.iter_snapshot()
+
     def rename(self, record_name: str, new_name: str) -> Record:
         if not self.has(record_name):
             raise NotFoundException(f"Record '{record_name}' not found")
 
-        record = self.get_by_name(record_name)
-        record.name.value = new_name
+        record = self.get_by_name(record_name).update().set_name(new_name).build()
+        if record.name.value != record_name and self.has(record.name.value):
+            raise AlreadyExistException(f"Record '{record.name.value}' already exists")
 
-        self.delete(record_name)
-        self.save(record)
+        self.storage.delete(record_name)
+        self.storage.add(record)
+        self.history.record(RecordDiff.renamed(record_name, record.name.value))
 
         return record
 
@@ -56,36 +181,98 @@ class RecordService(IRecordService):
         if not self.has(record_name):
             raise NotFoundException(f"Record '{record_name}' not found")
 
+        self.history.record(RecordDiff.deleted(self.storage.find(record_name)))
         self.storage.delete(record_name)
 
     def has(self, record_name: str) -> bool:
         self._validate_record_name(record_name)
         return self.storage.has(record_name)
 
-    def get_with_upcoming_birthdays(self) -> list[Record]:
-        def is_birthday_within_week(record: Record) -> bool:
-            if not getattr(record, "birthday", None) or record.birthday is None:
-                return False
-
-            birthday_value = getattr(record.birthday, "value", None)
-            if not birthday_value:
-                return False
-
-            return DateHelper.is_date_within_next_week(birthday_value, today=date.today())
-
-        records = self.storage.filter(is_birthday_within_week)
+    def get_with_upcoming_birthdays(self, today: date | None = None) -> list[Record]:
+        today_date = today or date.today()
+        last_date = today_date + timedelta(days=7)
+
+        # Weekend birthdays are celebrated on Monday, so the two days before
+        # today can still fall into the window. Shifting never reorders days,
+        # so the dates that fall into it are consecutive.
+        birthday_dates = [
+            today_date + timedelta(days=offset)
+            for offset in range(-2, 8)
+            if today_date <= DateHelper.shift_from_weekend(today_date + timedelta(days=offset)) <= last_date
+        ]
+        order: dict[tuple[int, int], int] = {}
+        for birthday_date in birthday_dates:
+            for key in DateHelper.get_birthday_keys(birthday_date):
+                order.setdefault(key, len(order))
+
+        records = self.storage.filter(BirthdayWindowPredicate(birthday_dates[0], birthday_dates[-1]))
+        # Sorted by celebration date, then by name
+        return sorted(records, key=lambda record: (
+            order[(record.birthday.value.month, record.birthday.value.day)],
+            record.name.value,
+        ))
+
+    def _take_history_entry(self, take, action: str) -> HistoryEntry:
+        if self._transaction is not None:
+            raise InvalidException(f"Commit or roll back the open transaction before {action}")
+
+        entry = take()
+        if entry is None:
+            raise InvalidException(f"Nothing to {action}")
+        return entry
+
+    def _apply_history(self, diffs: list[RecordDiff]) -> None:
+        # Replayed on an overlay first: a diff that no longer fits the book changes nothing,
+        # the rest become visible at once with one notification
+        overlay = TransactionOverlay(self.storage)
+        for diff in diffs:
+            self._apply_diff(overlay, diff)
+        overlay.commit()
 
-        def next_birthday_date(record: Record):
-            bday = record.birthday.value
-            today_date = date.today()
-            adjusted = DateHelper.set_date_with_feb_edge_case(bday, today_date.year)
-
-            if adjusted < today_date:
-                adjusted = DateHelper.set_date_with_feb_edge_case(bday, today_date.year + 1)
-
-            return adjusted
+    @staticmethod
+    def _apply_diff(storage: IRecordStorage, diff: RecordDiff) -> None:
+        if diff.operation == RecordDiff.ADD:
+            if storage.has(diff.record_name):
+                raise AlreadyExistException(f"Record '{diff.record_name}' already exists")
+            storage.add(diff.after)
+            return
+
+        record = storage.find(diff.record_name)
+        if record is None:
+            raise NotFoundException(f"Record '{diff.record_name}' not found")
+
+        if diff.operation == RecordDiff.DELETE:
+            storage.delete(diff.record_name)
+        elif diff.operation == RecordDiff.RENAME:
+            if storage.has(diff.after):
+                raise AlreadyExistException(f"Record '{diff.after}' already exists")
+            storage.delete(diff.record_name)
+            storage.add(record.update().set_name(diff.after).build())
+        else:
+            record = record.copy()
+            for slot, value in diff.after:
+                setattr(record, slot, value)
+            storage.update_item(diff.record_name, record)
 
-        return sorted(records, key=next_birthday_date)
+    @staticmethod
+    def _describe(entry: HistoryEntry) -> str:
+        return str(entry[0]) if len(entry) == 1 else f"{len(entry)} changes"
+
+    def _on_storage_change(self, changes: list[StorageChange]) -> None:
+        # A loaded snapshot replaces the book, the recorded diffs no longer apply to it
+        if any(change.operation == StorageChange.RESET for change in changes):
+            self.history.clear()
+
+    def _open_transaction(self) -> TransactionOverlay:
+        if self._transaction is None:
+            raise InvalidException("There is no open transaction, start one with 'begin'")
+        return self._transaction
+
+    def _close_transaction(self) -> TransactionOverlay:
+        transaction = self._open_transaction()
+        self._transaction = None
+        self.storage = transaction.storage
+        return transaction
 
     @staticmethod
     def _validate_record_name(record_name: str) -> None:
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from datetime import datetime
+
+from DAL.Entities.RetentionReport import RetentionReport
+from DAL.Entities.SnapshotInfo import SnapshotInfo
+
+
+class IRetentionService(ABC):
+
+    @abstractmethod
+    def plan(self, snapshots: list[SnapshotInfo], now: datetime | None = None, protected: Iterable[str] = ()) -> list[SnapshotInfo]:
+        pass
+
+    @abstractmethod
+    def collect(self, now: datetime | None = None, protected: Iterable[str] = (), name_prefix: str | None = None) -> RetentionReport:
+        pass
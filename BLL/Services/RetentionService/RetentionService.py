@@ -0,0 +1,105 @@
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+from BLL.Services.RetentionService.IRetentionService import IRetentionService
+from DAL.Entities.RetentionPolicy import RetentionPolicy
+from DAL.Entities.RetentionReport import RetentionReport
+from DAL.Entities.SnapshotInfo import SnapshotInfo
+from DAL.FileManagers.IFileManager import IFileManager
+
+
+class RetentionService(IRetentionService):
+
+    def __init__(self, file_manager: IFileManager, policy: RetentionPolicy | None = None) -> None:
+        self.file_manager = file_manager
+        self.policy = policy or RetentionPolicy()
+
+    def plan(self, snapshots: list[SnapshotInfo], now: datetime | None = None, protected: Iterable[str] = ()) -> list[SnapshotInfo]:
+        if not snapshots:
+            return []
+
+        now = now or datetime.now()
+        by_name = {snapshot.name: snapshot for snapshot in snapshots}
+        ordered = sorted(snapshots, key=lambda snapshot: snapshot.created_at)
+
+        # The newest file and the ones the caller still uses survive every rule, the size limit included
+        pinned = self._with_parents({ordered[-1].name, *(name for name in protected if name in by_name)}, by_name)
+
+        keep = pinned | {snapshot.name for snapshot in ordered[-self.policy.keep_last:]}
+        if self.policy.hourly_for_hours:
+            keep |= self._checkpoints(ordered, now - timedelta(hours=self.policy.hourly_for_hours), "%Y%m%d%H")
+        if self.policy.daily_for_days:
+            keep |= self._checkpoints(ordered, now - timedelta(days=self.policy.daily_for_days), "%Y%m%d")
+        # A delta is useless without the files it was written on top of
+        keep = self._with_parents(keep, by_name)
+
+        if self.policy.max_total_bytes is not None:
+            self._fit_size(keep, pinned, ordered)
+
+        return [snapshot for snapshot in ordered if snapshot.name not in keep]
+
+    def collect(self, now: datetime | None = None, protected: Iterable[str] = (), name_prefix: str | None = None) -> RetentionReport:
+        snapshots = self.file_manager.get_snapshots()
+        candidates = snapshots
+        if name_prefix is not None:
+            # Only files named with the prefix are pruned; the others stay with every file they are built on
+            by_name = {snapshot.name: snapshot for snapshot in snapshots}
+            kept = self._with_parents({name for name in by_name if not name.startswith(name_prefix)}, by_name)
+            candidates = [snapshot for snapshot in snapshots if snapshot.name not in kept]
+        doomed = self.plan(candidates, now, protected)
+
+        deleted = []
+        reclaimed_bytes = 0
+        # Newest first, so an interrupted run never leaves a delta without its parent
+        for snapshot in reversed(doomed):
+            self.file_manager.delete(snapshot.name)
+            deleted.append(snapshot.name)
+            reclaimed_bytes += snapshot.size
+
+        return RetentionReport(deleted, reclaimed_bytes, len(snapshots) - len(deleted))
+
+    @staticmethod
+    def _checkpoints(ordered: list[SnapshotInfo], since: datetime, bucket_format: str) -> set[str]:
+        # The newest file of every hour (or day) since the given moment
+        buckets: dict[str, str] = {}
+        for snapshot in reversed(ordered):
+            if snapshot.created_at < since:
+                break
+            buckets.setdefault(snapshot.created_at.strftime(bucket_format), snapshot.name)
+        return set(buckets.values())
+
+    @staticmethod
+    def _with_parents(names: set[str], by_name: dict[str, SnapshotInfo]) -> set[str]:
+        result = set()
+        for name in names:
+            while name in by_name and name not in result:
+                result.add(name)
+                name = by_name[name].parent
+
+        # A file catalogued without its parent may be a delta of any older file
+        unknown = [by_name[name].created_at for name in result if not by_name[name].parent_known]
+        if unknown:
+            newest = max(unknown)
+            result |= {name for name, snapshot in by_name.items() if snapshot.created_at <= newest}
+        return result
+
+    def _fit_size(self, keep: set[str], pinned: set[str], ordered: list[SnapshotInfo]) -> None:
+        sizes = {snapshot.name: snapshot.size for snapshot in ordered}
+        total = sum(sizes[name] for name in keep)
+
+        for snapshot in ordered:
+            if total <= self.policy.max_total_bytes:
+                return
+            if snapshot.name not in keep or snapshot.name in pinned:
+                continue
+
+            # Dropping a file drops the deltas built on it; none of them is pinned,
+            # because pinned files always come with their parents
+            dropped = {snapshot.name}
+            for later in ordered:
+                depends = later.parent in dropped or (not later.parent_known and later.created_at > snapshot.created_at)
+                if depends and later.name in keep:
+                    dropped.add(later.name)
+
+            keep -= dropped
+            total -= sum(sizes[name] for name in dropped)
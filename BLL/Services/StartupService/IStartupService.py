@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class IStartupService(ABC):
+
+    @abstractmethod
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    def wait(self, timeout: float | None = None) -> bool:
+        pass
+
+    @abstractmethod
+    def is_ready(self) -> bool:
+        pass
+
+    @abstractmethod
+    def take_message(self) -> str | None:
+        pass
@@ -0,0 +1,47 @@
+import threading
+from typing import Callable
+
+from BLL.Services.StartupService.IStartupService import IStartupService
+
+
+class StartupService(IStartupService):
+    # Runs the startup load on a worker thread so the prompt shows at once;
+    # commands that need the address book wait for it through wait()
+
+    def __init__(self, load: Callable[[], str]) -> None:
+        self.load = load
+        self.error: Exception | None = None
+        self._ready = threading.Event()
+        self._message: str | None = None
+        self._message_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._run, name="startup-load", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def take_message(self) -> str | None:
+        # The outcome of the load is shown once, by whoever asks first after it finished
+        with self._message_lock:
+            message, self._message = self._message, None
+            return message
+
+    def _run(self) -> None:
+        try:
+            message = self.load()
+        except Exception as e:
+            self.error = e
+            message = f"⚠️ Could not load previous state: {e}"
+
+        with self._message_lock:
+            self._message = message
+        self._ready.set()
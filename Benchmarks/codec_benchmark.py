@@ -0,0 +1,72 @@
+"""Snapshot size, save and load latency per compression codec.
+
+Run from the project root:
+    python -m Benchmarks.codec_benchmark --sizes 1000 10000 100000
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date
+
+from DAL.Entities.Record import Record
+from DAL.FileManagers.PickleFileManager.PickleFileManager import PickleFileManager
+
+
+def build_book(size: int) -> dict[str, Record]:
+    return {
+        f"Contact{index}": Record(
+            f"Contact{index}",
+            f"+38099{index:07d}",
+            f"+38066{index:07d}",
+            birthday=date(1990, index % 12 + 1, index % 28 + 1),
+        )
+        for index in range(size)
+    }
+
+
+def best_of(repeat: int, action) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def measure(manager: PickleFileManager, book: dict, codec: str, repeat: int) -> tuple[int, float, float]:
+    name = manager.save(book, f"{codec}.pkl", codec)
+    size = os.path.getsize(os.path.join(manager.base_dir, name))
+
+    def save():
+        manager.delete(name)
+        manager.save(book, name, codec)
+
+    save_time = best_of(repeat, save)
+    load_time = best_of(repeat, lambda: manager.load(name))
+    return size, save_time, load_time
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs per measurement")
+    arguments = parser.parse_args(argv)
+
+    print(f"{'contacts':>10} | {'codec':>5} | {'size, KB':>10} | {'ratio':>6} | {'save, ms':>9} | {'load, ms':>9}")
+    with tempfile.TemporaryDirectory() as base_dir:
+        manager = PickleFileManager(base_dir)
+        for size in arguments.sizes:
+            book = build_book(size)
+            plain_size = None
+            for codec in manager.CODECS:
+                file_size, save_time, load_time = measure(manager, book, codec, arguments.repeat)
+                plain_size = plain_size or file_size
+                print(
+                    f"{size:>10} | {codec:>5} | {file_size / 1024:>10.1f} | {plain_size / file_size:>6.2f} | "
+                    f"{save_time * 1000:>9.1f} | {load_time * 1000:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
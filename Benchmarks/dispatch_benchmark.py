@@ -0,0 +1,52 @@
+"""Commands per second through InputService.handle, against per-call signature inspection.
+
+Run from the project root:
+    python -m Benchmarks.dispatch_benchmark --calls 100000
+"""
+import argparse
+import inspect
+import time
+
+from BLL.Services.CommandService.CommandService import CommandService
+from BLL.Services.InputService.InputService import InputService
+from BLL.Services.RecordService.RecordService import RecordService
+from DAL.Entities.Record import Record
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+
+COMMANDS = ["hello", "show-phone John", "show-birthday John", "search Jo 5", "find-by-phone +380991112233"]
+
+
+class InspectingInputService(InputService):
+    # Dispatch as it was before the command registry, for comparison
+    def handle(self, user_input: str):
+        command_name, arguments = self._parse_input(user_input)
+        handler = self.command_service.get_command(command_name).handler
+        return handler() if len(inspect.signature(handler).parameters) == 0 else handler(arguments)
+
+
+def commands_per_second(input_service: InputService, calls: int) -> float:
+    lines = [COMMANDS[index % len(COMMANDS)] for index in range(calls)]
+    handle = input_service.handle
+    started = time.perf_counter()
+    for line in lines:
+        handle(line)
+    return calls / (time.perf_counter() - started)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100_000)
+    arguments = parser.parse_args(argv)
+
+    storage = AddressBookStorage()
+    storage.add(Record("John", "+380991112233", birthday="05.11.2000"))
+    command_service = CommandService(RecordService(storage), file_service=None)
+
+    print(f"{'dispatch':>10} | {'commands/s':>12}")
+    for label, service_class in (("inspect", InspectingInputService), ("registry", InputService)):
+        rate = commands_per_second(service_class(command_service), arguments.calls)
+        print(f"{label:>10} | {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Bytes per contact for the address book entities.
+
+Run from the project root:
+    python -m Benchmarks.memory_benchmark --sizes 10000 100000 1000000
+"""
+import argparse
+import gc
+import tracemalloc
+from datetime import date
+
+from DAL.Entities.Record import Record
+
+
+class LegacyField:
+    # The entity layout before __slots__: a __dict__ per object and a list of phones
+    def __init__(self, value):
+        self.value = value
+
+
+class LegacyRecord:
+    def __init__(self, name: str, *phone_numbers: str, birthday: date | None = None):
+        self.name = LegacyField(name)
+        self.phones = [LegacyField(phone) for phone in phone_numbers]
+        self.birthday = LegacyField(birthday) if birthday else None
+
+
+def build_book(record_type: type, size: int) -> dict:
+    return {
+        f"Contact{index}": record_type(
+            f"Contact{index}",
+            f"+38099{index:07d}",
+            f"+38066{index:07d}",
+            birthday=date(1990, index % 12 + 1, index % 28 + 1),
+        )
+        for index in range(size)
+    }
+
+
+def measure(record_type: type, size: int) -> float:
+    # Names, phones and dict keys are the same for both layouts,
+    # so the difference between them is the entity overhead
+    gc.collect()
+    tracemalloc.start()
+    book = build_book(record_type, size)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del book
+    return current / size
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    arguments = parser.parse_args(argv)
+
+    print(f"{'contacts':>10} | {'before, B/contact':>18} | {'after, B/contact':>17} | {'saved':>6}")
+    for size in arguments.sizes:
+        before = measure(LegacyRecord, size)
+        after = measure(Record, size)
+        print(f"{size:>10} | {before:>18.1f} | {after:>17.1f} | {1 - after / before:>6.1%}")
+
+
+if __name__ == "__main__":
+    main()
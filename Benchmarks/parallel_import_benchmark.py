@@ -0,0 +1,56 @@
+"""Import throughput of a large CSV file with 1, 2, 4 and 8 validation worker processes.
+
+Run from the project root:
+    python -m Benchmarks.parallel_import_benchmark --rows 200000 --workers 1 2 4 8
+"""
+import argparse
+import os
+import tempfile
+
+from Benchmarks.codec_benchmark import best_of
+from BLL.Services.ImportService.ImportService import ImportService
+from BLL.Services.RecordService.RecordService import RecordService
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+
+
+def write_contacts(path: str, rows: int) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        file.write("name,phones,birthday\n")
+        for index in range(rows):
+            file.write(
+                f"Contact{index},+38099{index:07d};+38 (066) {index:07d},"
+                f"{index % 28 + 1:02d}.{index % 12 + 1:02d}.1990\n"
+            )
+
+
+def measure(path: str, workers: int, repeat: int) -> float:
+    def run():
+        service = ImportService(RecordService(AddressBookStorage()), workers=workers)
+        report = service.import_file(path)
+        assert report.failed == 0, report
+
+    return best_of(repeat, run)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs per measurement")
+    arguments = parser.parse_args(argv)
+
+    print(f"{arguments.rows} rows, {os.cpu_count()} CPUs available")
+    print(f"{'workers':>7} | {'time, s':>8} | {'rows/s':>10} | {'speedup':>7}")
+    with tempfile.TemporaryDirectory() as base_dir:
+        path = os.path.join(base_dir, "contacts.csv")
+        write_contacts(path, arguments.rows)
+
+        baseline = None
+        for workers in arguments.workers:
+            elapsed = measure(path, workers, arguments.repeat)
+            baseline = baseline or elapsed
+            print(f"{workers:>7} | {elapsed:>8.2f} | {arguments.rows / elapsed:>10,.0f} | {baseline / elapsed:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Snapshot size, save and load latency of the pickle and binary formats.
+
+Run from the project root:
+    python -m Benchmarks.snapshot_format_benchmark --sizes 1000 10000 100000
+"""
+import argparse
+import os
+import tempfile
+
+from Benchmarks.codec_benchmark import best_of, build_book
+from DAL.FileManagers.BinaryFileManager.BinaryFileManager import BinaryFileManager
+from DAL.FileManagers.PickleFileManager.PickleFileManager import PickleFileManager
+
+
+def measure(manager, book: dict, repeat: int) -> tuple[int, float, float]:
+    name = manager.save(book, "benchmark")
+    size = os.path.getsize(os.path.join(manager.base_dir, name))
+
+    def save():
+        manager.delete(name)
+        manager.save(book, name)
+
+    save_time = best_of(repeat, save)
+    load_time = best_of(repeat, lambda: manager.load(name))
+    manager.delete(name)
+    return size, save_time, load_time
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs per measurement")
+    arguments = parser.parse_args(argv)
+
+    print(f"{'contacts':>10} | {'format':>6} | {'size, KB':>10} | {'save, ms':>9} | {'load, ms':>9}")
+    with tempfile.TemporaryDirectory() as base_dir:
+        managers = {"pickle": PickleFileManager(base_dir), "binary": BinaryFileManager(base_dir)}
+        for size in arguments.sizes:
+            # The book stays alive while loading, as it does in the bot
+            book = build_book(size)
+            for format_name, manager in managers.items():
+                file_size, save_time, load_time = measure(manager, book, arguments.repeat)
+                print(
+                    f"{size:>10} | {format_name:>6} | {file_size / 1024:>10.1f} | "
+                    f"{save_time * 1000:>9.1f} | {load_time * 1000:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Import costs of the bot modules and wall-clock time to the first prompt.
+
+Run from the project root:
+    python -m Benchmarks.startup_benchmark --repeat 5 --top 15
+    python -m Benchmarks.startup_benchmark --budget 1.5   # exit code 1 when a storage is slower
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROMPT = b"Enter a command: "
+# Seconds, about 0.1 s on a laptop; the default of --budget
+TIME_TO_PROMPT_BUDGET = 1.5
+
+
+def import_costs(top: int) -> tuple[int, list[tuple[int, int, str]]]:
+    # Same numbers as `python -X importtime`: self and cumulative microseconds per module
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line.removeprefix("import time:").split("|")
+        # One space separates the column, two more for every level of nesting
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((int(self_time), int(cumulative), depth, name.strip()))
+
+    total = sum(cumulative for _, cumulative, depth, _ in rows if depth == 0)
+    # Modules main imports directly, nested imports are part of their cumulative time
+    direct = [(self_time, cumulative, name) for self_time, cumulative, depth, name in rows if depth == 1]
+    return total, sorted(direct, key=lambda row: row[1], reverse=True)[:top]
+
+
+def time_to_prompt(arguments: list[str] | None = None) -> float:
+    environment = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    # An empty data folder, so the time does not depend on the snapshots lying around
+    with tempfile.TemporaryDirectory() as work_dir:
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, os.path.join(PROJECT_ROOT, "main.py"), "--interactive", "--autosave-delay", "0", *(arguments or [])],
+            cwd=work_dir, env=environment, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+        output = b""
+        try:
+            while not output.endswith(PROMPT):
+                chunk = process.stdout.read1(1024)
+                if not chunk:
+                    raise RuntimeError(f"The bot exited before showing a prompt: {output.decode(errors='replace')}")
+                output += chunk
+            elapsed = time.perf_counter() - started
+            process.communicate(b"exit\n", timeout=10)
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+        return elapsed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Best of N launches for the time to prompt")
+    parser.add_argument("--top", type=int, default=15, help="How many of the most expensive imports to show")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        nargs="?",
+        const=TIME_TO_PROMPT_BUDGET,
+        help=f"Fail when the time to prompt exceeds this many seconds (default {TIME_TO_PROMPT_BUDGET})",
+    )
+    arguments = parser.parse_args(argv)
+
+    total, rows = import_costs(arguments.top)
+    print(f"Interpreter startup and importing main: {total / 1000:.1f} ms")
+    print(f"{'self, ms':>9} | {'cumulative, ms':>14} | module")
+    for self_time, cumulative, name in rows:
+        print(f"{self_time / 1000:>9.1f} | {cumulative / 1000:>14.1f} | {name}")
+
+    print()
+    over_budget = []
+    for storage in ["memory", "columnar", "sqlite"]:
+        best = min(time_to_prompt(["--storage", storage]) for _ in range(arguments.repeat))
+        print(f"Time to prompt, --storage {storage}: {best * 1000:.0f} ms")
+        if arguments.budget is not None and best > arguments.budget:
+            over_budget.append(storage)
+
+    if over_budget:
+        print(f"Over the {arguments.budget} s budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+import os
+
+from DAL.ContactFormats.CsvContactFormat import CsvContactFormat
+from DAL.ContactFormats.IContactFormat import IContactFormat
+from DAL.ContactFormats.JsonLinesContactFormat import JsonLinesContactFormat
+from DAL.ContactFormats.VCardContactFormat import VCardContactFormat
+from DAL.Exceptions.InvalidException import InvalidException
+
+
+class ContactFormatRegistry:
+    FORMATS: dict[str, IContactFormat] = {
+        contact_format.NAME: contact_format
+        for contact_format in (CsvContactFormat(), JsonLinesContactFormat(), VCardContactFormat())
+    }
+
+    @classmethod
+    def resolve(cls, path: str, format_name: str | None = None) -> IContactFormat:
+        if format_name is not None:
+            contact_format = cls.FORMATS.get(format_name.lower())
+            if contact_format is None:
+                raise InvalidException(f"Unknown format '{format_name}'. Available formats: {', '.join(cls.FORMATS)}")
+            return contact_format
+
+        extension = os.path.splitext(path)[1].lower()
+        for contact_format in cls.FORMATS.values():
+            if extension in contact_format.EXTENSIONS:
+                return contact_format
+        raise InvalidException(
+            f"Cannot detect the format of '{path}', pass one of: {', '.join(cls.FORMATS)}"
+        )
@@ -0,0 +1,46 @@
+import csv
+from typing import Iterable, Iterator, TextIO
+
+from DAL.ContactFormats.IContactFormat import IContactFormat
+from DAL.Entities.ContactRow import ContactRow
+from DAL.Entities.Record import Record
+from DAL.Exceptions.InvalidException import InvalidException
+
+
+class CsvContactFormat(IContactFormat):
+    # name,phones,birthday with phones separated by ';' and the birthday as dd.mm.yyyy
+    NAME = "csv"
+    EXTENSIONS = (".csv",)
+    PHONE_SEPARATOR = ";"
+
+    def read(self, file: TextIO) -> Iterator[ContactRow]:
+        reader = csv.DictReader(file)
+        columns = {column.strip().lower(): column for column in reader.fieldnames or []}
+        if "name" not in columns:
+            raise InvalidException("CSV file must have a header with a 'name' column")
+
+        name_column = columns["name"]
+        phones_column = columns.get("phones") or columns.get("phone")
+        birthday_column = columns.get("birthday")
+
+        for row in reader:
+            phones = (row.get(phones_column) or "") if phones_column else ""
+            yield ContactRow(
+                line=reader.line_num,
+                name=(row.get(name_column) or "").strip(),
+                phones=[phone.strip() for phone in phones.split(self.PHONE_SEPARATOR) if phone.strip()],
+                birthday=((row.get(birthday_column) or "").strip() or None) if birthday_column else None,
+            )
+
+    def write(self, file: TextIO, records: Iterable[Record]) -> int:
+        writer = csv.writer(file)
+        writer.writerow(["name", "phones", "birthday"])
+        count = 0
+        for record in records:
+            writer.writerow([
+                record.name.value,
+                self.PHONE_SEPARATOR.join(phone.value for phone in record.phones),
+                str(record.birthday) if record.birthday else "",
+            ])
+            count += 1
+        return count
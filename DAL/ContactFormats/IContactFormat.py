@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, TextIO
+
+from DAL.Entities.ContactRow import ContactRow
+from DAL.Entities.Record import Record
+
+
+class IContactFormat(ABC):
+    NAME: str
+    EXTENSIONS: tuple[str, ...]
+
+    @abstractmethod
+    def read(self, file: TextIO) -> Iterator[ContactRow]:
+        pass
+
+    @abstractmethod
+    def write(self, file: TextIO, records: Iterable[Record]) -> int:
+        pass
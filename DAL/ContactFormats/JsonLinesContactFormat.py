@@ -0,0 +1,47 @@
+import json
+from typing import Iterable, Iterator, TextIO
+
+from DAL.ContactFormats.IContactFormat import IContactFormat
+from DAL.Entities.ContactRow import ContactRow
+from DAL.Entities.Record import Record
+
+
+class JsonLinesContactFormat(IContactFormat):
+    # One object per line: {"name": ..., "phones": [...], "birthday": "dd.mm.yyyy"}
+    NAME = "jsonl"
+    EXTENSIONS = (".jsonl", ".ndjson")
+
+    def read(self, file: TextIO) -> Iterator[ContactRow]:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield ContactRow(line_number, error=f"Invalid JSON: {e.msg}")
+                continue
+
+            if not isinstance(data, dict):
+                yield ContactRow(line_number, error="Expected a JSON object")
+                continue
+
+            phones = data.get("phones", [data["phone"]] if "phone" in data else [])
+            if not isinstance(phones, list):
+                phones = [phones]
+            yield ContactRow(
+                line=line_number,
+                name=str(data.get("name") or "").strip(),
+                phones=[str(phone).strip() for phone in phones],
+                birthday=data.get("birthday") or None,
+            )
+
+    def write(self, file: TextIO, records: Iterable[Record]) -> int:
+        count = 0
+        for record in records:
+            data = {"name": record.name.value, "phones": [phone.value for phone in record.phones]}
+            if record.birthday:
+                data["birthday"] = str(record.birthday)
+            file.write(json.dumps(data, ensure_ascii=False) + "\n")
+            count += 1
+        return count
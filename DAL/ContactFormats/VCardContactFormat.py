@@ -0,0 +1,98 @@
+import re
+from datetime import date
+from typing import Iterable, Iterator, TextIO
+
+from DAL.ContactFormats.IContactFormat import IContactFormat
+from DAL.Entities.ContactRow import ContactRow
+from DAL.Entities.Record import Record
+
+
+class VCardContactFormat(IContactFormat):
+    # The FN, N, TEL and BDAY properties of vCard 3.0 / 4.0, everything else is skipped
+    NAME = "vcard"
+    EXTENSIONS = (".vcf", ".vcard")
+    ESCAPE = re.compile(r"\\(.)")
+    # A structured value component ends at a ';' that is not escaped
+    COMPONENT = re.compile(r"((?:\\.|[^\\;])*);")
+
+    def read(self, file: TextIO) -> Iterator[ContactRow]:
+        row: ContactRow | None = None
+        for line_number, line in self._unfold(file):
+            prop, _, value = line.partition(":")
+            prop = prop.split(";")[0].upper()
+            # Grouped properties look like item1.TEL
+            prop = prop.rsplit(".", 1)[-1]
+
+            if prop == "BEGIN" and value.upper() == "VCARD":
+                row = ContactRow(line_number)
+            elif row is None:
+                continue
+            elif prop == "END" and value.upper() == "VCARD":
+                if not row.name and row.error is None:
+                    row.error = "vCard has no FN or N property"
+                yield row
+                row = None
+            elif prop == "FN":
+                row.name = self._unescape(value).strip()
+            elif prop == "N" and not row.name:
+                # Split on the separators first, an escaped \; belongs to the component
+                family, given = ([self._unescape(part) for part in self._split_components(value)] + ["", ""])[:2]
+                row.name = " ".join(part.strip() for part in (given, family) if part.strip())
+            elif prop == "TEL":
+                row.phones.append(value.removeprefix("tel:").strip())
+            elif prop == "BDAY":
+                row.birthday = self._parse_birthday(value.strip(), row)
+
+        if row is not None:
+            row.error = "vCard is not closed with END:VCARD"
+            yield row
+
+    def write(self, file: TextIO, records: Iterable[Record]) -> int:
+        count = 0
+        for record in records:
+            lines = ["BEGIN:VCARD", "VERSION:3.0", f"FN:{self._escape(record.name.value)}"]
+            lines.extend(f"TEL:{phone.value}" for phone in record.phones)
+            if record.birthday:
+                lines.append(f"BDAY:{record.birthday.value.isoformat()}")
+            lines.append("END:VCARD")
+            # vCard lines end with CRLF whatever the platform
+            file.write("\r\n".join(lines) + "\r\n")
+            count += 1
+        return count
+
+    @staticmethod
+    def _unfold(file: TextIO) -> Iterator[tuple[int, str]]:
+        # Long lines continue on the next line after a leading space or tab
+        start, current = 0, None
+        for line_number, line in enumerate(file, start=1):
+            line = line.rstrip("\r\n")
+            if line[:1] in (" ", "\t") and current is not None:
+                current += line[1:]
+                continue
+            if current:
+                yield start, current
+            start, current = line_number, line
+        if current:
+            yield start, current
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace(",", "\\,").replace(";", "\\;")
+
+    @classmethod
+    def _unescape(cls, value: str) -> str:
+        # One pass, so an escaped backslash cannot start another escape
+        return cls.ESCAPE.sub(lambda match: " " if match[1] in "nN" else match[1], value)
+
+    @classmethod
+    def _split_components(cls, value: str) -> list[str]:
+        return [match[1] for match in cls.COMPONENT.finditer(value + ";")]
+
+    @staticmethod
+    def _parse_birthday(value: str, row: ContactRow) -> date | None:
+        try:
+            # 1990-05-01 and 19900501
+            return date.fromisoformat(value[:10] if "-" in value else value[:8])
+        except ValueError:
+            row.error = f"Unsupported BDAY value '{value}'"
+            return None
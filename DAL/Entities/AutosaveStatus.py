@@ -0,0 +1,36 @@
+from datetime import datetime
+
+
+class AutosaveStatus:
+    def __init__(
+        self,
+        enabled: bool,
+        delay: float = 0.0,
+        pending: bool = False,
+        save_count: int = 0,
+        last_saved_name: str | None = None,
+        last_saved_at: datetime | None = None,
+        last_error: str | None = None,
+    ):
+        self.enabled = enabled
+        self.delay = delay
+        self.pending = pending
+        self.save_count = save_count
+        self.last_saved_name = last_saved_name
+        self.last_saved_at = last_saved_at
+        self.last_error = last_error
+
+    def __str__(self):
+        if not self.enabled:
+            return "Autosave is off."
+
+        lines = [
+            f"Autosave is on, it saves {self.delay:g}s after the last change.",
+            f"Unsaved changes: {'yes' if self.pending else 'no'}",
+            f"Autosaves this session: {self.save_count}",
+        ]
+        if self.last_saved_name:
+            lines.append(f"Last autosave: '{self.last_saved_name}' at {self.last_saved_at:%H:%M:%S}")
+        if self.last_error:
+            lines.append(f"Last error: {self.last_error}")
+        return "\n".join(lines)
@@ -0,0 +1,39 @@
+class BatchReport:
+    MAX_SHOWN_FAILURES = 20
+
+    def __init__(self):
+        self.executed = 0
+        self.failures: list[tuple[int, str]] = []
+        self.saves = 0
+        self.save_errors: list[str] = []
+        self.elapsed = 0.0
+        # Line of the failed command when the batch stopped on the first error
+        self.stopped_at: int | None = None
+
+    @property
+    def failed(self) -> int:
+        return len(self.failures)
+
+    @property
+    def succeeded(self) -> int:
+        return self.executed - self.failed
+
+    @property
+    def commands_per_second(self) -> float:
+        return self.executed / self.elapsed if self.elapsed > 0 else float(self.executed)
+
+    def add_failure(self, line: int, message: str) -> None:
+        self.failures.append((line, message))
+
+    def __str__(self):
+        lines = [
+            f"Batch finished: {self.executed} commands, {self.succeeded} succeeded, {self.failed} failed, "
+            f"{self.saves} saves in {self.elapsed:.2f}s ({self.commands_per_second:,.0f} commands/s)."
+        ]
+        if self.stopped_at is not None:
+            lines.append(f"Stopped at line {self.stopped_at}, the commands after it were not run.")
+        lines.extend(f" - line {line}: {message}" for line, message in self.failures[:self.MAX_SHOWN_FAILURES])
+        if self.failed > self.MAX_SHOWN_FAILURES:
+            lines.append(f" ... and {self.failed - self.MAX_SHOWN_FAILURES} more failures")
+        lines.extend(f" - save failed: {message}" for message in self.save_errors)
+        return "\n".join(lines)
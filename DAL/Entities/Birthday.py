@@ -1,3 +1,4 @@
+import re
 from datetime import datetime, date
 
 from DAL.Entities.Field import Field
@@ -5,7 +6,11 @@ from DAL.Exceptions.InvalidException import InvalidException
 
 
 class Birthday(Field):
+    __slots__ = ()
+
     DATE_FORMAT = "%d.%m.%Y"
+    # Matches what strptime accepts for DATE_FORMAT, several times faster for bulk imports
+    DATE_PATTERN = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
 
     def __init__(self, value: str | datetime | date):
         if isinstance(value, datetime):
@@ -16,7 +21,11 @@ class Birthday(Field):
 
         elif isinstance(value, str):
             try:
-                value = datetime.strptime(value, self.DATE_FORMAT).date()
+                match = self.DATE_PATTERN.fullmatch(value)
+                if match is None:
+                    raise ValueError(value)
+                day, month, year = map(int, match.groups())
+                value = date(year, month, day)
             except ValueError:
                 raise InvalidException(
                     f"Birthday must be in format {self.DATE_FORMAT}. "
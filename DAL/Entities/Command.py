@@ -1,13 +1,47 @@
-from typing import Callable
+from typing import Callable, Sequence
+
+from DAL.Exceptions.InvalidException import InvalidException
+
 
 class Command:
-    def __init__(self, name: str, handler: Callable, description: str):
+    # Argument schema: "name" is required, "name?" optional, "name*" takes the rest of the line.
+    # None means the handler is called without the argument list.
+    def __init__(
+        self,
+        name: str,
+        handler: Callable,
+        description: str,
+        requires_data: bool = True,
+        args: Sequence[str] | None = None,
+        aliases: Sequence[str] = (),
+    ):
         self.name = name
         self.handler = handler
         self.description = description
+        # Commands that do not touch the address book run before the startup load finishes
+        self.requires_data = requires_data
+        self.args = tuple(args) if args is not None else None
+        self.aliases = tuple(aliases)
+        self.usage = " ".join([name, *(f"[{arg.rstrip('?*')}]" for arg in self.args or ())])
+        self._bind = self._compile_binder()
 
     def __str__(self):
         return f"Command '{self.name}': {self.description}"
 
-    def execute(self, *args, **kwargs):
-        return self.handler(*args, **kwargs)
\ No newline at end of file
+    def execute(self, arguments: list[str] | None = None):
+        return self.handler(*self._bind(arguments or []))
+
+    def _compile_binder(self) -> Callable[[list[str]], tuple]:
+        # Built once, dispatch only compares the argument count
+        args = self.args or ()
+        required = sum(1 for arg in args if not arg.endswith(("?", "*")))
+        maximum = None if any(arg.endswith("*") for arg in args) else len(args)
+        passes_arguments = self.args is not None
+        usage = self.usage
+
+        def bind(arguments: list[str]) -> tuple:
+            if len(arguments) < required or (maximum is not None and len(arguments) > maximum):
+                raise InvalidException(f"Invalid command format. Usage: {usage}")
+            return (arguments,) if passes_arguments else ()
+
+        return bind
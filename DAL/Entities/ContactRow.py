@@ -0,0 +1,23 @@
+from datetime import date
+
+
+class ContactRow:
+    # One contact as read from an import file, not validated yet
+    __slots__ = ("line", "name", "phones", "birthday", "error")
+
+    def __init__(
+        self,
+        line: int,
+        name: str | None = None,
+        phones: list[str] | None = None,
+        birthday: str | date | None = None,
+        error: str | None = None,
+    ):
+        self.line = line
+        self.name = name
+        self.phones = phones or []
+        self.birthday = birthday
+        self.error = error
+
+    def __str__(self):
+        return f"Line {self.line}: {self.name} {', '.join(self.phones)}"
@@ -0,0 +1,15 @@
+class ExportReport:
+    def __init__(self, path: str, exported: int = 0, elapsed: float = 0.0):
+        self.path = path
+        self.exported = exported
+        self.elapsed = elapsed
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.exported / self.elapsed if self.elapsed > 0 else float(self.exported)
+
+    def __str__(self):
+        return (
+            f"Exported {self.exported} contacts to '{self.path}' "
+            f"in {self.elapsed:.2f}s ({self.rows_per_second:,.0f} rows/s)."
+        )
@@ -1,7 +1,16 @@
 class Field:
+    __slots__ = ("value",)
+
     def __init__(self, value: any):
         self.value = value
 
+    @classmethod
+    def from_normalized(cls, value: any) -> "Field":
+        # Skips validation, only for values that were validated before they were stored
+        field = cls.__new__(cls)
+        field.value = value
+        return field
+
     def __str__(self):
         return str(self.value)
 
@@ -10,4 +19,10 @@ class Field:
             return self.value == other
         if not isinstance(other, Field):
             return NotImplemented
-        return self.value == other.value
\ No newline at end of file
+        return self.value == other.value
+
+    def __setstate__(self, state):
+        # Snapshots written before __slots__ store the instance __dict__
+        if isinstance(state, tuple):
+            state = state[1]
+        self.value = state["value"]
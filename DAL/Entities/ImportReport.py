@@ -0,0 +1,30 @@
+class ImportReport:
+    MAX_SHOWN_ERRORS = 20
+
+    def __init__(self, path: str):
+        self.path = path
+        self.imported = 0
+        self.errors: list[tuple[int, str]] = []
+        self.elapsed = 0.0
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+    @property
+    def rows_per_second(self) -> float:
+        rows = self.imported + self.failed
+        return rows / self.elapsed if self.elapsed > 0 else float(rows)
+
+    def add_error(self, line: int, message: str) -> None:
+        self.errors.append((line, message))
+
+    def __str__(self):
+        lines = [
+            f"Imported {self.imported} contacts from '{self.path}', {self.failed} rows failed "
+            f"in {self.elapsed:.2f}s ({self.rows_per_second:,.0f} rows/s)."
+        ]
+        lines.extend(f" - line {line}: {message}" for line, message in self.errors[:self.MAX_SHOWN_ERRORS])
+        if self.failed > self.MAX_SHOWN_ERRORS:
+            lines.append(f" ... and {self.failed - self.MAX_SHOWN_ERRORS} more errors")
+        return "\n".join(lines)
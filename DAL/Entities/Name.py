@@ -2,6 +2,8 @@ from DAL.Entities.Field import Field
 
 
 class Name(Field):
+    __slots__ = ()
+
     def __init__(self, value: str):
         if value is None:
             raise ValueError("Name value cannot be None")
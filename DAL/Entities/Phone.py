@@ -3,7 +3,10 @@ import re
 from DAL.Entities.Field import Field
 
 class Phone(Field):
-    PHONE_PATTERN = re.compile(r"^\+?\d{10,15}$")
+    __slots__ = ()
+
+    # ASCII digits only, snapshots and the columnar storage keep a phone as a number
+    PHONE_PATTERN = re.compile(r"^\+?\d{10,15}$", re.ASCII)
 
     def __init__(self, value: str):
         if not isinstance(value, str):
@@ -0,0 +1,48 @@
+from typing import Iterable, Iterator
+
+from DAL.Entities.Phone import Phone
+
+
+class PhoneCollection:
+    # A list-like view over the phone tuple stored in a Record,
+    # so records do not pay for a list object each.
+    __slots__ = ("_record",)
+
+    def __init__(self, record):
+        self._record = record
+
+    def append(self, phone: Phone) -> None:
+        self._record._phones += (phone,)
+
+    def extend(self, phones: Iterable[Phone]) -> None:
+        self._record._phones += tuple(phones)
+
+    def remove(self, phone: Phone | str) -> None:
+        phones = list(self._record._phones)
+        phones.remove(phone)
+        self._record._phones = tuple(phones)
+
+    def clear(self) -> None:
+        self._record._phones = ()
+
+    def __iter__(self) -> Iterator[Phone]:
+        return iter(self._record._phones)
+
+    def __len__(self) -> int:
+        return len(self._record._phones)
+
+    def __getitem__(self, index):
+        return self._record._phones[index]
+
+    def __contains__(self, phone) -> bool:
+        return phone in self._record._phones
+
+    def __eq__(self, other):
+        if isinstance(other, PhoneCollection):
+            return self._record._phones == other._record._phones
+        if isinstance(other, (list, tuple)):
+            return self._record._phones == tuple(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self._record._phones))
@@ -2,21 +2,56 @@
 from DAL.Entities.Birthday import Birthday
 from DAL.Entities.Name import Name
 from DAL.Entities.Phone import Phone
+from DAL.Entities.PhoneCollection import PhoneCollection
 from DAL.Exceptions.InvalidException import InvalidException
 from DAL.Exceptions.NotFoundException import NotFoundException
 from datetime import datetime, date
+from typing import Iterable
 
 class Record:
+    __slots__ = ("name", "_phones", "birthday")
+
     def __init__(self, name: str, *phone_numbers: str, birthday: str | datetime | date |  None = None):
         self.name = Name(name)
-        self.phones: list[Phone] = []
         self.birthday: Birthday | None = None
 
         if birthday is not None:
             self.birthday = Birthday(birthday)
 
-        for phone_number in phone_numbers:
-            self.phones.append(Phone(phone_number))
+        self._phones: tuple[Phone, ...] = tuple(Phone(phone_number) for phone_number in phone_numbers)
+
+    @classmethod
+    def from_normalized(cls, name: str, phone_numbers: Iterable[str], birthday: date | None = None) -> "Record":
+        # Skips validation, only for values that were validated before they were stored
+        record = cls.__new__(cls)
+        record.name = Name.from_normalized(name)
+        record._phones = tuple(Phone.from_normalized(phone_number) for phone_number in phone_numbers)
+        record.birthday = Birthday.from_normalized(birthday) if birthday is not None else None
+        return record
+
+    def copy(self) -> "Record":
+        # Field objects are replaced on change, never modified, so the copy can share them
+        record = Record.__new__(Record)
+        record.name = self.name
+        record._phones = self._phones
+        record.birthday = self.birthday
+        return record
+
+    @property
+    def phones(self) -> PhoneCollection:
+        return PhoneCollection(self)
+
+    @phones.setter
+    def phones(self, phones) -> None:
+        self._phones = tuple(phones)
+
+    def __setstate__(self, state):
+        # Snapshots written before __slots__ store the instance __dict__ with a 'phones' list
+        if isinstance(state, tuple):
+            state = state[1]
+        self.name = state["name"]
+        self._phones = tuple(state["_phones"] if "_phones" in state else state.get("phones", ()))
+        self.birthday = state.get("birthday")
 
     def __str__(self):
         return f"\nContact: \nName: {self.name.value}, \nPhones: {', '.join(p.value for p in self.phones)}" + (f", \nBirthday: {self.birthday.value}" if self.birthday else "")
@@ -41,6 +76,17 @@ class Record:
         return next((p for p in self.phones if p == phone), None)
 
     def update(self):
-        from DAL.EntityBuiilders.RecordBuilder.RecordBuilder import RecordBuilder
-        return RecordBuilder(self)
+        return _record_builder()(self)
+
+
+_RecordBuilder = None
 
+
+def _record_builder() -> type:
+    # RecordBuilder imports Record and is only needed to edit a contact,
+    # so it is imported on the first edit and kept instead of importing on every call
+    global _RecordBuilder
+    if _RecordBuilder is None:
+        from DAL.EntityBuiilders.RecordBuilder.RecordBuilder import RecordBuilder
+        _RecordBuilder = RecordBuilder
+    return _RecordBuilder
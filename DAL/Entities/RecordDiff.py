@@ -0,0 +1,59 @@
+from DAL.Entities.Record import Record
+
+
+class RecordDiff:
+    # One change of one contact, as little as is needed to replay it or its inverse.
+    # Records and fields are never modified after they are stored, so the values kept
+    # here are shared with the book instead of being copied.
+    ADD = "add"
+    DELETE = "delete"
+    UPDATE = "update"
+    RENAME = "rename"
+
+    __slots__ = ("operation", "record_name", "before", "after")
+
+    def __init__(self, operation: str, record_name: str, before=None, after=None):
+        self.operation = operation
+        self.record_name = record_name
+        # ADD: after is the record. DELETE: before is the record. RENAME: after is the new name.
+        # UPDATE: before and after are (slot, value) pairs of the changed fields only
+        self.before = before
+        self.after = after
+
+    @classmethod
+    def added(cls, record: Record) -> "RecordDiff":
+        return cls(cls.ADD, record.name.value, after=record)
+
+    @classmethod
+    def deleted(cls, record: Record) -> "RecordDiff":
+        return cls(cls.DELETE, record.name.value, before=record)
+
+    @classmethod
+    def renamed(cls, record_name: str, new_name: str) -> "RecordDiff":
+        return cls(cls.RENAME, record_name, after=new_name)
+
+    @classmethod
+    def updated(cls, record_name: str, old_record: Record, new_record: Record) -> "RecordDiff | None":
+        before, after = [], []
+        for slot in Record.__slots__:
+            old_value, new_value = getattr(old_record, slot), getattr(new_record, slot)
+            if old_value != new_value:
+                before.append((slot, old_value))
+                after.append((slot, new_value))
+        return cls(cls.UPDATE, record_name, tuple(before), tuple(after)) if after else None
+
+    def inverted(self) -> "RecordDiff":
+        if self.operation == self.ADD:
+            return RecordDiff(self.DELETE, self.record_name, before=self.after)
+        if self.operation == self.DELETE:
+            return RecordDiff(self.ADD, self.record_name, after=self.before)
+        if self.operation == self.RENAME:
+            return RecordDiff(self.RENAME, self.after, after=self.record_name)
+        return RecordDiff(self.UPDATE, self.record_name, self.after, self.before)
+
+    def __str__(self):
+        if self.operation == self.RENAME:
+            return f"rename '{self.record_name}' to '{self.after}'"
+        if self.operation == self.UPDATE:
+            return f"edit '{self.record_name}' ({', '.join(slot.strip('_') for slot, _ in self.after)})"
+        return f"{self.operation} '{self.record_name}'"
@@ -0,0 +1,22 @@
+from DAL.Exceptions.InvalidException import InvalidException
+
+
+class RetentionPolicy:
+    def __init__(
+        self,
+        keep_last: int = 10,
+        hourly_for_hours: int = 24,
+        daily_for_days: int = 7,
+        max_total_bytes: int | None = None,
+    ):
+        if keep_last < 1:
+            raise InvalidException("Retention must keep at least the latest file")
+        if hourly_for_hours < 0 or daily_for_days < 0:
+            raise InvalidException("Retention periods cannot be negative")
+        if max_total_bytes is not None and max_total_bytes <= 0:
+            raise InvalidException("Maximum size of the data folder must be positive")
+
+        self.keep_last = keep_last
+        self.hourly_for_hours = hourly_for_hours
+        self.daily_for_days = daily_for_days
+        self.max_total_bytes = max_total_bytes
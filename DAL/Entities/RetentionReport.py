@@ -0,0 +1,16 @@
+class RetentionReport:
+    def __init__(self, deleted: list[str], reclaimed_bytes: int, kept_count: int):
+        self.deleted = deleted
+        self.reclaimed_bytes = reclaimed_bytes
+        self.kept_count = kept_count
+
+    def __str__(self):
+        if not self.deleted:
+            return f"Nothing to delete, {self.kept_count} files kept."
+
+        lines = [
+            f"Deleted {len(self.deleted)} files, reclaimed {self.reclaimed_bytes / 1024:.1f} KB, "
+            f"{self.kept_count} files kept."
+        ]
+        lines.extend(f" - {name}" for name in self.deleted)
+        return "\n".join(lines)
@@ -0,0 +1,18 @@
+from DAL.Entities.Record import Record
+
+
+class SnapshotDelta:
+    def __init__(self, parent: str, depth: int, upserts: dict[str, Record], deletes: list[str]):
+        self.parent = parent
+        self.depth = depth
+        self.upserts = upserts
+        self.deletes = deletes
+
+    def __str__(self):
+        return f"Delta of '{self.parent}': {len(self.upserts)} upserts, {len(self.deletes)} deletes"
+
+    def apply_to(self, state: dict[str, Record]) -> dict[str, Record]:
+        for record_name in self.deletes:
+            state.pop(record_name, None)
+        state.update(self.upserts)
+        return state
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+
+class SnapshotInfo:
+    def __init__(
+        self,
+        name: str,
+        created_at: datetime,
+        size: int,
+        record_count: int | None = None,
+        checksum: str | None = None,
+        parent: str | None = None,
+        parent_known: bool = True,
+    ):
+        self.name = name
+        self.created_at = created_at
+        self.size = size
+        self.record_count = record_count
+        self.checksum = checksum
+        self.parent = parent
+        # False when the file was catalogued without reading where it came from, it may be a delta
+        self.parent_known = parent_known
+
+    def __str__(self):
+        records = "?" if self.record_count is None else self.record_count
+        description = f"{self.name} | {self.created_at:%Y-%m-%d %H:%M:%S} | {self.size / 1024:.1f} KB | {records} records"
+        if not self.parent_known:
+            return description + " | origin unknown"
+        return description + (f" | delta of {self.parent}" if self.parent else "")
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "created_at": self.created_at.isoformat(),
+            "size": self.size,
+            "record_count": self.record_count,
+            "checksum": self.checksum,
+            "parent": self.parent,
+            "parent_known": self.parent_known,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SnapshotInfo":
+        return cls(
+            name=data["name"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            size=data["size"],
+            record_count=data.get("record_count"),
+            checksum=data.get("checksum"),
+            parent=data.get("parent"),
+            parent_known=data.get("parent_known", True),
+        )
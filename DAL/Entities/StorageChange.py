@@ -0,0 +1,15 @@
+from DAL.Entities.Record import Record
+
+
+class StorageChange:
+    UPSERT = "upsert"
+    DELETE = "delete"
+    RESET = "reset"
+
+    def __init__(self, operation: str, record_name: str | None = None, record: Record | None = None):
+        self.operation = operation
+        self.record_name = record_name
+        self.record = record
+
+    def __str__(self):
+        return f"StorageChange '{self.operation}': {self.record_name}"
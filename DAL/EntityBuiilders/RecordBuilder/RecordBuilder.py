@@ -13,7 +13,9 @@ from BLL.Helpers.DateHelper import DateHelper
 
 class RecordBuilder:
     def __init__(self, record: Record):
-        self._record = record
+        # Changes go to a copy, the stored record stays as it is until the result is saved,
+        # so a failed step leaves nothing half-changed
+        self._record = record.copy()
 
     def set_name(self, name: str) -> "RecordBuilder":
         if not name or not name.strip():
@@ -0,0 +1,250 @@
+import gc
+import os
+import struct
+from datetime import date
+from typing import BinaryIO, Iterator
+
+from DAL.Entities.Record import Record
+from DAL.Entities.SnapshotDelta import SnapshotDelta
+from DAL.Entities.SnapshotInfo import SnapshotInfo
+from DAL.Exceptions.InvalidException import InvalidException
+from DAL.FileManagers.IFileManager import IFileManager
+from DAL.FileManagers.PickleFileManager.PickleFileManager import PickleFileManager
+from DAL.FileManagers.SnapshotManifest.SnapshotManifest import SnapshotManifest
+
+Snapshot = dict[str, Record] | SnapshotDelta
+
+
+class BinaryFileManager(IFileManager[Snapshot]):
+    FILE_EXTENSION = ".abk"
+    MAGIC = b"ABKS"
+    SCHEMA_VERSION = 1
+    FULL_SNAPSHOT = 0
+    DELTA_SNAPSHOT = 1
+
+    # magic, schema version, snapshot kind, record count
+    HEADER = struct.Struct("<4sHBI")
+    # delta depth, deleted names count, followed by the parent name and the deleted names
+    DELTA_HEADER = struct.Struct("<II")
+    # UTF-8 name length, birthday day ordinal (0 when there is none), phone count, followed by the name and phones
+    RECORD = struct.Struct("<HIH")
+    # phone digits as a number, digit count to keep leading zeros, leading '+' flag
+    PHONE = struct.Struct("<QBB")
+    STRING_LENGTH = struct.Struct("<H")
+
+    def __init__(self, base_dir: str = "data", codec: str = "none"):
+        PickleFileManager.validate_codec(codec)
+        self.base_dir = base_dir
+        self.codec = codec
+        self.manifest = SnapshotManifest(base_dir, {
+            self.FILE_EXTENSION: self.read_parent,
+            PickleFileManager.FILE_EXTENSION: PickleFileManager.read_parent,
+        })
+        # .pkl snapshots saved before the binary format stay readable until they are migrated
+        self.legacy_manager = PickleFileManager(base_dir, manifest=self.manifest)
+
+    def save(self, obj: Snapshot, name: str, codec: str | None = None) -> str:
+        codec = codec or self.codec
+        PickleFileManager.validate_codec(codec)
+        base, _ = os.path.splitext(str(name))
+        filepath = self._generate_unique_filename(base + self.FILE_EXTENSION)
+        temp_path = filepath + ".tmp"
+        try:
+            with PickleFileManager.open_file(temp_path, "wb", codec) as file:
+                self._write_snapshot(file, obj)
+        except Exception:
+            os.remove(temp_path)
+            raise
+        os.replace(temp_path, filepath)
+        self.manifest.record(filepath, obj)
+        return os.path.basename(filepath)
+
+    def load(self, name: str) -> Snapshot:
+        if self._is_legacy(name):
+            return self.legacy_manager.load(name)
+
+        # Decoding allocates several objects per record and no reference cycles,
+        # so automatic collections during a load would only rescan the growing book
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self._load_snapshot(name)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def iter_records(self, name: str) -> Iterator[Record]:
+        # Streams the records of a full snapshot, or the upserts of a delta, one at a time
+        with self._open(name) as file:
+            kind, record_count = self._read_header(file)
+            if kind == self.DELTA_SNAPSHOT:
+                self._read_delta_header(file)
+            yield from self._read_records(file, record_count)
+
+    def delete(self, name: str) -> None:
+        if self._is_legacy(name):
+            self.legacy_manager.delete(name)
+            return
+
+        filepath = self._normalize_name(name)
+        if os.path.exists(filepath):
+            os.remove(filepath)
+        self.manifest.remove(os.path.basename(filepath))
+
+    def get_all_names(self) -> list[str]:
+        return [info.name for info in self.get_snapshots()]
+
+    def get_snapshots(self) -> list[SnapshotInfo]:
+        # Both formats, in the order they were written
+        return self.manifest.get_all()
+
+    def get_latest_name(self) -> str | None:
+        latest = self.manifest.latest()
+        return latest.name if latest else None
+
+    def has_file_with_name(self, name: str) -> bool:
+        if self._is_legacy(name):
+            return self.legacy_manager.has_file_with_name(name)
+
+        filepath = self._normalize_name(name)
+        if os.path.exists(filepath):
+            return True
+        self.manifest.remove(os.path.basename(filepath))
+        return False
+
+    def read_parent(self, filepath: str) -> str | None:
+        with PickleFileManager.open_file(filepath, "rb", PickleFileManager.detect_codec(filepath)) as file:
+            kind, _ = self._read_header(file)
+            if kind != self.DELTA_SNAPSHOT:
+                return None
+            _, parent, _ = self._read_delta_header(file)
+            return parent
+
+    def migrate_legacy_files(self) -> dict[str, str]:
+        migrated: dict[str, str] = {}
+        for legacy_name in self.legacy_manager.get_all_names():
+            self._migrate(legacy_name, migrated)
+
+        # Originals are removed only after the whole set converted, deltas may point at any of them
+        for legacy_name in migrated:
+            self.legacy_manager.delete(legacy_name)
+        return migrated
+
+    def _migrate(self, legacy_name: str, migrated: dict[str, str]) -> str:
+        if legacy_name in migrated:
+            return migrated[legacy_name]
+
+        snapshot = self.legacy_manager.load(legacy_name)
+        if isinstance(snapshot, SnapshotDelta) and self.legacy_manager.has_file_with_name(snapshot.parent):
+            snapshot.parent = self._migrate(snapshot.parent, migrated)
+
+        base, _ = os.path.splitext(legacy_name)
+        migrated[legacy_name] = self.save(snapshot, base + self.FILE_EXTENSION)
+        return migrated[legacy_name]
+
+    def _load_snapshot(self, name: str) -> Snapshot:
+        with self._open(name) as file:
+            kind, record_count = self._read_header(file)
+            if kind == self.DELTA_SNAPSHOT:
+                depth, parent, deletes = self._read_delta_header(file)
+                upserts = {record.name.value: record for record in self._read_records(file, record_count)}
+                return SnapshotDelta(parent, depth, upserts, deletes)
+
+            return {record.name.value: record for record in self._read_records(file, record_count)}
+
+    def _write_snapshot(self, file: BinaryIO, snapshot: Snapshot) -> None:
+        if isinstance(snapshot, SnapshotDelta):
+            records = snapshot.upserts
+            file.write(self.HEADER.pack(self.MAGIC, self.SCHEMA_VERSION, self.DELTA_SNAPSHOT, len(records)))
+            file.write(self.DELTA_HEADER.pack(snapshot.depth, len(snapshot.deletes)))
+            for value in (snapshot.parent, *snapshot.deletes):
+                encoded = value.encode("utf-8")
+                file.write(self.STRING_LENGTH.pack(len(encoded)) + encoded)
+        elif isinstance(snapshot, dict):
+            records = snapshot
+            file.write(self.HEADER.pack(self.MAGIC, self.SCHEMA_VERSION, self.FULL_SNAPSHOT, len(records)))
+        else:
+            raise TypeError(f"Cannot write {type(snapshot).__name__} as a binary snapshot")
+
+        for record in records.values():
+            file.write(self._pack_record(record))
+
+    def _pack_record(self, record: Record) -> bytes:
+        name = record.name.value.encode("utf-8")
+        birthday = record.birthday.value.toordinal() if record.birthday else 0
+        phones = b"".join(self.PHONE.pack(*self._encode_phone(phone.value)) for phone in record.phones)
+        return self.RECORD.pack(len(name), birthday, len(record.phones)) + name + phones
+
+    def _read_header(self, file: BinaryIO) -> tuple[int, int]:
+        magic, schema_version, kind, record_count = self.HEADER.unpack(self._read_exact(file, self.HEADER.size))
+        if magic != self.MAGIC:
+            raise InvalidException("File is not a binary address book snapshot")
+        if schema_version != self.SCHEMA_VERSION:
+            raise InvalidException(f"Unsupported snapshot schema version {schema_version}")
+        return kind, record_count
+
+    def _read_delta_header(self, file: BinaryIO) -> tuple[int, str, list[str]]:
+        depth, delete_count = self.DELTA_HEADER.unpack(self._read_exact(file, self.DELTA_HEADER.size))
+        parent = self._read_string(file)
+        deletes = [self._read_string(file) for _ in range(delete_count)]
+        return depth, parent, deletes
+
+    def _read_records(self, file: BinaryIO, record_count: int) -> Iterator[Record]:
+        record_struct, phone_struct = self.RECORD, self.PHONE
+        for _ in range(record_count):
+            name_length, birthday, phone_count = record_struct.unpack(self._read_exact(file, record_struct.size))
+            body = self._read_exact(file, name_length + phone_struct.size * phone_count)
+            phones = [
+                self._decode_phone(value, digits, plus)
+                for value, digits, plus in phone_struct.iter_unpack(body[name_length:])
+            ]
+            yield Record.from_normalized(
+                body[:name_length].decode("utf-8"),
+                phones,
+                date.fromordinal(birthday) if birthday else None,
+            )
+
+    def _read_string(self, file: BinaryIO) -> str:
+        (length,) = self.STRING_LENGTH.unpack(self._read_exact(file, self.STRING_LENGTH.size))
+        return self._read_exact(file, length).decode("utf-8")
+
+    def _open(self, name: str) -> BinaryIO:
+        filepath = self._normalize_name(name)
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"File '{filepath}' not found")
+        return PickleFileManager.open_file(filepath, "rb", self.legacy_manager.detect_codec(filepath))
+
+    def _is_legacy(self, name: str) -> bool:
+        return name.endswith(self.legacy_manager.FILE_EXTENSION)
+
+    def _normalize_name(self, name: str) -> str:
+        base, ext = os.path.splitext(name)
+        return os.path.join(self.base_dir, base + (ext or self.FILE_EXTENSION))
+
+    def _generate_unique_filename(self, name: str) -> str:
+        full_path = self._normalize_name(name)
+        base, ext = os.path.splitext(name)
+        counter = 1
+        while os.path.basename(full_path) in self.manifest or os.path.exists(full_path):
+            full_path = os.path.join(self.base_dir, f"{base}_{counter}{ext}")
+            counter += 1
+        return full_path
+
+    @staticmethod
+    def _read_exact(file: BinaryIO, size: int) -> bytes:
+        data = file.read(size)
+        if len(data) != size:
+            raise InvalidException("Snapshot file is truncated or corrupted")
+        return data
+
+    @staticmethod
+    def _encode_phone(phone: str) -> tuple[int, int, bool]:
+        plus = phone.startswith("+")
+        digits = phone[1:] if plus else phone
+        if not digits.isascii():
+            raise InvalidException(f"Phone '{phone}' cannot be stored in a binary snapshot")
+        return int(digits), len(digits), plus
+
+    @staticmethod
+    def _decode_phone(value: int, digits: int, plus: bool) -> str:
+        return ("+" if plus else "") + str(value).zfill(digits)
@@ -0,0 +1,229 @@
+import hashlib
+import json
+import os
+from collections import Counter
+from datetime import date
+
+from DAL.Entities.Record import Record
+from DAL.Entities.SnapshotDelta import SnapshotDelta
+from DAL.Entities.SnapshotInfo import SnapshotInfo
+from DAL.Exceptions.InvalidException import InvalidException
+from DAL.FileManagers.IFileManager import IFileManager
+from DAL.FileManagers.PickleFileManager.PickleFileManager import PickleFileManager
+from DAL.FileManagers.SnapshotManifest.SnapshotManifest import SnapshotManifest
+
+Snapshot = dict[str, Record] | SnapshotDelta
+
+
+class ChunkFileManager(IFileManager[Snapshot]):
+    # Content-addressed snapshots: every record is stored once in chunks/<hash[:2]>/<hash>,
+    # a .cas snapshot only maps record names to chunk hashes, so records that did not change
+    # between saves cost one hash in the next snapshot instead of a copy
+    FILE_EXTENSION = ".cas"
+    CHUNK_DIR = "chunks"
+    VERSION = 1
+
+    def __init__(self, base_dir: str = "data", codec: str = "none"):
+        PickleFileManager.validate_codec(codec)
+        self.base_dir = base_dir
+        self.codec = codec
+        self.chunk_dir = os.path.join(base_dir, self.CHUNK_DIR)
+        os.makedirs(self.chunk_dir, exist_ok=True)
+        # Deltas are saved as full .cas snapshots, only .pkl files can have a parent
+        self.manifest = SnapshotManifest(base_dir, {
+            self.FILE_EXTENSION: lambda filepath: None,
+            PickleFileManager.FILE_EXTENSION: PickleFileManager.read_parent,
+        })
+        # .pkl snapshots saved before switching to chunks stay readable
+        self.legacy_manager = PickleFileManager(base_dir, manifest=self.manifest)
+        # Chunks known to be on disk, saves skip the existence check for them
+        self._known_chunks: set[str] = set()
+        # Chunk hash -> number of .cas snapshots referring to it, counted on the first delete
+        # and kept up to date afterwards, so a delete reads only the index of the deleted file
+        self._chunk_refs: Counter | None = None
+        self._counted_snapshots: set[str] = set()
+
+    def save(self, obj: Snapshot, name: str, codec: str | None = None) -> str:
+        codec = codec or self.codec
+        PickleFileManager.validate_codec(codec)
+
+        if isinstance(obj, SnapshotDelta) and self._is_legacy(obj.parent):
+            # The first save after switching formats continues a .pkl chain, its records are chunked in full
+            hashes = self._write_chunks(obj.apply_to(self._load_legacy_state(obj.parent)))
+        elif isinstance(obj, SnapshotDelta):
+            # A delta costs no more than a full list of hashes here, so it is stored as a full snapshot
+            hashes = self._load_index(obj.parent)
+            for record_name in obj.deletes:
+                hashes.pop(record_name, None)
+            hashes.update(self._write_chunks(obj.upserts))
+        elif isinstance(obj, dict):
+            hashes = self._write_chunks(obj)
+        else:
+            raise TypeError(f"Cannot write {type(obj).__name__} as a chunked snapshot")
+
+        base, _ = os.path.splitext(str(name))
+        filepath = self._generate_unique_filename(base + self.FILE_EXTENSION)
+        temp_path = filepath + ".tmp"
+        try:
+            with PickleFileManager.open_file(temp_path, "wt", codec, encoding="utf-8") as file:
+                json.dump({"version": self.VERSION, "chunks": hashes}, file, ensure_ascii=False)
+        except Exception:
+            os.remove(temp_path)
+            raise
+        os.replace(temp_path, filepath)
+        self.manifest.record(filepath, hashes)
+        if self._chunk_refs is not None:
+            self._chunk_refs.update(hashes.values())
+            self._counted_snapshots.add(os.path.basename(filepath))
+        return os.path.basename(filepath)
+
+    def load(self, name: str) -> Snapshot:
+        if self._is_legacy(name):
+            return self.legacy_manager.load(name)
+
+        return {record_name: self._read_chunk(chunk_hash) for record_name, chunk_hash in self._load_index(name).items()}
+
+    def delete(self, name: str) -> None:
+        if self._is_legacy(name):
+            self.legacy_manager.delete(name)
+            return
+
+        filepath = self._normalize_name(name)
+        file_name = os.path.basename(filepath)
+        if not os.path.exists(filepath):
+            self.manifest.remove(file_name)
+            return
+
+        chunk_refs = self._reference_counts()
+        hashes = self._load_index(name).values() if file_name in self._counted_snapshots else ()
+        os.remove(filepath)
+        self.manifest.remove(file_name)
+        self._counted_snapshots.discard(file_name)
+
+        # Chunks are shared, only the ones no other snapshot refers to go away
+        for chunk_hash in hashes:
+            chunk_refs[chunk_hash] -= 1
+            if chunk_refs[chunk_hash] <= 0:
+                del chunk_refs[chunk_hash]
+                os.remove(self._chunk_path(chunk_hash))
+                self._known_chunks.discard(chunk_hash)
+
+    def get_all_names(self) -> list[str]:
+        return [info.name for info in self.get_snapshots()]
+
+    def get_snapshots(self) -> list[SnapshotInfo]:
+        extensions = (self.FILE_EXTENSION, self.legacy_manager.FILE_EXTENSION)
+        return [info for info in self.manifest.get_all() if info.name.endswith(extensions)]
+
+    def get_latest_name(self) -> str | None:
+        snapshots = self.get_snapshots()
+        return snapshots[-1].name if snapshots else None
+
+    def has_file_with_name(self, name: str) -> bool:
+        if self._is_legacy(name):
+            return self.legacy_manager.has_file_with_name(name)
+
+        filepath = self._normalize_name(name)
+        if os.path.exists(filepath):
+            return True
+        self.manifest.remove(os.path.basename(filepath))
+        return False
+
+    def get_chunk_count(self) -> int:
+        return sum(len(files) for _, _, files in os.walk(self.chunk_dir))
+
+    def _write_chunks(self, records: dict[str, Record]) -> dict[str, str]:
+        hashes = {}
+        for record_name, record in records.items():
+            data = self._encode_record(record)
+            chunk_hash = hashlib.sha256(data).hexdigest()
+            hashes[record_name] = chunk_hash
+            if chunk_hash in self._known_chunks:
+                continue
+
+            chunk_path = self._chunk_path(chunk_hash)
+            if not os.path.exists(chunk_path):
+                os.makedirs(os.path.dirname(chunk_path), exist_ok=True)
+                with open(chunk_path + ".tmp", "wb") as file:
+                    file.write(data)
+                os.replace(chunk_path + ".tmp", chunk_path)
+            self._known_chunks.add(chunk_hash)
+        return hashes
+
+    def _read_chunk(self, chunk_hash: str) -> Record:
+        try:
+            with open(self._chunk_path(chunk_hash), "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            raise InvalidException(f"Snapshot chunk '{chunk_hash}' is missing")
+        if hashlib.sha256(data).hexdigest() != chunk_hash:
+            raise InvalidException(f"Snapshot chunk '{chunk_hash}' is corrupted")
+
+        name, phones, birthday = json.loads(data)
+        return Record.from_normalized(name, phones, date.fromisoformat(birthday) if birthday else None)
+
+    def _load_index(self, name: str) -> dict[str, str]:
+        # Record name -> chunk hash
+        filepath = self._normalize_name(name)
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"File '{filepath}' not found")
+
+        codec = self.legacy_manager.detect_codec(filepath)
+        with PickleFileManager.open_file(filepath, "rt", codec, encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("version") != self.VERSION:
+            raise InvalidException(f"Unsupported chunked snapshot version {data.get('version')}")
+        return data["chunks"]
+
+    def _load_legacy_state(self, name: str) -> dict[str, Record]:
+        snapshot = self.legacy_manager.load(name)
+        deltas = []
+        while isinstance(snapshot, SnapshotDelta):
+            deltas.append(snapshot)
+            snapshot = self.legacy_manager.load(snapshot.parent)
+        for delta in reversed(deltas):
+            delta.apply_to(snapshot)
+        return snapshot
+
+    def _reference_counts(self) -> Counter:
+        if self._chunk_refs is None:
+            self._chunk_refs = Counter()
+            self._counted_snapshots = set()
+
+        names = {info.name for info in self.manifest.get_all(self.FILE_EXTENSION)}
+        # Snapshots saved by other instances; the first call counts every snapshot
+        for name in names - self._counted_snapshots:
+            try:
+                self._chunk_refs.update(self._load_index(name).values())
+            except FileNotFoundError:
+                continue
+            self._counted_snapshots.add(name)
+        # Files deleted elsewhere keep their counts, their chunks stay on disk rather than risk a shared one
+        self._counted_snapshots &= names
+        return self._chunk_refs
+
+    def _chunk_path(self, chunk_hash: str) -> str:
+        return os.path.join(self.chunk_dir, chunk_hash[:2], chunk_hash)
+
+    def _is_legacy(self, name: str) -> bool:
+        return name.endswith(self.legacy_manager.FILE_EXTENSION)
+
+    def _normalize_name(self, name: str) -> str:
+        base, ext = os.path.splitext(name)
+        return os.path.join(self.base_dir, base + (ext or self.FILE_EXTENSION))
+
+    def _generate_unique_filename(self, name: str) -> str:
+        full_path = self._normalize_name(name)
+        base, ext = os.path.splitext(name)
+        counter = 1
+        while os.path.basename(full_path) in self.manifest or os.path.exists(full_path):
+            full_path = os.path.join(self.base_dir, f"{base}_{counter}{ext}")
+            counter += 1
+        return full_path
+
+    @staticmethod
+    def _encode_record(record: Record) -> bytes:
+        # Canonical form, equal records always hash to the same chunk
+        birthday = record.birthday.value.isoformat() if record.birthday else None
+        values = [record.name.value, [phone.value for phone in record.phones], birthday]
+        return json.dumps(values, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
+from DAL.Entities.SnapshotInfo import SnapshotInfo
+
 T = TypeVar("T")
 
 class IFileManager(ABC, Generic[T]):
+    FILE_EXTENSION: str
+
     @abstractmethod
-    def save(self, obj: T, name: str) -> None:
+    def save(self, obj: T, name: str, codec: str | None = None) -> str:
         pass
 
     @abstractmethod
@@ -22,4 +26,12 @@ class IFileManager(ABC, Generic[T]):
 
     @abstractmethod
     def has_file_with_name(self, name: str) -> bool:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_snapshots(self) -> list[SnapshotInfo]:
+        pass
+
+    @abstractmethod
+    def get_latest_name(self) -> str | None:
+        pass
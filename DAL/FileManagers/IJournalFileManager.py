@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Iterator
+
+
+class IJournalFileManager(ABC):
+    @abstractmethod
+    def append(self, entries: list[list]) -> int:
+        pass
+
+    @abstractmethod
+    def rotate(self) -> int:
+        pass
+
+    @abstractmethod
+    def read_entries(self, after_segment: int, up_to_segment: int | None = None) -> Iterator[list]:
+        pass
+
+    @abstractmethod
+    def load_checkpoint(self) -> tuple[int, dict[str, tuple]]:
+        pass
+
+    @abstractmethod
+    def save_checkpoint(self, segment: int, records: dict[str, tuple]) -> None:
+        pass
+
+    @abstractmethod
+    def delete_segments(self, up_to_segment: int) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
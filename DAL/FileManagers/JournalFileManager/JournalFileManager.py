@@ -0,0 +1,122 @@
+import json
+import os
+import pickle
+import re
+import threading
+from typing import Iterator
+
+from DAL.FileManagers.IJournalFileManager import IJournalFileManager
+
+
+class JournalFileManager(IJournalFileManager):
+    CHECKPOINT_NAME = "checkpoint.pkl"
+    SEGMENT_PATTERN = re.compile(r"^journal_(\d+)\.log$")
+
+    def __init__(self, base_dir: str = os.path.join("data", "journal"), sync: bool = False):
+        self.base_dir = base_dir
+        self.sync = sync
+        self._lock = threading.Lock()
+        os.makedirs(base_dir, exist_ok=True)
+
+        segments = self.get_segments()
+        self._active_segment = segments[-1] if segments else 1
+        # New entries must start on their own line, not continue the one a crash tore
+        self._truncate_torn_tail(self._segment_path(self._active_segment))
+        self._active_file = open(self._segment_path(self._active_segment), "a", encoding="utf-8")
+
+    @property
+    def active_segment(self) -> int:
+        return self._active_segment
+
+    def append(self, entries: list[list]) -> int:
+        lines = "".join(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n" for entry in entries)
+        with self._lock:
+            self._active_file.write(lines)
+            self._active_file.flush()
+            if self.sync:
+                os.fsync(self._active_file.fileno())
+            return self._active_file.tell()
+
+    def rotate(self) -> int:
+        with self._lock:
+            sealed_segment = self._active_segment
+            self._active_file.close()
+            self._active_segment += 1
+            self._active_file = open(self._segment_path(self._active_segment), "a", encoding="utf-8")
+            return sealed_segment
+
+    def read_entries(self, after_segment: int, up_to_segment: int | None = None) -> Iterator[list]:
+        for segment in self.get_segments():
+            if segment <= after_segment or (up_to_segment is not None and segment > up_to_segment):
+                continue
+
+            with open(self._segment_path(segment), "r", encoding="utf-8") as file:
+                for line in file:
+                    if not line.endswith("\n"):
+                        # A torn last line after a crash, the write was never acknowledged
+                        break
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # A damaged line loses only its own entry, the ones after it are still replayed
+                        continue
+
+    def get_segments(self) -> list[int]:
+        segments = []
+        for file_name in os.listdir(self.base_dir):
+            match = self.SEGMENT_PATTERN.match(file_name)
+            if match:
+                segments.append(int(match.group(1)))
+        return sorted(segments)
+
+    def load_checkpoint(self) -> tuple[int, dict[str, tuple]]:
+        path = os.path.join(self.base_dir, self.CHECKPOINT_NAME)
+        if not os.path.exists(path):
+            return 0, {}
+
+        with open(path, "rb") as file:
+            checkpoint = pickle.load(file)
+        return checkpoint["segment"], checkpoint["records"]
+
+    def save_checkpoint(self, segment: int, records: dict[str, tuple]) -> None:
+        path = os.path.join(self.base_dir, self.CHECKPOINT_NAME)
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as file:
+            pickle.dump({"segment": segment, "records": records}, file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+
+    def delete_segments(self, up_to_segment: int) -> None:
+        for segment in self.get_segments():
+            if segment <= up_to_segment and segment != self._active_segment:
+                os.remove(self._segment_path(segment))
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._active_file.closed:
+                self._active_file.close()
+
+    @staticmethod
+    def _truncate_torn_tail(path: str) -> None:
+        if not os.path.exists(path):
+            return
+
+        with open(path, "rb+") as file:
+            size = file.seek(0, os.SEEK_END)
+            end = size
+            # Read back in blocks until the last newline, a torn line is at most one batch of entries
+            while end > 0:
+                start = max(0, end - 64 * 1024)
+                file.seek(start)
+                block = file.read(end - start)
+                newline = block.rfind(b"\n")
+                if newline != -1:
+                    end = start + newline + 1
+                    break
+                end = start
+            if end != size:
+                file.truncate(end)
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.base_dir, f"journal_{segment:06d}.log")
@@ -1,56 +1,135 @@
+import importlib
 import os
 import pickle
 from typing import Generic, TypeVar
 
+from DAL.Entities.SnapshotDelta import SnapshotDelta
+from DAL.Entities.SnapshotInfo import SnapshotInfo
+from DAL.Exceptions.InvalidException import InvalidException
 from DAL.FileManagers.IFileManager import IFileManager
+from DAL.FileManagers.SnapshotManifest.SnapshotManifest import SnapshotManifest
 
 T = TypeVar("T")
 
 
 class PickleFileManager(IFileManager[T], Generic[T]):
-    def __init__(self, base_dir: str = "data"):
+    FILE_EXTENSION = ".pkl"
+    # Codec -> module with an open() like the built-in one, compression modules are imported on first use
+    CODECS = {
+        "none": None,
+        "gzip": "gzip",
+        "bz2": "bz2",
+        "lzma": "lzma",
+    }
+    # Compressed files are recognised by their header, so every snapshot keeps the .pkl extension
+    # and files written before compression support load as plain pickles.
+    MAGIC_BYTES = {
+        b"\x1f\x8b": "gzip",
+        b"BZh": "bz2",
+        b"\xfd7zXZ\x00": "lzma",
+    }
+
+    def __init__(self, base_dir: str = "data", codec: str = "none", manifest: SnapshotManifest | None = None):
+        self.validate_codec(codec)
         self.base_dir = base_dir
+        self.codec = codec
         os.makedirs(base_dir, exist_ok=True)
+        self.manifest = manifest or SnapshotManifest(base_dir, {self.FILE_EXTENSION: self.read_parent})
 
-    def save(self, obj: T, name: str) -> None:
+    def save(self, obj: T, name: str, codec: str | None = None) -> str:
+        codec = codec or self.codec
+        self.validate_codec(codec)
         filename = str(name)
         filepath = self._generate_unique_filename(filename)
-        with open(filepath, "wb") as file:
-            pickle.dump(obj, file)
+        temp_path = filepath + ".tmp"
+        try:
+            with self.open_file(temp_path, "wb", codec) as file:
+                pickle.dump(obj, file)
+        except Exception:
+            os.remove(temp_path)
+            raise
+        os.replace(temp_path, filepath)
+        self.manifest.record(filepath, obj)
+        return os.path.basename(filepath)
 
 
     def load(self, name: str) -> T:
         filepath = self._normalize_name(name)
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"File '{filepath}' not found")
-        with open(filepath, "rb") as file:
+        with self.open_file(filepath, "rb", self.detect_codec(filepath)) as file:
             return pickle.load(file)
 
+    @classmethod
+    def detect_codec(cls, filepath: str) -> str:
+        with open(filepath, "rb") as file:
+            header = file.read(max(len(magic) for magic in cls.MAGIC_BYTES))
+
+        for magic, codec in cls.MAGIC_BYTES.items():
+            if header.startswith(magic):
+                return codec
+        return "none"
+
+    @classmethod
+    def read_parent(cls, filepath: str) -> str | None:
+        # A pickle has no header, the whole snapshot is read; only manifest rebuilds need this
+        with cls.open_file(filepath, "rb", cls.detect_codec(filepath)) as file:
+            snapshot = pickle.load(file)
+        return snapshot.parent if isinstance(snapshot, SnapshotDelta) else None
+
 
     def delete(self, name: str) -> None:
         filepath = self._normalize_name(name)
         if os.path.exists(filepath):
             os.remove(filepath)
+        self.manifest.remove(os.path.basename(filepath))
 
 
     def get_all_names(self) -> list[str]:
-        return [f for f in os.listdir(self.base_dir) if f.endswith(".pkl")]
+        return [info.name for info in self.get_snapshots()]
+
+
+    def get_snapshots(self) -> list[SnapshotInfo]:
+        return self.manifest.get_all(self.FILE_EXTENSION)
+
+
+    def get_latest_name(self) -> str | None:
+        latest = self.manifest.latest(self.FILE_EXTENSION)
+        return latest.name if latest else None
 
 
     def has_file_with_name(self, name: str) -> bool:
-            return os.path.exists(self._normalize_name(name))
+        filepath = self._normalize_name(name)
+        if os.path.exists(filepath):
+            return True
+        # Listings trust the manifest, a file removed outside the bot leaves it once it is asked for
+        self.manifest.remove(os.path.basename(filepath))
+        return False
 
 
     def _normalize_name(self, name: str) -> str:
             base, ext = os.path.splitext(name)
             if not ext:
-                ext = ".pkl"
+                ext = self.FILE_EXTENSION
             return os.path.join(self.base_dir, base + ext)
 
+    @classmethod
+    def validate_codec(cls, codec: str) -> None:
+        if codec not in cls.CODECS:
+            raise InvalidException(f"Unknown codec '{codec}'. Available codecs: {', '.join(cls.CODECS)}")
+
+    @classmethod
+    def open_file(cls, filepath: str, mode: str, codec: str = "none", **kwargs):
+        cls.validate_codec(codec)
+        module_name = cls.CODECS[codec]
+        opener = open if module_name is None else importlib.import_module(module_name).open
+        return opener(filepath, mode, **kwargs)
+
     def _generate_unique_filename(self, name: str) -> str:
         full_path = self._normalize_name(name)
         counter = 1
-        while os.path.exists(full_path):
+        # The manifest answers for known snapshots, the existence check guards files it does not list
+        while os.path.basename(full_path) in self.manifest or os.path.exists(full_path):
             base, ext = os.path.splitext(name)
             full_path = os.path.join(self.base_dir, f"{base}_{counter}{ext}")
             counter += 1
@@ -0,0 +1,155 @@
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Callable
+
+from DAL.Entities.SnapshotDelta import SnapshotDelta
+from DAL.Entities.SnapshotInfo import SnapshotInfo
+
+
+class SnapshotManifest:
+    # Catalog of the snapshot files in a directory, ordered by creation time, so listing and finding
+    # the latest snapshot do not scan the directory or touch files. A file removed outside the file managers
+    # is forgotten when it is asked for by name (see remove). File managers sharing a directory
+    # should share one manifest; changes made by other instances are picked up through the file's mtime.
+    FILE_NAME = "manifest.json"
+    # Version 1 rebuilds catalogued deltas as full snapshots, such manifests are rebuilt again
+    VERSION = 2
+    SNAPSHOT_EXTENSIONS = (".pkl", ".abk", ".cas")
+
+    def __init__(self, base_dir: str, parent_readers: dict[str, Callable[[str], str | None]] | None = None):
+        self.base_dir = base_dir
+        self.path = os.path.join(base_dir, self.FILE_NAME)
+        # File extension -> reader of the parent name a snapshot file was written on top of (None for full ones),
+        # a rebuild uses them to restore the delta chains
+        self.parent_readers = parent_readers or {}
+        self._lock = threading.RLock()
+        self._entries: dict[str, SnapshotInfo] = {}
+        self._loaded_stamp: tuple[int, int] | None = None
+        os.makedirs(base_dir, exist_ok=True)
+        self._refresh()
+
+    def record(self, filepath: str, snapshot: object) -> SnapshotInfo:
+        if isinstance(snapshot, SnapshotDelta):
+            record_count, parent = len(snapshot.upserts), snapshot.parent
+        else:
+            record_count, parent = (len(snapshot) if isinstance(snapshot, dict) else None), None
+
+        info = SnapshotInfo(
+            name=os.path.basename(filepath),
+            created_at=datetime.now(),
+            size=os.path.getsize(filepath),
+            record_count=record_count,
+            checksum=self.checksum(filepath),
+            parent=parent,
+        )
+        with self._lock:
+            self._refresh()
+            # Re-saving a name moves it to the end, the order stays the order of creation
+            self._entries.pop(info.name, None)
+            self._entries[info.name] = info
+            self._write()
+        return info
+
+    def remove(self, name: str) -> None:
+        with self._lock:
+            self._refresh()
+            if self._entries.pop(name, None) is not None:
+                self._write()
+
+    def get(self, name: str) -> SnapshotInfo | None:
+        with self._lock:
+            self._refresh()
+            return self._entries.get(name)
+
+    def get_all(self, extension: str | None = None) -> list[SnapshotInfo]:
+        with self._lock:
+            self._refresh()
+            return [info for info in self._entries.values() if extension is None or info.name.endswith(extension)]
+
+    def latest(self, extension: str | None = None) -> SnapshotInfo | None:
+        with self._lock:
+            self._refresh()
+            for name in reversed(list(self._entries)):
+                if extension is None or name.endswith(extension):
+                    return self._entries[name]
+            return None
+
+    def rebuild(self) -> None:
+        # Catalogs a directory written before the manifest existed, record counts stay unknown
+        with self._lock:
+            names = [name for name in os.listdir(self.base_dir) if name.endswith(self.SNAPSHOT_EXTENSIONS)]
+            paths = {name: os.path.join(self.base_dir, name) for name in names}
+            names.sort(key=lambda name: (os.path.getmtime(paths[name]), name))
+
+            self._entries = {}
+            for name in names:
+                parent, parent_known = self._read_parent(paths[name])
+                self._entries[name] = SnapshotInfo(
+                    name=name,
+                    created_at=datetime.fromtimestamp(os.path.getmtime(paths[name])),
+                    size=os.path.getsize(paths[name]),
+                    checksum=self.checksum(paths[name]),
+                    parent=parent,
+                    parent_known=parent_known,
+                )
+            self._write()
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    @staticmethod
+    def checksum(filepath: str) -> str:
+        # Only saves and rebuilds hash files, hashlib stays out of the startup path
+        import hashlib
+
+        digest = hashlib.sha256()
+        with open(filepath, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _refresh(self) -> None:
+        stamp = self._stamp()
+        if stamp is not None and stamp == self._loaded_stamp:
+            return
+
+        if stamp is None:
+            self.rebuild()
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            if data.get("version") != self.VERSION:
+                raise ValueError(f"Unsupported manifest version {data.get('version')}")
+            self._entries = {entry["name"]: SnapshotInfo.from_dict(entry) for entry in data["snapshots"]}
+            self._loaded_stamp = stamp
+        except (OSError, ValueError, KeyError, TypeError):
+            self.rebuild()
+
+    def _read_parent(self, filepath: str) -> tuple[str | None, bool]:
+        # A file that cannot be read is catalogued with an unknown parent, retention keeps everything it may depend on
+        reader = self.parent_readers.get(os.path.splitext(filepath)[1])
+        if reader is None:
+            return None, False
+        try:
+            return reader(filepath), True
+        except Exception:
+            return None, False
+
+    def _write(self) -> None:
+        data = {"version": self.VERSION, "snapshots": [info.to_dict() for info in self._entries.values()]}
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, indent=1)
+        os.replace(temp_path, self.path)
+        self._loaded_stamp = self._stamp()
+
+    def _stamp(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
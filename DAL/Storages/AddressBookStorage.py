@@ -1,38 +1,145 @@
+import threading
 from collections import UserDict
-from typing import Callable
+from typing import Callable, Iterable, Iterator
 
 from DAL.Entities.Record import Record
+from DAL.Entities.StorageChange import StorageChange
 from DAL.Exceptions.InvalidException import InvalidException
+from DAL.Storages.IObservableStorage import IObservableStorage, StorageListener
+from DAL.Storages.IRecordStorage import IRecordStorage
 from DAL.Storages.ISerializableStorage import ISerializableStorage
-from DAL.Storages.IStorage import IStorage
+from DAL.Storages.Predicates.BirthdayWindowPredicate import BirthdayWindowPredicate
+from DAL.Storages.SortedNameIndex import SortedNameIndex
 
 
-class AddressBookStorage(UserDict, IStorage[str, Record], ISerializableStorage[dict[str, Record]]):
+class AddressBookStorage(UserDict, IRecordStorage, ISerializableStorage[dict[str, Record]], IObservableStorage):
 
     def __init__(self):
+        self._phone_index: dict[str, set[str]] = {}
+        self._indexed_phones: dict[str, tuple[str, ...]] = {}
+        self._birthday_index: dict[tuple[int, int], set[str]] = {}
+        self._indexed_birthdays: dict[str, tuple[int, int]] = {}
+        self._name_index = SortedNameIndex()
+        self._listeners: list[StorageListener] = []
+        self._generation = 0
+        self._dirty_keys: set[str] | None = set()
+        # Held by every change, so a background save sees the book between commands, never halfway through one
+        self._lock = threading.RLock()
         super().__init__()
 
+    def __setitem__(self, record_name: str, record: Record) -> None:
+        self.update_item(record_name, record)
+
+    def __delitem__(self, record_name: str) -> None:
+        if record_name not in self.data:
+            raise KeyError(record_name)
+        self.delete(record_name)
+
     def add(self, record: Record) -> Record:
-        self.data[record.name.value] = record
+        with self._lock:
+            if record.name.value not in self.data:
+                self._name_index.add(record.name.value)
+            self.data[record.name.value] = record
+            self._reindex(record.name.value, record)
+            self._notify([StorageChange(StorageChange.UPSERT, record.name.value, record)])
         return record
 
+    def add_many(self, records: Iterable[Record]) -> int:
+        # One notification for the whole batch: one journal write and one autosave wake-up
+        with self._lock:
+            changes = []
+            new_names = []
+            for record in records:
+                if record.name.value not in self.data:
+                    new_names.append(record.name.value)
+                self.data[record.name.value] = record
+                self._reindex(record.name.value, record)
+                changes.append(StorageChange(StorageChange.UPSERT, record.name.value, record))
+
+            self._name_index.add_many(new_names)
+            if changes:
+                self._notify(changes)
+        return len(changes)
+
     def update_item(self, record_name: str, new_record: Record) -> Record:
-        self.data[record_name] = new_record
+        with self._lock:
+            if record_name not in self.data:
+                self._name_index.add(record_name)
+            self.data[record_name] = new_record
+            self._reindex(record_name, new_record)
+            self._notify([StorageChange(StorageChange.UPSERT, record_name, new_record)])
         return new_record
 
+    def apply_changes(self, upserts: dict[str, Record], deletes: Iterable[str]) -> int:
+        # Under one lock and one notification, a save or a reader sees all of the changes or none
+        with self._lock:
+            changes = []
+            for record_name in deletes:
+                if self.data.pop(record_name, None) is not None:
+                    self._name_index.remove(record_name)
+                    self._reindex(record_name, None)
+                    changes.append(StorageChange(StorageChange.DELETE, record_name))
+
+            new_names = []
+            for record_name, record in upserts.items():
+                if record_name not in self.data:
+                    new_names.append(record_name)
+                self.data[record_name] = record
+                self._reindex(record_name, record)
+                changes.append(StorageChange(StorageChange.UPSERT, record_name, record))
+
+            self._name_index.add_many(new_names)
+            if changes:
+                self._notify(changes)
+        return len(changes)
+
     def find(self, record_name: str) -> Record | None:
         return self.data.get(record_name)
 
+    def find_by_phone(self, phone: str) -> list[Record]:
+        names = self._phone_index.get(phone, ())
+        records = (self.data.get(name) for name in sorted(names))
+        return [record for record in records if record is not None and record.has_phone(phone)]
+
+    def find_by_birthday(self, month: int, day: int) -> list[Record]:
+        names = self._birthday_index.get((month, day), ())
+        records = (self.data.get(name) for name in sorted(names))
+        return [
+            record for record in records
+            if record is not None and record.birthday is not None
+            and (record.birthday.value.month, record.birthday.value.day) == (month, day)
+        ]
+
+    def find_names_by_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        return self._name_index.find_by_prefix(prefix, limit)
+
+    def find_names_after(self, name: str | None, limit: int) -> list[str]:
+        return self._name_index.find_after(name, limit)
+
     def all_values(self) -> list[Record]:
         return list(self.data.values())
 
+    def iter_snapshot(self) -> Iterator[Record]:
+        # The records as of this call; builders change copies, never a stored record,
+        # so holding the references taken under the lock is enough
+        with self._lock:
+            records = list(self.data.values())
+        yield from records
+
     def delete(self, record_name: str) -> None:
-        self.data.pop(record_name, None)
+        with self._lock:
+            if self.data.pop(record_name, None) is not None:
+                self._name_index.remove(record_name)
+                self._reindex(record_name, None)
+                self._notify([StorageChange(StorageChange.DELETE, record_name)])
 
     def has(self, record_name: str) -> bool:
         return record_name in self.data
 
     def filter(self, predicate: Callable[[Record], bool]) -> list[Record]:
+        if isinstance(predicate, BirthdayWindowPredicate):
+            # A window covers a few days, the birthday index answers it without visiting every record
+            return [record for month, day in sorted(predicate.keys) for record in self.find_by_birthday(month, day)]
         return [record for record in self.data.values() if predicate(record)]
 
     def export_state(self) -> dict[str, Record]:
@@ -42,6 +149,84 @@ class AddressBookStorage(UserDict, IStorage[str, Record], ISerializableStorage[d
         if not isinstance(state, dict):
             raise InvalidException(f"Invalid state type: expected dict[str, Record], got {type(state).__name__}")
 
-        self.data = state
+        with self._lock:
+            self.data = state
+            self._rebuild_indexes()
+            self._notify([StorageChange(StorageChange.RESET)])
+
+    def is_empty(self) -> bool:
+        return not self.data
+
+    def get_generation(self) -> int:
+        return self._generation
+
+    def get_dirty_keys(self) -> set[str] | None:
+        # None means the whole state was replaced and has to be written in full
+        return None if self._dirty_keys is None else set(self._dirty_keys)
+
+    def mark_clean(self) -> None:
+        self._dirty_keys = set()
+
+    def get_lock(self) -> threading.RLock:
+        return self._lock
+
+    def add_listener(self, listener: StorageListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: StorageListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, changes: list[StorageChange]) -> None:
+        self._generation += 1
+        for change in changes:
+            if change.operation == StorageChange.RESET:
+                self._dirty_keys = None
+            elif self._dirty_keys is not None:
+                self._dirty_keys.add(change.record_name)
+
+        for listener in self._listeners:
+            listener(changes)
+
+    def _rebuild_indexes(self) -> None:
+        self._phone_index = {}
+        self._indexed_phones = {}
+        self._birthday_index = {}
+        self._indexed_birthdays = {}
+        self._name_index = SortedNameIndex(self.data)
+        for record_name, record in self.data.items():
+            self._reindex(record_name, record)
+
+    def _reindex(self, record_name: str, record: Record | None) -> None:
+        # The previous keys are taken from what was indexed for this name,
+        # the record stored before may already be replaced.
+        for phone in self._indexed_phones.pop(record_name, ()):
+            self._unindex(self._phone_index, phone, record_name)
+
+        birthday_key = self._indexed_birthdays.pop(record_name, None)
+        if birthday_key is not None:
+            self._unindex(self._birthday_index, birthday_key, record_name)
+
+        if record is None:
+            return
+
+        phones = tuple(p.value for p in record.phones)
+        self._indexed_phones[record_name] = phones
+        for phone in phones:
+            self._phone_index.setdefault(phone, set()).add(record_name)
+
+        if record.birthday is not None:
+            birthday_key = (record.birthday.value.month, record.birthday.value.day)
+            self._indexed_birthdays[record_name] = birthday_key
+            self._birthday_index.setdefault(birthday_key, set()).add(record_name)
+
+    @staticmethod
+    def _unindex(index: dict, key, record_name: str) -> None:
+        owners = index.get(key)
+        if owners is None:
+            return
+        owners.discard(record_name)
+        if not owners:
+            del index[key]
 
 
@@ -0,0 +1,344 @@
+import sys
+import threading
+from datetime import date
+from typing import Callable, Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, only this storage needs it
+    np = None
+
+from DAL.Entities.Record import Record
+from DAL.Exceptions.InvalidException import InvalidException
+from DAL.Storages.IRecordStorage import IRecordStorage
+from DAL.Storages.ISerializableStorage import ISerializableStorage
+from DAL.Storages.Predicates.BirthdayWindowPredicate import BirthdayWindowPredicate
+from DAL.Storages.Predicates.PhonePrefixPredicate import PhonePrefixPredicate
+from DAL.Storages.SortedNameIndex import SortedNameIndex
+
+
+class _Column:
+    # Append-only numpy array with amortized O(1) growth
+    def __init__(self, dtype, values=()):
+        values = np.asarray(values, dtype=dtype)
+        self._data = np.zeros(max(16, len(values)), dtype=dtype)
+        self._data[:len(values)] = values
+        self.size = len(values)
+
+    @property
+    def values(self):
+        return self._data[:self.size]
+
+    def append(self, value) -> None:
+        self.extend([value])
+
+    def extend(self, values) -> None:
+        values = np.asarray(values, dtype=self._data.dtype)
+        required = self.size + len(values)
+        if required > len(self._data):
+            grown = np.zeros(max(required, 2 * len(self._data)), dtype=self._data.dtype)
+            grown[:self.size] = self.values
+            self._data = grown
+        self._data[self.size:required] = values
+        self.size = required
+
+
+class ColumnarAddressBookStorage(IRecordStorage, ISerializableStorage[dict[str, Record]]):
+    # Rows are never updated in place: a change appends a new row and marks the old one dead,
+    # dead rows are dropped once they outnumber the live ones.
+    COMPACTION_MIN_DEAD_ROWS = 1024
+
+    def __init__(self):
+        if np is None:
+            raise InvalidException("Columnar storage requires numpy. Install it with 'pip install numpy'")
+
+        self._generation = 0
+        self._dirty_keys: set[str] | None = set()
+        self._lock = threading.RLock()
+        self._reset_columns()
+
+    def add(self, record: Record) -> Record:
+        self._write(record.name.value, record)
+        return record
+
+    def add_many(self, records: Iterable[Record]) -> int:
+        count = 0
+        new_names = []
+        with self._lock:
+            try:
+                for record in records:
+                    self._write(record.name.value, record, new_names=new_names)
+                    count += 1
+            finally:
+                # The rows written before a failing record stay, so must their names
+                self._name_index.add_many(new_names)
+        return count
+
+    def apply_changes(self, upserts: dict[str, Record], deletes: Iterable[str]) -> int:
+        # Every phone is encoded first, a record that cannot be stored leaves the whole batch unapplied
+        encoded = {record_name: self._encode_phones(record) for record_name, record in upserts.items()}
+        count = 0
+        new_names = []
+        with self._lock:
+            for record_name in deletes:
+                if record_name in self._row_by_name:
+                    self.delete(record_name)
+                    count += 1
+            for record_name, record in upserts.items():
+                self._write(record_name, record, encoded[record_name], new_names)
+                count += 1
+            self._name_index.add_many(new_names)
+        return count
+
+    def update_item(self, record_name: str, new_record: Record) -> Record:
+        self._write(record_name, new_record)
+        return new_record
+
+    def find(self, record_name: str) -> Record | None:
+        row = self._row_by_name.get(record_name)
+        return None if row is None else self._materialize(row)
+
+    def find_by_phone(self, phone: str) -> list[Record]:
+        encoded = self._encode_phone(phone)
+        if encoded is None:
+            return []
+
+        value, digits, plus = encoded
+        mask = (
+            (self._phone_values.values == value)
+            & (self._phone_digits.values == digits)
+            & (self._phone_plus.values == plus)
+        )
+        return self._materialize_sorted(self._live_rows_of_phones(mask))
+
+    def find_by_birthday(self, month: int, day: int) -> list[Record]:
+        mask = (self._birthday_keys.values == month * 100 + day) & self._alive.values
+        return self._materialize_sorted(np.nonzero(mask)[0])
+
+    def find_names_by_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        return self._name_index.find_by_prefix(prefix, limit)
+
+    def find_names_after(self, name: str | None, limit: int) -> list[str]:
+        return self._name_index.find_after(name, limit)
+
+    def all_values(self) -> list[Record]:
+        return list(self.iter_values())
+
+    def iter_values(self) -> Iterator[Record]:
+        for row in np.nonzero(self._alive.values)[0].tolist():
+            yield self._materialize(row)
+
+    def iter_snapshot(self) -> Iterator[Record]:
+        # Compaction renumbers rows, so the rows are materialized while the lock is held
+        with self._lock:
+            records = list(self.iter_values())
+        yield from records
+
+    def delete(self, record_name: str) -> None:
+        with self._lock:
+            row = self._row_by_name.pop(record_name, None)
+            if row is None:
+                return
+
+            self._kill_row(row)
+            self._name_index.remove(record_name)
+            self._track(record_name)
+            self._compact_if_needed()
+
+    def has(self, record_name: str) -> bool:
+        return record_name in self._row_by_name
+
+    def filter(self, predicate: Callable[[Record], bool]) -> list[Record]:
+        if isinstance(predicate, BirthdayWindowPredicate):
+            rows = self._birthday_window_rows(predicate)
+        elif isinstance(predicate, PhonePrefixPredicate):
+            rows = self._phone_prefix_rows(predicate.prefix)
+        else:
+            return [record for record in self.iter_values() if predicate(record)]
+
+        return [self._materialize(row) for row in rows.tolist()]
+
+    def export_state(self) -> dict[str, Record]:
+        return {record.name.value: record for record in self.iter_values()}
+
+    def import_state(self, state: dict[str, Record]) -> None:
+        if not isinstance(state, dict):
+            raise InvalidException(f"Invalid state type: expected dict[str, Record], got {type(state).__name__}")
+
+        encoded = {record_name: self._encode_phones(record) for record_name, record in state.items()}
+        with self._lock:
+            self._reset_columns()
+            for record_name, record in state.items():
+                self._append_row(record_name, record, encoded[record_name])
+            self._name_index = SortedNameIndex(self._row_by_name)
+            self._generation += 1
+            self._dirty_keys = None
+
+    def is_empty(self) -> bool:
+        return not self._row_by_name
+
+    def get_generation(self) -> int:
+        return self._generation
+
+    def get_dirty_keys(self) -> set[str] | None:
+        return None if self._dirty_keys is None else set(self._dirty_keys)
+
+    def mark_clean(self) -> None:
+        self._dirty_keys = set()
+
+    def get_lock(self) -> threading.RLock:
+        return self._lock
+
+    def _birthday_window_rows(self, predicate: BirthdayWindowPredicate):
+        keys = np.array([month * 100 + day for month, day in predicate.keys], dtype=np.int16)
+        return np.nonzero(np.isin(self._birthday_keys.values, keys) & self._alive.values)[0]
+
+    def _phone_prefix_rows(self, prefix: str):
+        want_plus = prefix.startswith("+")
+        digits_prefix = prefix[1:] if want_plus else prefix
+
+        if not prefix:
+            mask = np.ones(self._phone_values.size, dtype=np.bool_)
+        elif digits_prefix and not (digits_prefix.isascii() and digits_prefix.isdigit()):
+            return np.empty(0, dtype=np.int64)
+        else:
+            mask = self._phone_plus.values == want_plus
+            if digits_prefix:
+                # The first len(prefix) digits of a phone are value // 10 ** (digits - len(prefix))
+                length = len(digits_prefix)
+                digits = self._phone_digits.values.astype(np.int64)
+                leading = self._phone_values.values // np.power(10, np.clip(digits - length, 0, None))
+                mask &= (digits >= length) & (leading == int(digits_prefix))
+
+        return self._live_rows_of_phones(mask)
+
+    def _live_rows_of_phones(self, phone_mask):
+        rows = np.unique(self._phone_rows.values[phone_mask])
+        return rows[self._alive.values[rows]]
+
+    def _materialize_sorted(self, rows) -> list[Record]:
+        return [self._materialize(row) for row in sorted(rows.tolist(), key=self._names.__getitem__)]
+
+    def _materialize(self, row: int) -> Record:
+        offsets = self._phone_offsets.values
+        start, end = int(offsets[row]), int(offsets[row + 1])
+        phones = [
+            self._decode_phone(value, digits, plus)
+            for value, digits, plus in zip(
+                self._phone_values.values[start:end].tolist(),
+                self._phone_digits.values[start:end].tolist(),
+                self._phone_plus.values[start:end].tolist(),
+            )
+        ]
+        ordinal = int(self._birthdays.values[row])
+        # Columns hold values that were validated on the way in, reads skip the parsing
+        return Record.from_normalized(self._names[row], phones, date.fromordinal(ordinal) if ordinal else None)
+
+    def _write(
+        self,
+        record_name: str,
+        record: Record,
+        encoded: list[tuple[int, int, bool]] | None = None,
+        new_names: list[str] | None = None,
+    ) -> None:
+        # Phones are encoded before any column changes, so a failure cannot leave the columns out of step
+        if encoded is None:
+            encoded = self._encode_phones(record)
+        with self._lock:
+            row = self._row_by_name.get(record_name)
+            if row is None and new_names is not None:
+                # A batch collects its new names and adds them to the index at once
+                new_names.append(record_name)
+            elif row is None:
+                self._name_index.add(record_name)
+            else:
+                self._kill_row(row)
+
+            self._append_row(record_name, record, encoded)
+            self._track(record_name)
+            self._compact_if_needed()
+
+    def _append_row(self, record_name: str, record: Record, encoded: list[tuple[int, int, bool]]) -> None:
+        row = len(self._names)
+        record_name = sys.intern(record_name)
+        self._names.append(record_name)
+        self._row_by_name[record_name] = row
+        self._alive.append(True)
+
+        birthday = record.birthday.value if record.birthday else None
+        self._birthdays.append(birthday.toordinal() if birthday else 0)
+        self._birthday_keys.append(birthday.month * 100 + birthday.day if birthday else 0)
+
+        self._phone_rows.extend([row] * len(encoded))
+        self._phone_values.extend([value for value, _, _ in encoded])
+        self._phone_digits.extend([digits for _, digits, _ in encoded])
+        self._phone_plus.extend([plus for _, _, plus in encoded])
+        self._phone_offsets.append(self._phone_values.size)
+
+    def _kill_row(self, row: int) -> None:
+        self._alive.values[row] = False
+        self._dead_rows += 1
+
+    def _compact_if_needed(self) -> None:
+        live_rows = len(self._row_by_name)
+        if self._dead_rows < self.COMPACTION_MIN_DEAD_ROWS or self._dead_rows <= live_rows:
+            return
+
+        rows = np.nonzero(self._alive.values)[0]
+        new_row_of = np.full(len(self._names), -1, dtype=np.int64)
+        new_row_of[rows] = np.arange(len(rows))
+        phone_mask = self._alive.values[self._phone_rows.values]
+        phone_counts = np.diff(self._phone_offsets.values)[rows]
+
+        self._names = [self._names[row] for row in rows.tolist()]
+        self._row_by_name = {name: row for row, name in enumerate(self._names)}
+        self._alive = _Column(np.bool_, np.ones(len(rows), dtype=np.bool_))
+        self._birthdays = _Column(np.int32, self._birthdays.values[rows])
+        self._birthday_keys = _Column(np.int16, self._birthday_keys.values[rows])
+        self._phone_rows = _Column(np.int64, new_row_of[self._phone_rows.values[phone_mask]])
+        self._phone_values = _Column(np.int64, self._phone_values.values[phone_mask])
+        self._phone_digits = _Column(np.uint8, self._phone_digits.values[phone_mask])
+        self._phone_plus = _Column(np.bool_, self._phone_plus.values[phone_mask])
+        self._phone_offsets = _Column(np.int64, np.concatenate(([0], np.cumsum(phone_counts))))
+        self._dead_rows = 0
+
+    def _reset_columns(self) -> None:
+        self._names: list[str] = []
+        self._row_by_name: dict[str, int] = {}
+        self._name_index = SortedNameIndex()
+        self._alive = _Column(np.bool_)
+        self._birthdays = _Column(np.int32)  # date ordinal, 0 when there is no birthday
+        self._birthday_keys = _Column(np.int16)  # month * 100 + day, 0 when there is no birthday
+        self._phone_offsets = _Column(np.int64, [0])  # phones of row i are [offsets[i], offsets[i + 1])
+        self._phone_rows = _Column(np.int64)
+        self._phone_values = _Column(np.int64)
+        self._phone_digits = _Column(np.uint8)  # digit count, keeps leading zeros
+        self._phone_plus = _Column(np.bool_)
+        self._dead_rows = 0
+
+    def _track(self, record_name: str) -> None:
+        self._generation += 1
+        if self._dirty_keys is not None:
+            self._dirty_keys.add(record_name)
+
+    @classmethod
+    def _encode_phones(cls, record: Record) -> list[tuple[int, int, bool]]:
+        encoded = []
+        for phone in record.phones:
+            value = cls._encode_phone(phone.value)
+            if value is None:
+                raise InvalidException(f"Phone '{phone.value}' cannot be stored in the columnar storage")
+            encoded.append(value)
+        return encoded
+
+    @staticmethod
+    def _encode_phone(phone: str) -> tuple[int, int, bool] | None:
+        plus = phone.startswith("+")
+        digits = phone[1:] if plus else phone
+        if not digits or not (digits.isascii() and digits.isdigit()) or len(digits) > 18:
+            return None
+        return int(digits), len(digits), plus
+
+    @staticmethod
+    def _decode_phone(value: int, digits: int, plus: bool) -> str:
+        return ("+" if plus else "") + str(value).zfill(digits)
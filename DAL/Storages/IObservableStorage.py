@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from DAL.Entities.StorageChange import StorageChange
+
+StorageListener = Callable[[list[StorageChange]], None]
+
+
+class IObservableStorage(ABC):
+    @abstractmethod
+    def add_listener(self, listener: StorageListener) -> None:
+        pass
+
+    @abstractmethod
+    def remove_listener(self, listener: StorageListener) -> None:
+        pass
@@ -0,0 +1,27 @@
+from abc import abstractmethod
+from typing import Iterator
+
+from DAL.Entities.Record import Record
+from DAL.Storages.IStorage import IStorage
+
+
+class IRecordStorage(IStorage[str, Record]):
+    @abstractmethod
+    def find_by_phone(self, phone: str) -> list[Record]:
+        pass
+
+    @abstractmethod
+    def find_by_birthday(self, month: int, day: int) -> list[Record]:
+        pass
+
+    @abstractmethod
+    def find_names_by_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        pass
+
+    @abstractmethod
+    def find_names_after(self, name: str | None, limit: int) -> list[str]:
+        pass
+
+    @abstractmethod
+    def iter_snapshot(self) -> Iterator[Record]:
+        pass
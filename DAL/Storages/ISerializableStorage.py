@@ -1,3 +1,4 @@
+import threading
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
@@ -12,3 +13,23 @@ class ISerializableStorage(ABC, Generic[T]):
     @abstractmethod
     def import_state(self, state: T) -> None:
         pass
+
+    @abstractmethod
+    def is_empty(self) -> bool:
+        pass
+
+    @abstractmethod
+    def get_generation(self) -> int:
+        pass
+
+    @abstractmethod
+    def get_dirty_keys(self) -> set[str] | None:
+        pass
+
+    @abstractmethod
+    def mark_clean(self) -> None:
+        pass
+
+    @abstractmethod
+    def get_lock(self) -> threading.RLock:
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Callable
+from typing import TypeVar, Generic, Callable, Iterable
 
 T = TypeVar("T")
 K = TypeVar("K")
@@ -9,10 +9,18 @@ class IStorage(ABC, Generic[K, T]):
     def add(self, item: T) -> T:
         pass
 
+    @abstractmethod
+    def add_many(self, items: Iterable[T]) -> int:
+        pass
+
     @abstractmethod
     def update_item(self, key: K, item: T) -> T:
         pass
 
+    @abstractmethod
+    def apply_changes(self, upserts: dict[K, T], deletes: Iterable[K]) -> int:
+        pass
+
     @abstractmethod
     def find(self, key: str) -> T | None:
         pass
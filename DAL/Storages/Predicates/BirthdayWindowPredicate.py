@@ -0,0 +1,21 @@
+from datetime import date, timedelta
+
+from BLL.Helpers.DateHelper import DateHelper
+from DAL.Entities.Record import Record
+
+
+class BirthdayWindowPredicate:
+    # Matches records whose birthday is celebrated between start and end (inclusive), ignoring the year
+    def __init__(self, start: date, end: date):
+        self.start = start
+        self.end = end
+        self.keys: frozenset[tuple[int, int]] = frozenset(
+            key
+            for offset in range((end - start).days + 1)
+            for key in DateHelper.get_birthday_keys(start + timedelta(days=offset))
+        )
+
+    def __call__(self, record: Record) -> bool:
+        if record.birthday is None:
+            return False
+        return (record.birthday.value.month, record.birthday.value.day) in self.keys
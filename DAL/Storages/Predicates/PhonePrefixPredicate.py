@@ -0,0 +1,10 @@
+from DAL.Entities.Record import Record
+
+
+class PhonePrefixPredicate:
+    # Matches records with at least one phone starting with the prefix, e.g. a country code '+380'
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+
+    def __call__(self, record: Record) -> bool:
+        return any(phone.value.startswith(self.prefix) for phone in record.phones)
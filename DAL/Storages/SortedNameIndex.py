@@ -0,0 +1,49 @@
+from bisect import bisect_left, bisect_right, insort
+from heapq import merge
+from typing import Iterable
+
+
+class SortedNameIndex:
+    # Case-insensitive sorted array of names, prefix lookups are a bisect plus the matching slice
+    def __init__(self, names: Iterable[str] = ()):
+        self._keys: list[tuple[str, str]] = sorted(self._key(name) for name in names)
+
+    def add(self, name: str) -> None:
+        insort(self._keys, self._key(name))
+
+    def add_many(self, names: Iterable[str]) -> None:
+        # Each insort shifts the tail of the array, a batch is sorted once and merged in one pass
+        batch = sorted(self._key(name) for name in names)
+        if batch:
+            self._keys = list(merge(self._keys, batch))
+
+    def remove(self, name: str) -> None:
+        key = self._key(name)
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def find_by_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        folded_prefix = prefix.casefold()
+        position = bisect_left(self._keys, (folded_prefix, ""))
+        names = []
+
+        while position < len(self._keys) and (limit is None or len(names) < limit):
+            folded_name, name = self._keys[position]
+            if not folded_name.startswith(folded_prefix):
+                break
+            names.append(name)
+            position += 1
+
+        return names
+
+    def find_after(self, name: str | None, limit: int) -> list[str]:
+        position = 0 if name is None else bisect_right(self._keys, self._key(name))
+        return [stored_name for _, stored_name in self._keys[position:position + limit]]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def _key(name: str) -> tuple[str, str]:
+        return name.casefold(), name
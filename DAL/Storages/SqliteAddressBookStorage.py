@@ -0,0 +1,253 @@
+import os
+import sqlite3
+import threading
+from datetime import date
+from typing import Callable, Iterable, Iterator
+
+from DAL.Entities.Record import Record
+from DAL.Exceptions.InvalidException import InvalidException
+from DAL.Storages.IRecordStorage import IRecordStorage
+from DAL.Storages.ISerializableStorage import ISerializableStorage
+from DAL.Storages.Predicates.BirthdayWindowPredicate import BirthdayWindowPredicate
+
+
+class SqliteAddressBookStorage(IRecordStorage, ISerializableStorage[dict[str, Record]]):
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS records (
+            name TEXT PRIMARY KEY,
+            name_key TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_records_name_key ON records (name_key, name);
+
+        CREATE TABLE IF NOT EXISTS phones (
+            record_name TEXT NOT NULL REFERENCES records (name) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            phone TEXT NOT NULL,
+            PRIMARY KEY (record_name, position)
+        );
+        CREATE INDEX IF NOT EXISTS idx_phones_phone ON phones (phone);
+
+        CREATE TABLE IF NOT EXISTS birthdays (
+            record_name TEXT PRIMARY KEY REFERENCES records (name) ON DELETE CASCADE,
+            birthday TEXT NOT NULL,
+            month INTEGER NOT NULL,
+            day INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_birthdays_month_day ON birthdays (month, day);
+    """
+
+    # Sorts after every character, so [prefix, prefix + MAX_CHAR) is the prefix range.
+    MAX_CHAR = "\U0010ffff"
+
+    def __init__(self, path: str = os.path.join("data", "address_book.db")):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.executescript(self.SCHEMA)
+        self._generation = 0
+        self._dirty_keys: set[str] | None = set()
+        self._lock = threading.RLock()
+
+    def add(self, record: Record) -> Record:
+        with self._lock, self.connection:
+            self._write(record.name.value, record)
+            self._track(record.name.value)
+        return record
+
+    def add_many(self, records: Iterable[Record]) -> int:
+        # One transaction for the whole batch instead of a commit per record
+        count = 0
+        with self._lock, self.connection:
+            for record in records:
+                self._write(record.name.value, record)
+                self._track(record.name.value)
+                count += 1
+        return count
+
+    def apply_changes(self, upserts: dict[str, Record], deletes: Iterable[str]) -> int:
+        # One database transaction, other connections see all of the changes or none
+        count = 0
+        with self._lock, self.connection:
+            for record_name in deletes:
+                if self.connection.execute("DELETE FROM records WHERE name = ?", (record_name,)).rowcount:
+                    self._track(record_name)
+                    count += 1
+            for record_name, record in upserts.items():
+                self._write(record_name, record)
+                self._track(record_name)
+                count += 1
+        return count
+
+    def update_item(self, record_name: str, new_record: Record) -> Record:
+        with self._lock, self.connection:
+            self._write(record_name, new_record)
+            self._track(record_name)
+        return new_record
+
+    def find(self, record_name: str) -> Record | None:
+        row = self.connection.execute(
+            "SELECT r.name, b.birthday FROM records r "
+            "LEFT JOIN birthdays b ON b.record_name = r.name WHERE r.name = ?",
+            (record_name,),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        phones = [phone for (phone,) in self.connection.execute(
+            "SELECT phone FROM phones WHERE record_name = ? ORDER BY position", (record_name,)
+        )]
+        return self._hydrate(row[0], phones, row[1])
+
+    def find_by_phone(self, phone: str) -> list[Record]:
+        names = self.connection.execute(
+            "SELECT DISTINCT record_name FROM phones WHERE phone = ? ORDER BY record_name", (phone,)
+        ).fetchall()
+        return [self.find(name) for (name,) in names]
+
+    def find_by_birthday(self, month: int, day: int) -> list[Record]:
+        names = self.connection.execute(
+            "SELECT record_name FROM birthdays WHERE month = ? AND day = ? ORDER BY record_name", (month, day)
+        ).fetchall()
+        return [self.find(name) for (name,) in names]
+
+    def find_names_by_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        folded_prefix = prefix.casefold()
+        rows = self.connection.execute(
+            "SELECT name FROM records WHERE name_key >= ? AND name_key < ? ORDER BY name_key, name LIMIT ?",
+            (folded_prefix, folded_prefix + self.MAX_CHAR, -1 if limit is None else limit),
+        )
+        return [name for (name,) in rows]
+
+    def find_names_after(self, name: str | None, limit: int) -> list[str]:
+        if name is None:
+            rows = self.connection.execute("SELECT name FROM records ORDER BY name_key, name LIMIT ?", (limit,))
+        else:
+            rows = self.connection.execute(
+                "SELECT name FROM records WHERE (name_key, name) > (?, ?) ORDER BY name_key, name LIMIT ?",
+                (name.casefold(), name, limit),
+            )
+        return [found for (found,) in rows]
+
+    def all_values(self) -> list[Record]:
+        return list(self.iter_values())
+
+    def iter_values(self) -> Iterator[Record]:
+        return self._iter_records(self.connection)
+
+    def iter_snapshot(self) -> Iterator[Record]:
+        if self.path == ":memory:":
+            # A second connection would open another empty database
+            with self._lock:
+                records = list(self.iter_values())
+            yield from records
+            return
+
+        # A read transaction on its own connection sees the database as of its first read,
+        # writes on the main connection go on meanwhile thanks to WAL
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        try:
+            connection.execute("BEGIN")
+            yield from self._iter_records(connection)
+        finally:
+            connection.close()
+
+    def _iter_records(self, connection: sqlite3.Connection) -> Iterator[Record]:
+        # Records and phones are both read in name order and merged on the fly,
+        # so only one record is materialized at a time.
+        records = connection.execute(
+            "SELECT r.name, b.birthday FROM records r "
+            "LEFT JOIN birthdays b ON b.record_name = r.name ORDER BY r.name"
+        )
+        phones = connection.execute("SELECT record_name, phone FROM phones ORDER BY record_name, position")
+        pending_phone = phones.fetchone()
+
+        for name, birthday in records:
+            record_phones = []
+            while pending_phone is not None and pending_phone[0] <= name:
+                if pending_phone[0] == name:
+                    record_phones.append(pending_phone[1])
+                pending_phone = phones.fetchone()
+
+            yield self._hydrate(name, record_phones, birthday)
+
+    def delete(self, record_name: str) -> None:
+        with self._lock, self.connection:
+            deleted = self.connection.execute("DELETE FROM records WHERE name = ?", (record_name,)).rowcount
+            if deleted:
+                self._track(record_name)
+
+    def has(self, record_name: str) -> bool:
+        row = self.connection.execute("SELECT 1 FROM records WHERE name = ?", (record_name,)).fetchone()
+        return row is not None
+
+    def filter(self, predicate: Callable[[Record], bool]) -> list[Record]:
+        if isinstance(predicate, BirthdayWindowPredicate):
+            return [record for month, day in sorted(predicate.keys) for record in self.find_by_birthday(month, day)]
+        return [record for record in self.iter_values() if predicate(record)]
+
+    def export_state(self) -> dict[str, Record]:
+        return {record.name.value: record for record in self.iter_values()}
+
+    def import_state(self, state: dict[str, Record]) -> None:
+        if not isinstance(state, dict):
+            raise InvalidException(f"Invalid state type: expected dict[str, Record], got {type(state).__name__}")
+
+        with self._lock, self.connection:
+            self.connection.execute("DELETE FROM records")
+            for record_name, record in state.items():
+                self._write(record_name, record)
+            self._generation += 1
+            self._dirty_keys = None
+
+    def is_empty(self) -> bool:
+        return self.connection.execute("SELECT 1 FROM records LIMIT 1").fetchone() is None
+
+    def get_generation(self) -> int:
+        return self._generation
+
+    def get_dirty_keys(self) -> set[str] | None:
+        return None if self._dirty_keys is None else set(self._dirty_keys)
+
+    def mark_clean(self) -> None:
+        self._dirty_keys = set()
+
+    def get_lock(self) -> threading.RLock:
+        return self._lock
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _track(self, record_name: str) -> None:
+        self._generation += 1
+        if self._dirty_keys is not None:
+            self._dirty_keys.add(record_name)
+
+    def _write(self, record_name: str, record: Record) -> None:
+        self.connection.execute(
+            "INSERT INTO records (name, name_key) VALUES (?, ?) ON CONFLICT (name) DO NOTHING",
+            (record_name, record_name.casefold()),
+        )
+        self.connection.execute("DELETE FROM phones WHERE record_name = ?", (record_name,))
+        self.connection.execute("DELETE FROM birthdays WHERE record_name = ?", (record_name,))
+
+        self.connection.executemany(
+            "INSERT INTO phones (record_name, position, phone) VALUES (?, ?, ?)",
+            [(record_name, position, phone.value) for position, phone in enumerate(record.phones)],
+        )
+
+        if record.birthday is not None:
+            birthday = record.birthday.value
+            self.connection.execute(
+                "INSERT INTO birthdays (record_name, birthday, month, day) VALUES (?, ?, ?, ?)",
+                (record_name, birthday.isoformat(), birthday.month, birthday.day),
+            )
+
+    @staticmethod
+    def _hydrate(name: str, phones: list[str], birthday: str | None) -> Record:
+        # Rows were validated when they were written, a stricter rule must not make them unreadable
+        return Record.from_normalized(name, phones, date.fromisoformat(birthday) if birthday else None)
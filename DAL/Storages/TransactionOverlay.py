@@ -0,0 +1,111 @@
+from typing import Callable, Iterable, Iterator
+
+from DAL.Entities.Record import Record
+from DAL.Storages.IRecordStorage import IRecordStorage
+from DAL.Storages.SortedNameIndex import SortedNameIndex
+
+
+class TransactionOverlay(IRecordStorage):
+    # Changes of an open transaction, kept on top of the storage until they are applied in one step.
+    # Reads through the overlay see the storage with the changes; the storage itself, its indexes,
+    # listeners and saves see none of them before commit.
+    def __init__(self, storage: IRecordStorage):
+        self.storage = storage
+        self.upserts: dict[str, Record] = {}
+        self.deletes: set[str] = set()
+
+    @property
+    def change_count(self) -> int:
+        return len(self.upserts) + len(self.deletes)
+
+    def commit(self) -> int:
+        return self.storage.apply_changes(self.upserts, self.deletes)
+
+    def add(self, record: Record) -> Record:
+        return self.update_item(record.name.value, record)
+
+    def add_many(self, records: Iterable[Record]) -> int:
+        count = 0
+        for record in records:
+            self.add(record)
+            count += 1
+        return count
+
+    def update_item(self, record_name: str, record: Record) -> Record:
+        self.deletes.discard(record_name)
+        self.upserts[record_name] = record
+        return record
+
+    def apply_changes(self, upserts: dict[str, Record], deletes: Iterable[str]) -> int:
+        count = 0
+        for record_name in deletes:
+            if self.has(record_name):
+                self.delete(record_name)
+                count += 1
+        for record_name, record in upserts.items():
+            self.update_item(record_name, record)
+            count += 1
+        return count
+
+    def find(self, record_name: str) -> Record | None:
+        if record_name in self.upserts:
+            return self.upserts[record_name]
+        if record_name in self.deletes:
+            return None
+        return self.storage.find(record_name)
+
+    def find_by_phone(self, phone: str) -> list[Record]:
+        changed = [record for record in self.upserts.values() if record.has_phone(phone)]
+        return self._merge(self.storage.find_by_phone(phone), changed)
+
+    def find_by_birthday(self, month: int, day: int) -> list[Record]:
+        changed = [
+            record for record in self.upserts.values()
+            if record.birthday is not None and (record.birthday.value.month, record.birthday.value.day) == (month, day)
+        ]
+        return self._merge(self.storage.find_by_birthday(month, day), changed)
+
+    def find_names_by_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        # Every changed name can hide one stored name, fetching that many more still fills the limit
+        stored = self.storage.find_names_by_prefix(prefix, None if limit is None else limit + self.change_count)
+        return SortedNameIndex(self._merge_names(stored)).find_by_prefix(prefix, limit)
+
+    def find_names_after(self, name: str | None, limit: int) -> list[str]:
+        stored = self.storage.find_names_after(name, limit + self.change_count)
+        return SortedNameIndex(self._merge_names(stored)).find_after(name, limit)
+
+    def all_values(self) -> list[Record]:
+        return self._visible(self.storage.all_values()) + list(self.upserts.values())
+
+    def iter_snapshot(self) -> Iterator[Record]:
+        upserts = list(self.upserts.values())
+        yield from (record for record in self.storage.iter_snapshot() if not self._is_changed(record.name.value))
+        yield from upserts
+
+    def delete(self, record_name: str) -> None:
+        self.upserts.pop(record_name, None)
+        if self.storage.has(record_name):
+            self.deletes.add(record_name)
+
+    def has(self, record_name: str) -> bool:
+        if record_name in self.upserts:
+            return True
+        return record_name not in self.deletes and self.storage.has(record_name)
+
+    def filter(self, predicate: Callable[[Record], bool]) -> list[Record]:
+        # The storage keeps its fast paths for predicates it recognises
+        changed = [record for record in self.upserts.values() if predicate(record)]
+        return self._visible(self.storage.filter(predicate)) + changed
+
+    def _is_changed(self, record_name: str) -> bool:
+        return record_name in self.upserts or record_name in self.deletes
+
+    def _visible(self, records: list[Record]) -> list[Record]:
+        return [record for record in records if not self._is_changed(record.name.value)]
+
+    def _merge(self, stored: list[Record], changed: list[Record]) -> list[Record]:
+        # Same order as the storage indexes return, sorted by name
+        return sorted(self._visible(stored) + changed, key=lambda record: record.name.value)
+
+    def _merge_names(self, stored: list[str]) -> list[str]:
+        return [name for name in stored if not self._is_changed(name)] + list(self.upserts)
@@ -84,3 +84,179 @@ def test_export_and_import_state(storage):
 def test_import_invalid_state_type_raises(storage):
     with pytest.raises(InvalidException):
         storage.import_state(["not", "a", "dict"])
+
+
+def test_find_by_phone(storage):
+    storage.add(Record("John", "+380991112233", "+380665554433"))
+    storage.add(Record("Jane", "+380987654321"))
+
+    assert [r.name.value for r in storage.find_by_phone("+380665554433")] == ["John"]
+    assert [r.name.value for r in storage.find_by_phone("+380987654321")] == ["Jane"]
+    assert storage.find_by_phone("+380000000000") == []
+
+
+def test_find_by_phone_shared_number(storage):
+    storage.add(Record("John", "+380991112233"))
+    storage.add(Record("Jane", "+380991112233"))
+
+    assert [r.name.value for r in storage.find_by_phone("+380991112233")] == ["Jane", "John"]
+
+    storage.delete("Jane")
+    assert [r.name.value for r in storage.find_by_phone("+380991112233")] == ["John"]
+
+
+def test_phone_index_follows_update_and_delete(storage):
+    storage.add(Record("John", "+380991112233"))
+    storage.update_item("John", Record("John", "+380987654321"))
+
+    assert storage.find_by_phone("+380991112233") == []
+    assert storage.find_by_phone("+380987654321")[0].name.value == "John"
+
+    storage.delete("John")
+    assert storage.find_by_phone("+380987654321") == []
+
+
+def test_phone_index_follows_builder_changes(storage):
+    record = Record("John", "+380991112233")
+    storage.add(record)
+
+    record = record.update().update_phone("+380991112233", "+380111222333").add_phone("+380444555666").build()
+    storage.update_item("John", record)
+
+    assert storage.find_by_phone("+380991112233") == []
+    assert storage.find_by_phone("+380111222333") == [record]
+    assert storage.find_by_phone("+380444555666") == [record]
+
+    record = record.update().clear_phones().build()
+    storage.update_item("John", record)
+
+    assert storage.find_by_phone("+380111222333") == []
+
+
+def test_phone_index_rebuilt_on_import_state(storage):
+    storage.add(Record("John", "+380991112233"))
+    storage.import_state({"Mike": Record("Mike", "+380931234567")})
+
+    assert storage.find_by_phone("+380991112233") == []
+    assert storage.find_by_phone("+380931234567")[0].name.value == "Mike"
+
+
+def test_find_by_birthday(storage):
+    storage.add(Record("John", "+380991112233", birthday="05.11.2000"))
+    storage.add(Record("Jane", "+380987654321", birthday="05.11.1995"))
+    storage.add(Record("Mike", "+380931234567", birthday="06.11.2000"))
+
+    assert [r.name.value for r in storage.find_by_birthday(11, 5)] == ["Jane", "John"]
+    assert storage.find_by_birthday(1, 1) == []
+
+
+def test_birthday_index_follows_builder_changes(storage):
+    record = Record("John", "+380991112233", birthday="05.11.2000")
+    storage.add(record)
+
+    record = record.update().set_birthday("2000-12-24").build()
+    storage.update_item("John", record)
+    assert storage.find_by_birthday(11, 5) == []
+    assert storage.find_by_birthday(12, 24) == [record]
+
+    record = record.update().clear_birthday().build()
+    storage.update_item("John", record)
+    assert storage.find_by_birthday(12, 24) == []
+
+
+def test_find_names_by_prefix(storage):
+    for name in ["Olga", "oleg", "Oksana", "Ivan", "Ol"]:
+        storage.add(Record(name, "+380991112233"))
+
+    assert storage.find_names_by_prefix("ol") == ["Ol", "oleg", "Olga"]
+    assert storage.find_names_by_prefix("Ol", limit=2) == ["Ol", "oleg"]
+    assert storage.find_names_by_prefix("z") == []
+    assert len(storage.find_names_by_prefix("")) == 5
+
+
+def test_name_index_follows_delete_and_import(storage):
+    storage.add(Record("Olga", "+380991112233"))
+    storage.add(Record("Oleg", "+380987654321"))
+    storage.delete("Olga")
+    assert storage.find_names_by_prefix("Ol") == ["Oleg"]
+
+    storage.import_state({"Olena": Record("Olena", "+380931234567")})
+    assert storage.find_names_by_prefix("Ol") == ["Olena"]
+
+
+def test_listeners_receive_changes(storage):
+    received = []
+    storage.add_listener(received.extend)
+
+    storage.add(Record("John", "+380991112233"))
+    storage.update_item("John", Record("John", "+380987654321"))
+    storage.delete("John")
+    storage.delete("Ghost")
+    storage.import_state({})
+
+    assert [(c.operation, c.record_name) for c in received] == [
+        ("upsert", "John"), ("upsert", "John"), ("delete", "John"), ("reset", None)
+    ]
+
+    storage.remove_listener(received.extend)
+    storage.add(Record("Jane", "+380991112233"))
+    assert len(received) == 4
+
+
+def test_generation_and_dirty_keys(storage):
+    start = storage.get_generation()
+    storage.add(Record("John", "+380991112233"))
+    storage.add(Record("Jane", "+380987654321"))
+    storage.delete("Jane")
+
+    assert storage.get_generation() == start + 3
+    assert storage.get_dirty_keys() == {"John", "Jane"}
+
+    storage.mark_clean()
+    assert storage.get_dirty_keys() == set()
+
+    storage.import_state({"Mike": Record("Mike", "+380931234567")})
+    assert storage.get_dirty_keys() is None
+    storage.mark_clean()
+    assert storage.get_dirty_keys() == set()
+
+
+def test_find_names_after(storage):
+    for name in ["bob", "Alice", "Carl", "alice"]:
+        storage.add(Record(name))
+
+    assert storage.find_names_after(None, 3) == ["Alice", "alice", "bob"]
+    assert storage.find_names_after("bob", 3) == ["Carl"]
+    assert storage.find_names_after("Ann", 1) == ["bob"]
+
+
+def test_add_many_notifies_once(storage):
+    received = []
+    storage.add_listener(received.append)
+    generation = storage.get_generation()
+
+    count = storage.add_many([Record("John", "+380991112233"), Record("Jane", "+380991112233", birthday="05.11.2000")])
+
+    assert count == 2
+    assert storage.get_generation() == generation + 1
+    assert [[c.record_name for c in changes] for changes in received] == [["John", "Jane"]]
+    assert [r.name.value for r in storage.find_by_phone("+380991112233")] == ["Jane", "John"]
+    assert storage.find_names_by_prefix("J") == ["Jane", "John"]
+
+
+def test_add_many_merges_names_into_index(storage):
+    storage.add(Record("Olga", "+380991112233"))
+    storage.add(Record("Ivan", "+380991112233"))
+
+    storage.add_many([Record("oleg", "+380987654321"), Record("Anna", "+380987654321"), Record("Olga", "+380931234567")])
+
+    assert storage.find_names_by_prefix("") == ["Anna", "Ivan", "oleg", "Olga"]
+    assert storage.find_names_after("Ivan", 10) == ["oleg", "Olga"]
+
+
+def test_is_empty(storage):
+    assert storage.is_empty()
+    storage.add(Record("John", "+380991112233"))
+    assert not storage.is_empty()
+    storage.delete("John")
+    assert storage.is_empty()
@@ -0,0 +1,170 @@
+from datetime import date
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from DAL.Entities.Record import Record
+from DAL.Exceptions.InvalidException import InvalidException
+from DAL.Storages.ColumnarAddressBookStorage import ColumnarAddressBookStorage
+from DAL.Storages.Predicates.BirthdayWindowPredicate import BirthdayWindowPredicate
+from DAL.Storages.Predicates.PhonePrefixPredicate import PhonePrefixPredicate
+
+
+@pytest.fixture
+def storage():
+    return ColumnarAddressBookStorage()
+
+
+def test_add_find_update_delete(storage):
+    storage.add(Record("John", "+380991112233", "0665554433", birthday="05.11.2000"))
+
+    found = storage.find("John")
+    assert [p.value for p in found.phones] == ["+380991112233", "0665554433"]
+    assert found.birthday.value == date(2000, 11, 5)
+
+    storage.update_item("John", Record("John", "+380987654321"))
+    found = storage.find("John")
+    assert [p.value for p in found.phones] == ["+380987654321"]
+    assert found.birthday is None
+    assert storage.find_by_phone("+380991112233") == []
+
+    storage.delete("John")
+    assert not storage.has("John")
+    assert storage.find("John") is None
+    assert storage.all_values() == []
+
+
+def test_indexed_lookups(storage):
+    storage.add(Record("Bob", "+380991112233", birthday="29.02.2000"))
+    storage.add(Record("alice", "+380991112233", birthday="29.02.1996"))
+    storage.add(Record("Alina", "0501234567"))
+
+    assert [r.name.value for r in storage.find_by_phone("+380991112233")] == ["Bob", "alice"]
+    assert [r.name.value for r in storage.find_by_phone("0501234567")] == ["Alina"]
+    assert storage.find_by_phone("501234567") == []
+    assert [r.name.value for r in storage.find_by_birthday(2, 29)] == ["Bob", "alice"]
+    assert storage.find_names_by_prefix("ALI") == ["alice", "Alina"]
+
+
+def test_birthday_window_filter(storage):
+    storage.add(Record("Leap", birthday="29.02.2000"))
+    storage.add(Record("March", birthday="01.03.1990"))
+    storage.add(Record("June", birthday="15.06.1990"))
+    storage.add(Record("NoBirthday", "0501234567"))
+
+    predicate = BirthdayWindowPredicate(date(2025, 2, 27), date(2025, 3, 1))
+    assert [r.name.value for r in storage.filter(predicate)] == ["Leap", "March"]
+
+
+def test_phone_prefix_filter(storage):
+    storage.add(Record("Kyiv", "+380991112233"))
+    storage.add(Record("Warsaw", "+48123456789"))
+    storage.add(Record("Local", "0380991112"))
+    storage.add(Record("Both", "+48987654321", "+380501112233"))
+
+    def names(prefix):
+        return sorted(r.name.value for r in storage.filter(PhonePrefixPredicate(prefix)))
+
+    assert names("+380") == ["Both", "Kyiv"]
+    assert names("+48") == ["Both", "Warsaw"]
+    assert names("038") == ["Local"]
+    assert names("+") == ["Both", "Kyiv", "Warsaw"]
+    assert names("") == ["Both", "Kyiv", "Local", "Warsaw"]
+    assert names("+3809911122334") == []
+    assert names("+38x") == []
+
+
+def test_vectorized_filter_matches_generic_predicate(storage):
+    records = [
+        Record(f"User{i}", f"+380{i:09d}", f"0{i:09d}", birthday=date(1990, 1, 1 + i % 28))
+        for i in range(60)
+    ]
+    for record in records:
+        storage.add(record)
+
+    for predicate in (PhonePrefixPredicate("+3800000001"), BirthdayWindowPredicate(date(2025, 1, 5), date(2025, 1, 9))):
+        expected = [r.name.value for r in records if predicate(r)]
+        assert [r.name.value for r in storage.filter(predicate)] == expected
+        assert [r.name.value for r in storage.filter(lambda r: predicate(r))] == expected
+
+
+def test_compaction_keeps_data_consistent(storage, monkeypatch):
+    monkeypatch.setattr(ColumnarAddressBookStorage, "COMPACTION_MIN_DEAD_ROWS", 4)
+    storage.add(Record("Keep", "+380991112233", birthday="01.01.2000"))
+
+    for i in range(10):
+        storage.update_item("Temp", Record("Temp", f"+38050000000{i}"))
+    storage.delete("Temp")
+
+    assert storage._dead_rows < 4
+    assert [r.name.value for r in storage.all_values()] == ["Keep"]
+    assert [r.name.value for r in storage.find_by_phone("+380991112233")] == ["Keep"]
+    assert [r.name.value for r in storage.filter(PhonePrefixPredicate("+380"))] == ["Keep"]
+
+
+def test_state_roundtrip_and_change_tracking(storage):
+    storage.add(Record("John", "+380991112233"))
+    assert storage.get_generation() == 1
+    assert storage.get_dirty_keys() == {"John"}
+
+    state = storage.export_state()
+    restored = ColumnarAddressBookStorage()
+    restored.import_state(state)
+
+    assert [p.value for p in restored.find("John").phones] == ["+380991112233"]
+    assert restored.find_names_by_prefix("jo") == ["John"]
+    assert restored.get_dirty_keys() is None
+
+    restored.mark_clean()
+    assert restored.get_dirty_keys() == set()
+
+    with pytest.raises(InvalidException):
+        restored.import_state(["not", "a", "dict"])
+
+
+def test_phone_that_cannot_be_encoded_leaves_columns_intact(storage):
+    storage.add(Record("John", "+380991112233"))
+    storage.add(Record("Jane", "0501234567"))
+    # Phone rejects such numbers now, records from older snapshots skip that validation
+
+    with pytest.raises(InvalidException):
+        storage.add(Record.from_normalized("Arabic", ["١٢٣٤٥٦٧٨٩٠"]))
+    with pytest.raises(InvalidException):
+        storage.update_item("John", Record.from_normalized("John", ["١٢٣٤٥٦٧٨٩٠"]))
+    with pytest.raises(InvalidException):
+        storage.apply_changes({"Bob": Record("Bob", "0661112233"), "Bad": Record.from_normalized("Bad", ["١٢٣٤٥٦٧٨٩٠"])}, ["Jane"])
+
+    assert sorted(r.name.value for r in storage.all_values()) == ["Jane", "John"]
+    assert [p.value for p in storage.find("John").phones] == ["+380991112233"]
+    assert not storage.has("Arabic") and not storage.has("Bob")
+
+
+def test_rows_are_read_without_revalidation(storage):
+    # Snapshots and the journal restore records without validation, a read must not reject them later
+    storage.add(Record.from_normalized("Future", ["0501234567"], date(2999, 1, 1)))
+
+    found = storage.find("Future")
+    assert found.birthday.value == date(2999, 1, 1)
+    assert [p.value for p in found.phones] == ["0501234567"]
+    assert [r.name.value for r in storage.all_values()] == ["Future"]
+
+
+def test_add_many_keeps_name_index_in_step(storage):
+    storage.add(Record("Olga", "+380991112233"))
+    storage.add_many([Record("oleg", "0501234567"), Record("Anna", "0501234567"), Record("Olga", "0661112233")])
+
+    assert storage.find_names_by_prefix("") == ["Anna", "oleg", "Olga"]
+
+    with pytest.raises(InvalidException):
+        storage.add_many([Record("Bob", "0661112233"), Record.from_normalized("Bad", ["١٢٣٤٥٦٧٨٩٠"])])
+    assert storage.find_names_by_prefix("") == ["Anna", "Bob", "oleg", "Olga"]
+    assert storage.has("Bob")
+
+
+def test_is_empty(storage):
+    assert storage.is_empty()
+    storage.add(Record("John", "+380991112233"))
+    assert not storage.is_empty()
+    storage.delete("John")
+    assert storage.is_empty()
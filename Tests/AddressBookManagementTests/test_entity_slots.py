@@ -0,0 +1,61 @@
+import copy
+import pickle
+from datetime import date
+
+from DAL.Entities.Record import Record
+from DAL.Entities.Name import Name
+from DAL.Entities.Phone import Phone
+from DAL.Entities.Birthday import Birthday
+
+# dict[str, Record] pickled before the entities used __slots__
+LEGACY_SNAPSHOT = (
+    b'\x80\x04\x95e\x01\x00\x00\x00\x00\x00\x00}\x94(\x8c\x04John\x94\x8c\x13DAL.Entities.Record\x94\x8c\x06Record'
+    b'\x94\x93\x94)\x81\x94}\x94(\x8c\x04name\x94\x8c\x11DAL.Entities.Name\x94\x8c\x04Name\x94\x93\x94)\x81\x94}\x94'
+    b'\x8c\x05value\x94h\x01sb\x8c\x06phones\x94]\x94(\x8c\x12DAL.Entities.Phone\x94\x8c\x05Phone\x94\x93\x94)\x81'
+    b'\x94}\x94h\r\x8c\r+380991112233\x94sbh\x12)\x81\x94}\x94h\r\x8c\r+380665554433\x94sbe\x8c\x08birthday\x94\x8c'
+    b'\x15DAL.Entities.Birthday\x94\x8c\x08Birthday\x94\x93\x94)\x81\x94}\x94h\r\x8c\x08datetime\x94\x8c\x04date\x94'
+    b'\x93\x94C\x04\x07\xd0\x0b\x05\x94\x85\x94R\x94sbub\x8c\x04Jane\x94h\x04)\x81\x94}\x94(h\x07h\n)\x81\x94}\x94h'
+    b'\rh%sbh\x0e]\x94h\x12)\x81\x94}\x94h\r\x8c\r+380987654321\x94sbah\x19Nubu.'
+)
+
+
+def test_entities_have_no_instance_dict():
+    record = Record("John", "+380991112233", birthday="05.11.2000")
+    for obj in (record, record.name, record.phones[0], record.birthday):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_legacy_snapshot_loads():
+    state = pickle.loads(LEGACY_SNAPSHOT)
+
+    john = state["John"]
+    assert isinstance(john.name, Name)
+    assert [p.value for p in john.phones] == ["+380991112233", "+380665554433"]
+    assert isinstance(john.phones[0], Phone)
+    assert isinstance(john.birthday, Birthday) and john.birthday.value == date(2000, 11, 5)
+    assert state["Jane"].birthday is None
+    assert state["Jane"].has_phone("+380987654321")
+
+
+def test_pickle_and_copy_roundtrip():
+    record = Record("John", "+380991112233", birthday="05.11.2000")
+
+    for restored in (pickle.loads(pickle.dumps(record)), copy.deepcopy(record)):
+        assert restored == record
+        assert restored.birthday.value == record.birthday.value
+
+
+def test_phone_collection_behaves_like_list():
+    record = Record("John", "+380991112233")
+    record.phones.append(Phone("+380665554433"))
+
+    assert len(record.phones) == 2
+    assert record.phones[-1].value == "+380665554433"
+    assert "+380991112233" in record.phones
+    assert record.phones == [Phone("+380991112233"), Phone("+380665554433")]
+
+    record.phones.remove("+380991112233")
+    assert [p.value for p in record.phones] == ["+380665554433"]
+
+    record.phones.clear()
+    assert record.phones == []
@@ -23,3 +23,5 @@ def test_phone_validation():
         Phone("abc")
     with pytest.raises(ValueError):
         Phone("12345")
+    with pytest.raises(ValueError):
+        Phone("١٢٣٤٥٦٧٨٩٠")
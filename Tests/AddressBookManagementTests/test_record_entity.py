@@ -84,4 +84,4 @@ def test_update_returns_record_builder_instance():
     builder = record.update()
     from DAL.EntityBuiilders.RecordBuilder.RecordBuilder import RecordBuilder
     assert isinstance(builder, RecordBuilder)
-    assert builder._record is record
+    assert builder._record is not record and builder._record == record
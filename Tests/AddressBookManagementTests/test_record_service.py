@@ -1,7 +1,10 @@
 from datetime import date, timedelta
 
 import pytest
+from BLL.Services.CommandService.CommandService import CommandService
+from BLL.Services.PickleFileService.PickleFileService import PickleFileService
 from BLL.Services.RecordService.RecordService import RecordService
+from DAL.FileManagers.PickleFileManager.PickleFileManager import PickleFileManager
 from DAL.Storages.AddressBookStorage import AddressBookStorage
 from DAL.Entities.Record import Record
 from DAL.Exceptions.AlreadyExistException import AlreadyExistException
@@ -86,3 +89,271 @@ def test_get_with_upcoming_birthdays(service):
     assert len(upcoming) == 1
     assert upcoming[0].name.value == "John"
 
+
+def test_get_by_phone(service):
+    service.save(Record("John", "1234567890", "0987654321"))
+    service.save(Record("Jane", "1112223333"))
+
+    result = service.get_by_phone("0987654321")
+    assert [r.name.value for r in result] == ["John"]
+
+def test_get_by_phone_prefix(service):
+    service.save(Record("John", "+380991112233"))
+    service.save(Record("Anna", "+380501234567", "+48501234567"))
+    service.save(Record("Jan", "+48661112233"))
+
+    assert [r.name.value for r in service.get_by_phone("+380")] == ["Anna", "John"]
+    assert [r.name.value for r in service.get_by_phone("+4850")] == ["Anna"]
+    with pytest.raises(NotFoundException):
+        service.get_by_phone("+1")
+
+def test_get_by_phone_not_found_raises(service):
+    service.save(Record("John", "1234567890"))
+    with pytest.raises(NotFoundException):
+        service.get_by_phone("5555555555")
+
+def test_upcoming_birthdays_sorted_by_date(service):
+    today = date(2025, 6, 2)  # Monday
+    service.save(Record("Late", "1234567890", birthday="06.06.1990"))
+    service.save(Record("Early", "0987654321", birthday="03.06.1990"))
+
+    upcoming = service.get_with_upcoming_birthdays(today)
+
+    assert [r.name.value for r in upcoming] == ["Early", "Late"]
+
+def test_upcoming_birthdays_weekend_moves_to_monday(service):
+    today = date(2025, 6, 2)  # Monday
+    service.save(Record("Saturday", "1234567890", birthday="31.05.1990"))
+    service.save(Record("Friday", "0987654321", birthday="30.05.1990"))
+
+    upcoming = service.get_with_upcoming_birthdays(today)
+
+    assert [r.name.value for r in upcoming] == ["Saturday"]
+
+def test_upcoming_birthdays_feb_29_in_non_leap_year(service):
+    service.save(Record("Leap", "1234567890", birthday="29.02.2000"))
+
+    assert [r.name.value for r in service.get_with_upcoming_birthdays(date(2025, 2, 25))] == ["Leap"]
+    assert service.get_with_upcoming_birthdays(date(2024, 2, 20)) == []
+
+def test_upcoming_birthdays_across_new_year(service):
+    service.save(Record("NewYear", "1234567890", birthday="02.01.1990"))
+
+    upcoming = service.get_with_upcoming_birthdays(date(2025, 12, 30))
+
+    assert [r.name.value for r in upcoming] == ["NewYear"]
+
+def test_search_by_prefix(service):
+    service.save(Record("Olga", "1234567890"))
+    service.save(Record("Oleg", "0987654321"))
+    service.save(Record("Ivan", "1112223333"))
+
+    assert [r.name.value for r in service.search("ol")] == ["Oleg", "Olga"]
+    assert [r.name.value for r in service.search("ol", 1)] == ["Oleg"]
+
+def test_search_invalid_limit_raises(service):
+    with pytest.raises(InvalidException):
+        service.search("ol", 0)
+
+
+def test_get_page_and_iter_pages(service):
+    for name in ["Dan", "anna", "Bob", "carl", "Eve"]:
+        service.save(Record(name, "+380991112233"))
+
+    assert [r.name.value for r in service.get_page(2)] == ["anna", "Bob"]
+    assert [r.name.value for r in service.get_page(2, "Bob")] == ["carl", "Dan"]
+    assert [[r.name.value for r in page] for page in service.iter_pages(2)] == [
+        ["anna", "Bob"], ["carl", "Dan"], ["Eve"]
+    ]
+
+    with pytest.raises(InvalidException):
+        service.get_page(0)
+
+
+def test_transaction_is_invisible_until_commit():
+    storage = AddressBookStorage()
+    notifications = []
+    storage.add_listener(notifications.append)
+    service = RecordService(storage)
+    service.save(Record("John", "1234567890"))
+
+    service.begin()
+    service.save(Record("Jane", "1112223333"))
+    service.update("John", service.get_by_name("John").update().add_phone("5556667777").build())
+    service.rename("John", "Johnny")
+
+    assert service.in_transaction()
+    assert service.has("Johnny") and not service.has("John")
+    assert storage.has("John") and not storage.has("Jane")
+    assert len(notifications) == 1
+
+    assert service.commit() == 3
+    assert not service.in_transaction()
+    assert sorted(storage.data) == ["Jane", "Johnny"]
+    assert [p.value for p in storage.find("Johnny").phones] == ["1234567890", "5556667777"]
+    assert len(notifications) == 2 and len(notifications[-1]) == 3
+
+
+def test_rollback_discards_changes(service):
+    service.save(Record("John", "1234567890"))
+    service.begin()
+    service.delete("John")
+    service.save(Record("Jane", "1112223333"))
+
+    assert service.rollback() == 2
+    assert service.has("John") and not service.has("Jane")
+
+
+def test_transaction_state_errors(service):
+    with pytest.raises(InvalidException):
+        service.commit()
+    with pytest.raises(InvalidException):
+        service.rollback()
+
+    service.begin()
+    with pytest.raises(InvalidException):
+        service.begin()
+
+
+def test_failed_edit_leaves_stored_record_unchanged(service):
+    service.save(Record("John", "1234567890"))
+    builder = service.get_by_name("John").update().add_phone("5556667777")
+
+    with pytest.raises(NotFoundException):
+        builder.remove_phone("0000000000")
+
+    assert [p.value for p in service.get_by_name("John").phones] == ["1234567890"]
+
+
+def names(service):
+    return sorted(record.name.value for record in service.get_all())
+
+
+def test_undo_and_redo_every_operation(service):
+    service.save(Record("John", "1234567890"))
+    service.update("John", service.get_by_name("John").update().set_birthday("2000-11-05").build())
+    service.rename("John", "Johnny")
+    service.delete("Johnny")
+
+    assert service.undo() == "delete 'Johnny'"
+    assert names(service) == ["Johnny"]
+    assert service.undo() == "rename 'John' to 'Johnny'"
+    assert names(service) == ["John"]
+    assert service.undo() == "edit 'John' (birthday)"
+    assert service.get_by_name("John").birthday is None
+    assert service.undo() == "add 'John'"
+    assert names(service) == []
+    with pytest.raises(InvalidException):
+        service.undo()
+
+    for _ in range(4):
+        service.redo()
+    assert names(service) == []
+    service.undo()
+    assert service.get_by_name("Johnny").birthday.value == date(2000, 11, 5)
+
+    service.save(Record("Jane", "1112223333"))
+    with pytest.raises(InvalidException):
+        service.redo()
+
+
+def test_update_keeps_only_changed_fields(service):
+    service.save(Record("John", "1234567890", birthday="05.11.2000"))
+    service.update("John", service.get_by_name("John").update().add_phone("5556667777").build())
+
+    (diff,) = service.history.take_undo()
+    assert [slot for slot, _ in diff.before] == ["_phones"]
+    assert [slot for slot, _ in diff.after] == ["_phones"]
+
+
+def test_history_is_bounded():
+    service = RecordService(AddressBookStorage(), history_limit=10)
+    service.save(Record("John", "1234567890"))
+    for index in range(1000):
+        phone = f"55566{index:05d}"
+        service.update("John", Record("John", phone))
+
+    assert len(service.history) == 10
+    for _ in range(10):
+        service.undo()
+    assert service.get_by_name("John").phones[0].value == "5556600989"
+
+
+def test_transaction_is_undone_as_one_change(service):
+    service.save(Record("John", "1234567890"))
+    service.begin()
+    service.save(Record("Jane", "1112223333"))
+    service.delete("John")
+    with pytest.raises(InvalidException):
+        service.undo()
+    service.commit()
+
+    service.begin()
+    service.save(Record("Ghost", "1112223333"))
+    service.rollback()
+
+    assert service.undo() == "2 changes"
+    assert names(service) == ["John"]
+    assert service.undo() == "add 'John'"
+
+
+def test_undo_that_no_longer_fits_changes_nothing(service):
+    service.save(Record("John", "1234567890"))
+    service.delete("John")
+    service.storage.add(Record("John", "5556667777"))
+
+    with pytest.raises(AlreadyExistException):
+        service.undo()
+    assert service.get_by_name("John").phones[0].value == "5556667777"
+    assert len(service.history) == 2
+
+
+def test_loading_a_snapshot_clears_history(service):
+    service.save(Record("John", "1234567890"))
+    service.storage.import_state({"Jane": Record("Jane", "1112223333")})
+
+    with pytest.raises(InvalidException):
+        service.undo()
+
+
+@pytest.mark.parametrize("storage_name", ["sqlite", "columnar"])
+def test_load_command_clears_history_of_any_storage(storage_name, tmp_path):
+    if storage_name == "columnar":
+        pytest.importorskip("numpy")
+        from DAL.Storages.ColumnarAddressBookStorage import ColumnarAddressBookStorage
+        storage = ColumnarAddressBookStorage()
+    else:
+        from DAL.Storages.SqliteAddressBookStorage import SqliteAddressBookStorage
+        storage = SqliteAddressBookStorage(":memory:")
+    service = RecordService(storage)
+    file_service = PickleFileService(PickleFileManager(str(tmp_path)), storage)
+    commands = CommandService(service, file_service)
+    service.save(Record("John", "1234567890"))
+    commands.add_phone(["John", "5556667777"])
+    name = file_service.save_with_name("book")
+
+    commands.load_state([name])
+
+    with pytest.raises(InvalidException, match="Nothing to undo"):
+        commands.undo()
+    assert [phone.value for phone in service.get_by_name("John").phones] == ["1234567890", "5556667777"]
+
+
+@pytest.mark.parametrize("storage_name", ["memory", "sqlite", "columnar"])
+def test_upcoming_birthdays_match_across_storages(storage_name):
+    if storage_name == "columnar":
+        pytest.importorskip("numpy")
+        from DAL.Storages.ColumnarAddressBookStorage import ColumnarAddressBookStorage
+        storage = ColumnarAddressBookStorage()
+    elif storage_name == "sqlite":
+        from DAL.Storages.SqliteAddressBookStorage import SqliteAddressBookStorage
+        storage = SqliteAddressBookStorage(":memory:")
+    else:
+        storage = AddressBookStorage()
+    service = RecordService(storage)
+    for name, birthday in [("Zed", "04.06.1990"), ("Amy", "04.06.1985"), ("Sat", "31.05.1990"), ("Far", "20.06.1990")]:
+        service.save(Record(name, "1234567890", birthday=birthday))
+
+    upcoming = service.get_with_upcoming_birthdays(date(2025, 6, 2))
+
+    assert [r.name.value for r in upcoming] == ["Sat", "Amy", "Zed"]
@@ -0,0 +1,118 @@
+from datetime import date
+
+import pytest
+from BLL.Services.RecordService.RecordService import RecordService
+from DAL.Storages.SqliteAddressBookStorage import SqliteAddressBookStorage
+from DAL.Entities.Record import Record
+from DAL.Exceptions.InvalidException import InvalidException
+
+
+@pytest.fixture
+def storage(tmp_path):
+    st = SqliteAddressBookStorage(str(tmp_path / "book.db"))
+    yield st
+    st.close()
+
+
+def test_add_and_find_record(storage):
+    storage.add(Record("John", "+380991112233", "+380665554433", birthday="05.11.2000"))
+
+    found = storage.find("John")
+    assert found.name.value == "John"
+    assert [p.value for p in found.phones] == ["+380991112233", "+380665554433"]
+    assert found.birthday.value == date(2000, 11, 5)
+    assert storage.find("Ghost") is None
+
+
+def test_update_and_delete_record(storage):
+    storage.add(Record("John", "+380991112233", birthday="05.11.2000"))
+    storage.update_item("John", Record("John", "+380987654321"))
+
+    found = storage.find("John")
+    assert [p.value for p in found.phones] == ["+380987654321"]
+    assert found.birthday is None
+
+    storage.delete("John")
+    assert not storage.has("John")
+    assert storage.find_by_phone("+380987654321") == []
+
+
+def test_indexed_lookups(storage):
+    storage.add(Record("Olga", "+380991112233", birthday="05.11.2000"))
+    storage.add(Record("oleg", "+380991112233"))
+    storage.add(Record("Ivan", "+380931234567", birthday="05.11.1990"))
+
+    assert [r.name.value for r in storage.find_by_phone("+380991112233")] == ["Olga", "oleg"]
+    assert [r.name.value for r in storage.find_by_birthday(11, 5)] == ["Ivan", "Olga"]
+    assert storage.find_names_by_prefix("OL") == ["oleg", "Olga"]
+    assert storage.find_names_by_prefix("ol", limit=1) == ["oleg"]
+    assert storage.find_names_after(None, 2) == ["Ivan", "oleg"]
+    assert storage.find_names_after("oleg", 2) == ["Olga"]
+
+
+def test_iter_values_keeps_phones_per_record(storage):
+    storage.add(Record("B", "+380991112233", "+380991112244"))
+    storage.add(Record("A"))
+    storage.add(Record("C", "+380931234567"))
+
+    values = list(storage.iter_values())
+    assert [r.name.value for r in values] == ["A", "B", "C"]
+    assert [len(r.phones) for r in values] == [0, 2, 1]
+    assert len(storage.filter(lambda r: len(r.phones) > 1)) == 1
+
+
+def test_data_survives_reopen(tmp_path):
+    path = str(tmp_path / "book.db")
+    first = SqliteAddressBookStorage(path)
+    first.add(Record("John", "+380991112233"))
+    first.close()
+
+    second = SqliteAddressBookStorage(path)
+    assert second.find("John").phones[0].value == "+380991112233"
+    second.close()
+
+
+def test_rows_stored_before_stricter_validation_stay_readable(storage):
+    # Phone accepts only ASCII digits now, older databases may still hold other digits
+    storage.add(Record.from_normalized("Arabic", ["١٢٣٤٥٦٧٨٩٠"], date(2000, 11, 5)))
+
+    found = storage.find("Arabic")
+    assert [p.value for p in found.phones] == ["١٢٣٤٥٦٧٨٩٠"]
+    assert found.birthday.value == date(2000, 11, 5)
+    assert [r.name.value for r in storage.iter_values()] == ["Arabic"]
+
+
+def test_export_and_import_state(storage):
+    storage.add(Record("John", "+380991112233"))
+    assert list(storage.export_state()) == ["John"]
+
+    storage.import_state({"Mike": Record("Mike", "+380931234567")})
+    assert storage.has("Mike")
+    assert not storage.has("John")
+
+    with pytest.raises(InvalidException):
+        storage.import_state(["not", "a", "dict"])
+
+
+def test_record_service_on_sqlite(storage):
+    service = RecordService(storage)
+    service.save(Record("John", "1234567890"))
+    service.rename("John", "Johnny")
+
+    assert service.has("Johnny")
+    assert not service.has("John")
+    assert service.get_by_phone("1234567890")[0].name.value == "Johnny"
+
+
+def test_add_many(storage):
+    assert storage.add_many([Record("John", "+380991112233"), Record("Jane", "+380987654321")]) == 2
+    assert storage.find("Jane").phones[0].value == "+380987654321"
+    assert storage.get_dirty_keys() == {"John", "Jane"}
+
+
+def test_is_empty(storage):
+    assert storage.is_empty()
+    storage.add(Record("John", "+380991112233"))
+    assert not storage.is_empty()
+    storage.delete("John")
+    assert storage.is_empty()
@@ -0,0 +1,89 @@
+from datetime import date
+
+import pytest
+from DAL.Entities.Record import Record
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+from DAL.Storages.Predicates.BirthdayWindowPredicate import BirthdayWindowPredicate
+from DAL.Storages.SqliteAddressBookStorage import SqliteAddressBookStorage
+from DAL.Storages.TransactionOverlay import TransactionOverlay
+
+
+def create_storage(kind, tmp_path):
+    if kind == "sqlite":
+        return SqliteAddressBookStorage(str(tmp_path / "book.db"))
+    if kind == "columnar":
+        pytest.importorskip("numpy")
+        from DAL.Storages.ColumnarAddressBookStorage import ColumnarAddressBookStorage
+        return ColumnarAddressBookStorage()
+    return AddressBookStorage()
+
+
+@pytest.fixture(params=["memory", "sqlite", "columnar"])
+def storage(request, tmp_path):
+    st = create_storage(request.param, tmp_path)
+    for name in ["Anna", "Bob", "Carl", "Dan"]:
+        st.add(Record(name, "+380991112233", birthday="05.11.2000"))
+    yield st
+    if request.param == "sqlite":
+        st.close()
+
+
+@pytest.fixture
+def overlay(storage):
+    overlay = TransactionOverlay(storage)
+    overlay.delete("Bob")
+    overlay.update_item("Carl", Record("Carl", "+380987654321"))
+    overlay.add(Record("Bella", "+380991112233", birthday="05.11.1999"))
+    return overlay
+
+
+def test_reads_see_changes_storage_does_not(overlay, storage):
+    assert not overlay.has("Bob") and overlay.find("Bob") is None
+    assert overlay.find("Carl").phones[0].value == "+380987654321"
+    assert overlay.has("Bella")
+
+    assert storage.has("Bob") and not storage.has("Bella")
+    assert storage.find("Carl").phones[0].value == "+380991112233"
+    assert overlay.change_count == 3
+
+
+def test_indexed_lookups_are_merged(overlay):
+    assert [r.name.value for r in overlay.find_by_phone("+380991112233")] == ["Anna", "Bella", "Dan"]
+    assert [r.name.value for r in overlay.find_by_phone("+380987654321")] == ["Carl"]
+    assert [r.name.value for r in overlay.find_by_birthday(11, 5)] == ["Anna", "Bella", "Dan"]
+    assert sorted(r.name.value for r in overlay.all_values()) == ["Anna", "Bella", "Carl", "Dan"]
+    assert sorted(r.name.value for r in overlay.iter_snapshot()) == ["Anna", "Bella", "Carl", "Dan"]
+
+
+def test_name_lookups_fill_the_limit(overlay):
+    assert overlay.find_names_by_prefix("b") == ["Bella"]
+    assert overlay.find_names_by_prefix("", 3) == ["Anna", "Bella", "Carl"]
+    assert overlay.find_names_after(None, 2) == ["Anna", "Bella"]
+    assert overlay.find_names_after("Bella", 2) == ["Carl", "Dan"]
+
+
+def test_delete_of_added_record_leaves_no_change(overlay, storage):
+    overlay.delete("Bella")
+    overlay.delete("Ghost")
+    assert overlay.change_count == 2
+
+    overlay.add(Record("Bob", "+380931234567"))
+    assert "Bob" not in overlay.deletes and overlay.find("Bob").phones[0].value == "+380931234567"
+
+
+def test_commit_applies_all_changes(overlay, storage):
+    assert overlay.commit() == 3
+
+    assert sorted(r.name.value for r in storage.all_values()) == ["Anna", "Bella", "Carl", "Dan"]
+    assert storage.find("Carl").phones[0].value == "+380987654321"
+    assert storage.find_names_by_prefix("b") == ["Bella"]
+
+
+def test_filter_sees_changes_through_storage_fast_paths(storage):
+    overlay = TransactionOverlay(storage)
+    overlay.delete("Anna")
+    overlay.update_item("Bob", Record("Bob", "+380991112233"))
+    overlay.add(Record("Eve", "+380991112233", birthday="06.11.1999"))
+
+    matched = overlay.filter(BirthdayWindowPredicate(date(2025, 11, 4), date(2025, 11, 6)))
+    assert sorted(r.name.value for r in matched) == ["Carl", "Dan", "Eve"]
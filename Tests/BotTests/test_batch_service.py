@@ -0,0 +1,136 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from BLL.Services.BatchService.BatchService import BatchService
+from BLL.Services.CommandService.CommandService import CommandService
+from BLL.Services.InputService.InputService import InputService
+from BLL.Services.RecordService.RecordService import RecordService
+from Benchmarks.startup_benchmark import PROJECT_ROOT
+from DAL.Exceptions.InvalidException import InvalidException
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+
+
+class FakeFileService:
+    def __init__(self, storage):
+        self.storage = storage
+        self.saved_sizes = []
+
+    def is_save_able(self):
+        return bool(self.storage.data) and (not self.saved_sizes or self.saved_sizes[-1] != len(self.storage.data))
+
+    def save_with_name(self, name="autosave", codec=None):
+        self.saved_sizes.append(len(self.storage.data))
+        return name
+
+
+@pytest.fixture
+def storage():
+    return AddressBookStorage()
+
+
+@pytest.fixture
+def file_service(storage):
+    return FakeFileService(storage)
+
+
+@pytest.fixture
+def input_service(storage, file_service):
+    return InputService(CommandService(RecordService(storage), file_service, autosave_on_exit=False))
+
+
+SCRIPT = [
+    "# provisioning",
+    "add-contact John +380991112233",
+    "",
+    "add-contact Jane 12",
+    "add-contact Jane +380987654321",
+    "show-all-contacts",
+    "add-birthday John 05.11.2000",
+]
+
+
+def test_run_continues_after_errors_and_saves_once(input_service, file_service, storage):
+    output, errors = [], []
+    service = BatchService(input_service, file_service, output=output.append, error_output=errors.append)
+
+    report = service.run(SCRIPT)
+
+    assert (report.executed, report.succeeded, report.failed) == (5, 4, 1)
+    assert report.failures[0][0] == 4
+    assert errors == [f"Line 4: {report.failures[0][1]}"]
+    assert sorted(storage.data) == ["Jane", "John"]
+    assert file_service.saved_sizes == [2]
+    assert any("Jane" in chunk for chunk in output)
+    assert "5 commands, 4 succeeded, 1 failed, 1 saves" in str(report)
+    assert "commands/s" in str(report)
+
+
+def test_stop_on_error_skips_the_rest(input_service, file_service, storage):
+    report = BatchService(input_service, file_service, stop_on_error=True).run(SCRIPT)
+
+    assert report.stopped_at == 4
+    assert report.executed == 2
+    assert list(storage.data) == ["John"]
+    assert file_service.saved_sizes == [1]
+    assert "Stopped at line 4" in str(report)
+
+
+def test_save_every_n_commands(input_service, file_service):
+    lines = [f"add-contact Contact{i} +38099111223{i}" for i in range(5)]
+
+    report = BatchService(input_service, file_service, save_every=2).run(lines)
+
+    assert file_service.saved_sizes == [2, 4, 5]
+    assert report.saves == 3
+
+
+def test_exit_ends_the_script(input_service, storage):
+    report = BatchService(input_service).run(["add-contact John +380991112233", "exit", "add-contact Jane +380987654321"])
+
+    assert report.executed == 2 and report.failed == 0
+    assert list(storage.data) == ["John"]
+    with pytest.raises(InvalidException):
+        BatchService(input_service, save_every=-1)
+
+
+def test_main_runs_script_from_pipe(tmp_path):
+    environment = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    script = "add-contact John +380991112233\nadd-contact Bad 1\nshow-phone John\n"
+    completed = subprocess.run(
+        [sys.executable, os.path.join(PROJECT_ROOT, "main.py"), "--script", "-", "--quiet"],
+        cwd=tmp_path, env=environment, input=script, capture_output=True, text=True, timeout=30,
+    )
+
+    assert completed.returncode == 1
+    assert "+380991112233" not in completed.stdout
+    assert "3 commands, 2 succeeded, 1 failed, 1 saves" in completed.stdout
+    assert "Line 2:" in completed.stderr
+    assert [name for name in os.listdir(tmp_path / "data") if name.endswith(".pkl")]
+
+
+def test_main_runs_piped_commands_as_script(tmp_path):
+    environment = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    completed = subprocess.run(
+        [sys.executable, os.path.join(PROJECT_ROOT, "main.py"), "--quiet"],
+        cwd=tmp_path, env=environment, input="add-contact John +380991112233\nexit\n",
+        capture_output=True, text=True, timeout=30,
+    )
+
+    assert completed.returncode == 0
+    assert "Enter a command" not in completed.stdout and "Welcome" not in completed.stdout
+    assert "State saved" not in completed.stdout
+    assert "2 commands, 2 succeeded, 0 failed" in completed.stdout
+
+
+def test_failed_save_is_reported(input_service, file_service):
+    def fail(name="autosave", codec=None):
+        raise InvalidException("disk is full")
+
+    file_service.save_with_name = fail
+    report = BatchService(input_service, file_service, save_every=1).run(["add-contact John +380991112233"])
+
+    assert report.failed == 0 and report.saves == 0
+    assert report.save_errors == ["disk is full", "disk is full"]
+    assert "save failed: disk is full" in str(report)
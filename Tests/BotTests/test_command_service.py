@@ -2,8 +2,12 @@ import pytest
 from datetime import datetime
 from BLL.Services.CommandService.CommandService import CommandService
 from DAL.Entities.Record import Record
+from DAL.Entities.AutosaveStatus import AutosaveStatus
 from DAL.Entities.Birthday import Birthday
+from DAL.Entities.RetentionReport import RetentionReport
+from DAL.Entities.SnapshotInfo import SnapshotInfo
 from DAL.Exceptions.ExitBotException import ExitBotException
+from DAL.Exceptions.InvalidException import InvalidException
 
 
 # === Fake dependencies ===
@@ -11,10 +15,17 @@ from DAL.Exceptions.ExitBotException import ExitBotException
 class FakeRecordService:
     def __init__(self):
         self.records = {}
+        self.open_transaction = False
+        self.history_cleared = False
 
     def save(self, record):
         self.records[record.name.value] = record
 
+    def save_many(self, records):
+        for record in records:
+            self.save(record)
+        return len(records)
+
     def update(self, name, record):
         self.records[name] = record
 
@@ -25,28 +36,73 @@ class FakeRecordService:
         if name in self.records:
             del self.records[name]
 
+    def get_by_phone(self, phone):
+        return [r for r in self.records.values() if r.has_phone(phone)]
+
+    def search(self, prefix, limit=None):
+        found = [r for n, r in sorted(self.records.items()) if n.lower().startswith(prefix.lower())]
+        return found[:limit] if limit else found
+
     def get_all(self):
         return list(self.records.values())
 
+    def iter_snapshot(self):
+        return iter(list(self.records.values()))
+
+    def get_page(self, page_size, after=None):
+        names = [n for n in sorted(self.records, key=str.casefold) if after is None or n.casefold() > after.casefold()]
+        return [self.records[n] for n in names[:page_size]]
+
+    def iter_pages(self, page_size):
+        after = None
+        while page := self.get_page(page_size, after):
+            yield page
+            after = page[-1].name.value
+
     def get_with_upcoming_birthdays(self):
         return [r for r in self.records.values() if r.birthday]
 
     def has(self, name):
         return name in self.records
 
+    def begin(self):
+        self.open_transaction = True
+
+    def commit(self):
+        self.open_transaction = False
+        return 2
+
+    def rollback(self):
+        self.open_transaction = False
+        return 1
+
+    def in_transaction(self):
+        return self.open_transaction
+
+    def undo(self):
+        return "delete 'John'"
+
+    def redo(self):
+        return "delete 'John'"
+
+    def clear_history(self):
+        self.history_cleared = True
+
 
 class FakeFileService:
     def __init__(self):
         self.saved = []
         self.loaded = []
         self.deleted = []
+        self.codecs = []
         self.files = ["file1.pkl", "file2.pkl"]
         self._saveable = False  # контроль для тестів
 
     def is_save_able(self):
         return self._saveable
 
-    def save_with_name(self, name=None):
+    def save_with_name(self, name=None, codec=None):
+        self.codecs.append(codec)
         self.saved.append(name or "autosave")
         return name or "autosave"
 
@@ -59,6 +115,16 @@ class FakeFileService:
     def get_file_list(self):
         return self.files
 
+    def get_file_details(self):
+        return [SnapshotInfo(name, datetime(2025, 1, 1), 2048, 3) for name in self.files]
+
+    def collect_garbage(self):
+        return RetentionReport(["old.pkl"], 3072, 2)
+
+    def get_autosave_status(self):
+        return AutosaveStatus(enabled=True, delay=5, pending=True, save_count=2,
+                              last_saved_name="autosave_1.pkl", last_saved_at=datetime(2025, 1, 1, 12, 30))
+
 
 # === Fixtures ===
 
@@ -99,12 +165,34 @@ def test_show_phone(command_service, fake_record_service):
     assert "+380665554433" in result
 
 
+def test_find_by_phone(command_service, fake_record_service):
+    fake_record_service.save(Record("John", "+380991112233", "+380665554433"))
+    fake_record_service.save(Record("Jane", "+380987654321"))
+    result = command_service.find_by_phone(["+380665554433"])
+    assert "John" in result
+    assert "Jane" not in result
+
+
+def test_search(command_service, fake_record_service):
+    fake_record_service.save(Record("Olga", "+380991112233"))
+    fake_record_service.save(Record("Oleg", "+380665554433"))
+    fake_record_service.save(Record("Ivan", "+380987654321"))
+    result = command_service.search(["ol", "1"])
+    assert "Oleg" in result
+    assert "Olga" not in result and "Ivan" not in result
+
+
+def test_search_nothing_found(command_service):
+    assert "No contacts" in command_service.search(["zz"])
+
+
 def test_add_birthday(command_service, fake_record_service):
     rec = Record("John", "+380991112233")
     fake_record_service.save(rec)
     result = command_service.add_birthday(["John", "05.11.2000"])
     assert "Contact updated" in result
-    assert isinstance(rec.birthday, Birthday)
+    assert isinstance(fake_record_service.records["John"].birthday, Birthday)
+    assert rec.birthday is None
 
 
 def test_show_birthday(command_service, fake_record_service):
@@ -130,15 +218,45 @@ def test_birthdays_empty(command_service):
 def test_show_all(command_service, fake_record_service):
     fake_record_service.save(Record("John", "+380991112233"))
     fake_record_service.save(Record("Jane", "+380665554433"))
-    result = command_service.show_all()
+    result = "\n".join(command_service.show_all([]))
     assert "John" in result and "Jane" in result
 
 
 def test_show_all_empty(command_service):
-    result = command_service.show_all()
+    result = "\n".join(command_service.show_all([]))
     assert "No contacts" in result
 
 
+def test_show_all_streams_in_chunks(command_service, fake_record_service):
+    command_service.STREAM_CHUNK_SIZE = 2
+    for name in ["Anna", "Bob", "Carl", "Dan", "Eve"]:
+        fake_record_service.save(Record(name, "+380991112233"))
+
+    chunks = list(command_service.show_all([]))
+    assert len(chunks) == 3
+    assert "Anna" in chunks[0] and "Bob" in chunks[0]
+    assert "Eve" in chunks[2]
+
+
+def test_show_all_paginated(command_service, fake_record_service):
+    for name in ["Anna", "bob", "Carl"]:
+        fake_record_service.save(Record(name, "+380991112233"))
+
+    first_page = command_service.show_all(["2"])
+    assert "Anna" in first_page and "bob" in first_page and "Carl" not in first_page
+    assert "Next page: show-all-contacts 2 bob" in first_page
+
+    last_page = command_service.show_all(["2", "bob"])
+    assert "Carl" in last_page and "Next page" not in last_page
+
+    assert "No contacts" in command_service.show_all(["2", "Carl"])
+
+
+def test_show_all_invalid_page_size(command_service):
+    with pytest.raises(InvalidException):
+        command_service.show_all(["many"])
+
+
 def test_hello_and_help(command_service):
     assert "help" in command_service.help_command().lower()
     assert "how can i help" in command_service.hello().lower()
@@ -160,6 +278,14 @@ def test_exit_bot_with_save(monkeypatch, command_service):
         command_service.exit_bot()
 
 
+def test_exit_bot_autosave_disabled(fake_record_service, fake_file_service):
+    fake_file_service._saveable = True
+    service = CommandService(fake_record_service, fake_file_service, autosave_on_exit=False)
+    with pytest.raises(ExitBotException):
+        service.exit_bot()
+    assert fake_file_service.saved == []
+
+
 def test_delete_contact(command_service, fake_record_service):
     rec = Record("John", "+380991112233")
     fake_record_service.save(rec)
@@ -174,16 +300,22 @@ def test_save_state_with_name(command_service, fake_file_service):
     assert "manual" in fake_file_service.saved
 
 
+def test_save_state_with_codec(command_service, fake_file_service):
+    command_service.save_state(["manual", "gzip"])
+    assert fake_file_service.codecs == ["gzip"]
+
+
 def test_save_state_without_name(command_service, fake_file_service):
     res = command_service.save_state([])
     assert "autosave" in res
     assert any("autosave" in s for s in fake_file_service.saved)
 
 
-def test_load_state(command_service, fake_file_service):
+def test_load_state(command_service, fake_file_service, fake_record_service):
     res = command_service.load_state(["manual"])
     assert "manual" in res
     assert "manual" in fake_file_service.loaded
+    assert fake_record_service.history_cleared
 
 
 def test_delete_file(command_service, fake_file_service):
@@ -196,6 +328,7 @@ def test_show_all_files(command_service, fake_file_service):
     res = command_service.show_all_files()
     assert "file1.pkl" in res
     assert "file2.pkl" in res
+    assert "2025-01-01 00:00:00 | 2.0 KB | 3 records" in res
 
 
 def test_get_command_exists(command_service):
@@ -206,3 +339,122 @@ def test_get_command_exists(command_service):
 
 def test_get_command_missing(command_service):
     assert command_service.get_command("not-a-command") is None
+
+
+def test_get_command_names(command_service):
+    names = command_service.get_command_names()
+    assert names == sorted(names)
+    assert "search" in names and "add-contact" in names
+
+
+def test_show_all_stream_errors_are_translated(command_service, fake_record_service):
+    def broken_pages(page_size):
+        yield [Record("John", "+380991112233")]
+        raise ValueError("storage failed")
+
+    fake_record_service.iter_pages = broken_pages
+    stream = command_service.show_all([])
+
+    assert "John" in next(stream)
+    with pytest.raises(InvalidException):
+        next(stream)
+
+
+def test_autosave_status(command_service):
+    result = command_service.autosave_status()
+    assert "Autosave is on" in result
+    assert "Unsaved changes: yes" in result
+    assert "'autosave_1.pkl' at 12:30:00" in result
+
+
+def test_gc_files(command_service, fake_file_service):
+    result = command_service.gc_files()
+    assert "reclaimed 3.0 KB" in result
+    assert "old.pkl" in result
+
+
+def test_import_contacts(command_service, fake_record_service, tmp_path):
+    path = tmp_path / "contacts.csv"
+    path.write_text("name,phones\nJohn,+380991112233\nBad,12\n", encoding="utf-8")
+
+    result = command_service.import_contacts([str(path)])
+
+    assert "Imported 1 contacts" in result and "1 rows failed" in result
+    assert "line 3" in result
+    assert "John" in fake_record_service.records
+
+
+def test_export_contacts(command_service, fake_record_service, tmp_path):
+    fake_record_service.save(Record("John", "+380991112233", birthday="05.11.2000"))
+    fake_record_service.save(Record("Jane", "+380987654321"))
+    path = tmp_path / "book.csv"
+
+    result = command_service.export_contacts([str(path), "csv", "prefix=jo", "has-birthday"])
+
+    assert "Exported 1 contacts" in result
+    assert path.read_text(encoding="utf-8").splitlines() == ["name,phones,birthday", "John,+380991112233,05.11.2000"]
+
+    with pytest.raises(InvalidException):
+        command_service.export_contacts([str(path), "older-than=5"])
+
+
+def test_commands_are_registered_with_aliases(command_service):
+    exit_command = command_service.get_command("exit")
+    assert command_service.get_command("close") is exit_command
+    assert "close" in command_service.get_command_names()
+    assert " - exit, close: Exit the program" in command_service.help_command()
+
+    search = command_service.get_command("search")
+    assert search.usage == "search [prefix] [limit]"
+    assert not command_service.get_command("hello").requires_data
+
+
+def test_command_execute_binds_arguments(command_service, fake_record_service):
+    fake_record_service.save(Record("John", "+380991112233"))
+
+    assert command_service.get_command("show-phone").execute(["John"]) == "+380991112233"
+    assert "How can I help" in command_service.get_command("hello").execute([])
+    with pytest.raises(InvalidException):
+        command_service.get_command("add-contact").execute(["John"])
+
+
+def test_transaction_commands(command_service, fake_record_service):
+    assert "Transaction started" in command_service.begin_transaction()
+    assert fake_record_service.in_transaction()
+    assert command_service.commit_transaction() == "Transaction committed, 2 changes applied."
+
+    command_service.begin_transaction()
+    assert command_service.rollback_transaction() == "Transaction rolled back, 1 changes discarded."
+    assert "Transactions" in command_service.help_command()
+
+
+def test_load_and_import_are_rejected_in_open_transaction(command_service, fake_file_service, tmp_path):
+    path = tmp_path / "contacts.csv"
+    path.write_text("name,phones\nJohn,+380991112233\n", encoding="utf-8")
+    command_service.begin_transaction()
+
+    with pytest.raises(InvalidException, match="before load"):
+        command_service.load_state(["manual"])
+    with pytest.raises(InvalidException, match="before import"):
+        command_service.import_contacts([str(path)])
+    assert fake_file_service.loaded == []
+
+    command_service.rollback_transaction()
+    command_service.load_state(["manual"])
+    assert fake_file_service.loaded == ["manual"]
+
+
+def test_exit_rolls_back_open_transaction(command_service, fake_record_service, capsys):
+    command_service.begin_transaction()
+    with pytest.raises(ExitBotException) as exit_info:
+        command_service.exit_bot()
+
+    assert not fake_record_service.in_transaction()
+    assert "rolled back, 1 changes discarded" in str(exit_info.value)
+    assert capsys.readouterr().out == ""
+
+
+def test_undo_and_redo(command_service):
+    assert command_service.undo() == "Undone: delete 'John'."
+    assert command_service.redo() == "Redone: delete 'John'."
+    assert "History" in command_service.help_command()
@@ -0,0 +1,29 @@
+import pytest
+from BLL.Services.CompletionService.CompletionService import CompletionService
+from BLL.Services.RecordService.RecordService import RecordService
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+from DAL.Entities.Record import Record
+
+
+class FakeCommandService:
+    def get_command_names(self):
+        return ["add-birthday", "add-contact", "help", "search"]
+
+
+@pytest.fixture
+def completion_service():
+    record_service = RecordService(AddressBookStorage())
+    record_service.save(Record("Olga", "+380991112233"))
+    record_service.save(Record("oleg", "+380987654321"))
+    record_service.save(Record("Ivan", "+380931234567"))
+    return CompletionService(FakeCommandService(), record_service)
+
+
+def test_completes_command_names(completion_service):
+    assert completion_service.get_candidates("", "add") == ["add-birthday", "add-contact"]
+    assert completion_service.get_candidates("  ", "HE") == ["help"]
+
+
+def test_completes_contact_names_after_command(completion_service):
+    assert completion_service.get_candidates("show-phone ", "Ol") == ["oleg", "Olga"]
+    assert completion_service.get_candidates("show-phone ", "x") == []
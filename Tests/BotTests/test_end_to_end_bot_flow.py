@@ -5,6 +5,7 @@ from BLL.Services.RecordService.RecordService import RecordService
 from DAL.Storages.AddressBookStorage import AddressBookStorage
 from DAL.Entities.Record import Record
 from DAL.Exceptions.ExitBotException import ExitBotException
+from DAL.Exceptions.InvalidException import InvalidException
 
 
 class FakeFileService:
@@ -67,7 +68,7 @@ def test_full_bot_flow(full_bot):
     assert any(p.value == "+380990001122" for p in john.phones)
 
     # 5️⃣ Show all contacts
-    result = input_service.handle("show-all-contacts")
+    result = "\n".join(input_service.handle("show-all-contacts"))
     assert "John" in result and "Jane" in result
 
     # 6️⃣ Show upcoming birthdays
@@ -102,3 +103,37 @@ def test_full_bot_flow(full_bot):
     jane = record_service.get_by_name("Jane")
     assert jane.birthday is not None
     assert jane.birthday.value.year == 1996
+
+
+def test_undo_redo_flow(full_bot):
+    input_service, record_service = full_bot
+    input_service.handle("add-contact John +380991112233")
+    input_service.handle("add-phone John +380990001122")
+    input_service.handle("delete-contact John")
+
+    assert input_service.handle("undo") == "Undone: delete 'John'."
+    assert [p.value for p in record_service.get_by_name("John").phones] == ["+380991112233", "+380990001122"]
+    assert input_service.handle("undo") == "Undone: edit 'John' (phones)."
+    assert len(record_service.get_by_name("John").phones) == 1
+
+    assert input_service.handle("redo") == "Redone: edit 'John' (phones)."
+    assert len(record_service.get_by_name("John").phones) == 2
+    assert input_service.handle("redo") == "Redone: delete 'John'."
+    assert not record_service.has("John")
+    with pytest.raises(InvalidException, match="Nothing to redo"):
+        input_service.handle("redo")
+
+
+def test_next_page_command_works_for_names_with_spaces(full_bot):
+    input_service, record_service = full_bot
+    # Only names from older snapshots or imports can still contain spaces
+    record_service.storage.import_state({
+        name: Record(name, "+380991112233") for name in ["Anna Maria", "Bob", "Carl"]
+    })
+
+    first_page = input_service.handle("show-all-contacts 1")
+    next_command = first_page.splitlines()[-1].removeprefix("Next page: ")
+    assert next_command == "show-all-contacts 1 Anna Maria"
+
+    second_page = input_service.handle(next_command)
+    assert "Bob" in second_page and "Anna Maria" not in second_page
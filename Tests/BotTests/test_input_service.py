@@ -1,15 +1,14 @@
 import pytest
 from BLL.Services.InputService.InputService import InputService
+from DAL.Entities.Command import Command
 from DAL.Exceptions.InvalidException import InvalidException
 
-class DummyCommand:
-    def __init__(self, fn): self.handler = fn
-
 class DummyCommandService:
     def __init__(self):
         self.commands = {
-            "hello": DummyCommand(lambda: "Hi!"),
-            "echo": DummyCommand(lambda args: f"Echo: {' '.join(args)}"),
+            "hello": Command("hello", lambda: "Hi!", "Greet"),
+            "echo": Command("echo", lambda args: f"Echo: {' '.join(args)}", "Echo", args=("words*",)),
+            "pair": Command("pair", lambda args: "-".join(args), "Join two words", args=("first", "second?")),
         }
 
     def get_command(self, name):
@@ -34,3 +33,14 @@ def test_parse_input_static():
     cmd, args = InputService._parse_input("add John 12345")
     assert cmd == "add"
     assert args == ["John", "12345"]
+
+def test_handle_checks_argument_count():
+    svc = InputService(DummyCommandService())
+    assert svc.handle("pair a b") == "a-b"
+    assert svc.handle("pair a") == "a"
+    with pytest.raises(InvalidException, match=r"Usage: pair \[first\] \[second\]"):
+        svc.handle("pair")
+    with pytest.raises(InvalidException):
+        svc.handle("pair a b c")
+    with pytest.raises(InvalidException):
+        svc.handle("hello there")
@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+from BLL.Services.CommandService.CommandService import CommandService
+from BLL.Services.InputService.InputService import InputService
+from BLL.Services.PickleFileService.PickleFileService import PickleFileService
+from BLL.Services.RecordService.RecordService import RecordService
+from BLL.Services.StartupService.StartupService import StartupService
+from DAL.Entities.Record import Record
+from DAL.FileManagers.PickleFileManager.PickleFileManager import PickleFileManager
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def test_load_runs_in_background(release):
+    startup = StartupService(lambda: release.wait(5) and "loaded")
+    startup.start()
+
+    assert not startup.is_ready()
+    assert not startup.wait(0.05)
+    assert startup.take_message() is None
+
+    release.set()
+    assert startup.wait(5)
+    assert startup.take_message() == "loaded"
+    assert startup.take_message() is None
+
+
+def test_load_error_becomes_message():
+    def broken_load():
+        raise OSError("disk is gone")
+
+    startup = StartupService(broken_load)
+    startup.start()
+
+    assert startup.wait(5)
+    assert isinstance(startup.error, OSError)
+    assert "disk is gone" in startup.take_message()
+
+
+def test_data_commands_wait_for_load(tmp_path, release):
+    manager = PickleFileManager(base_dir=str(tmp_path))
+    manager.save({"John": Record("John", "+380991112233")}, "book.pkl")
+
+    storage = AddressBookStorage()
+    records = RecordService(storage)
+    file_service = PickleFileService(manager, storage)
+
+    def load():
+        release.wait(5)
+        file_service.load_by_name("book.pkl")
+        return "loaded"
+
+    startup = StartupService(load)
+    input_service = InputService(CommandService(records, file_service), startup)
+    startup.start()
+
+    # Commands that do not need contacts answer while the book is still loading
+    assert "how can i help" in input_service.handle("hello").lower()
+    assert "available commands" in input_service.handle("help").lower()
+    assert not startup.is_ready()
+
+    results = []
+    worker = threading.Thread(target=lambda: results.append(input_service.handle("show-phone John")))
+    worker.start()
+    worker.join(0.1)
+    assert worker.is_alive()
+
+    release.set()
+    worker.join(5)
+    assert results == ["+380991112233"]
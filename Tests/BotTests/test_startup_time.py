@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from Benchmarks.startup_benchmark import PROJECT_ROOT, TIME_TO_PROMPT_BUDGET, time_to_prompt
+
+
+def test_heavy_modules_are_not_imported_at_startup():
+    lazy_modules = ["numpy", "sqlite3", "gzip", "bz2", "lzma", "hashlib", "inspect",
+                    "DAL.EntityBuiilders.RecordBuilder.RecordBuilder", "BLL.Services.JournalService.JournalService"]
+    completed = subprocess.run(
+        [sys.executable, "-c", f"import sys, main; print([m for m in {lazy_modules!r} if m in sys.modules])"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+    assert completed.stdout.strip() == "[]"
+
+
+# Wall-clock timing fails on loaded CI machines, so it runs only when asked: STARTUP_BENCHMARK=1 pytest
+@pytest.mark.skipif(os.environ.get("STARTUP_BENCHMARK") != "1", reason="set STARTUP_BENCHMARK=1 to check the time to prompt")
+def test_time_to_prompt_within_budget():
+    best = min(time_to_prompt() for _ in range(3))
+    assert best < TIME_TO_PROMPT_BUDGET
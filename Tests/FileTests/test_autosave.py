@@ -0,0 +1,112 @@
+import time
+
+import pytest
+from BLL.Services.PickleFileService.PickleFileService import PickleFileService
+from BLL.Services.RecordService.RecordService import RecordService
+from DAL.Entities.Record import Record
+from DAL.FileManagers.PickleFileManager.PickleFileManager import PickleFileManager
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return PickleFileManager(base_dir=str(tmp_path))
+
+
+@pytest.fixture
+def book(manager):
+    storage = AddressBookStorage()
+    file_service = PickleFileService(manager, storage, max_delta_chain=5)
+    yield RecordService(storage), file_service
+    file_service.stop_autosave()
+
+
+def wait_until(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_autosave_writes_after_change(book, manager):
+    records, file_service = book
+    file_service.start_autosave(delay=0.05)
+
+    records.save(Record("John", "+380991112233"))
+
+    assert wait_until(lambda: file_service.get_autosave_status().save_count == 1)
+    status = file_service.get_autosave_status()
+    assert status.enabled and not status.pending
+    assert status.last_saved_name in manager.get_all_names()
+    assert list(manager.load(status.last_saved_name)) == ["John"]
+
+
+def test_autosave_debounces_bursts(book):
+    records, file_service = book
+    file_service.start_autosave(delay=0.3, max_delay=10)
+
+    for i in range(5):
+        records.save(Record(f"User{i}", "+380991112233"))
+        time.sleep(0.02)
+
+    assert wait_until(lambda: file_service.get_autosave_status().save_count == 1)
+    time.sleep(0.4)
+    assert file_service.get_autosave_status().save_count == 1
+
+
+def test_autosave_saves_during_long_bursts(book):
+    records, file_service = book
+    file_service.start_autosave(delay=0.2, max_delay=0.3)
+
+    deadline = time.monotonic() + 1.0
+    i = 0
+    while time.monotonic() < deadline and file_service.get_autosave_status().save_count == 0:
+        records.save(Record(f"User{i}", "+380991112233"))
+        i += 1
+        time.sleep(0.05)
+
+    assert file_service.get_autosave_status().save_count >= 1
+
+
+def failing_save(obj, name, codec=None):
+    raise OSError("disk is full")
+
+
+def test_autosave_reports_errors(book, manager, monkeypatch):
+    records, file_service = book
+    monkeypatch.setattr(manager, "save", failing_save)
+    file_service.start_autosave(delay=0.05)
+    records.save(Record("John", "+380991112233"))
+
+    assert wait_until(lambda: file_service.get_autosave_status().last_error == "disk is full")
+    assert file_service.get_autosave_status().pending
+
+
+def test_failed_save_forces_full_snapshot(book, manager, monkeypatch):
+    records, file_service = book
+    records.save(Record("John", "+380991112233"))
+    file_service.save_with_name("book")
+    records.save(Record("Jane", "+380987654321"))
+
+    original_save = manager.save
+    monkeypatch.setattr(manager, "save", failing_save)
+    with pytest.raises(OSError):
+        file_service.save_with_name("book")
+
+    monkeypatch.setattr(manager, "save", original_save)
+    records.save(Record("Bob", "+380661112233"))
+    name = file_service.save_with_name("book")
+    assert sorted(manager.load(name)) == ["Bob", "Jane", "John"]
+
+
+def test_stop_autosave(book):
+    _, file_service = book
+    assert not file_service.get_autosave_status().enabled
+
+    file_service.start_autosave(delay=0.05)
+    file_service.stop_autosave()
+
+    assert not file_service.get_autosave_status().enabled
+    assert "off" in str(file_service.get_autosave_status())
@@ -0,0 +1,149 @@
+import os
+from datetime import date
+
+import pytest
+from BLL.Services.PickleFileService.PickleFileService import PickleFileService
+from BLL.Services.RecordService.RecordService import RecordService
+from DAL.Entities.Record import Record
+from DAL.Entities.SnapshotDelta import SnapshotDelta
+from DAL.Exceptions.InvalidException import InvalidException
+from DAL.FileManagers.BinaryFileManager.BinaryFileManager import BinaryFileManager
+from DAL.FileManagers.PickleFileManager.PickleFileManager import PickleFileManager
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return BinaryFileManager(base_dir=str(tmp_path))
+
+
+@pytest.fixture
+def state():
+    return {
+        "John": Record("John", "+380991112233", "0501234567", birthday="05.11.2000"),
+        "Олена": Record("Олена", "0000000001"),
+        "Empty": Record("Empty"),
+    }
+
+
+def as_tuples(records):
+    return {
+        name: ([p.value for p in r.phones], r.birthday.value if r.birthday else None)
+        for name, r in records.items()
+    }
+
+
+def test_save_and_load_full_snapshot(manager, tmp_path, state):
+    name = manager.save(state, "book")
+
+    assert name == "book.abk"
+    assert manager.get_all_names() == ["book.abk"]
+    assert as_tuples(manager.load(name)) == {
+        "John": (["+380991112233", "0501234567"], date(2000, 11, 5)),
+        "Олена": (["0000000001"], None),
+        "Empty": ([], None),
+    }
+
+
+def test_save_and_load_delta(manager, state):
+    delta = SnapshotDelta("book.abk", 3, {"John": state["John"]}, ["Олена"])
+    loaded = manager.load(manager.save(delta, "delta"))
+
+    assert isinstance(loaded, SnapshotDelta)
+    assert (loaded.parent, loaded.depth, loaded.deletes) == ("book.abk", 3, ["Олена"])
+    assert as_tuples(loaded.upserts) == {"John": (["+380991112233", "0501234567"], date(2000, 11, 5))}
+
+
+def test_iter_records_streams_records(manager, state):
+    name = manager.save(state, "book")
+    records = manager.iter_records(name)
+
+    assert next(records).name.value == "John"
+    assert [r.name.value for r in records] == ["Олена", "Empty"]
+
+
+def test_binary_is_smaller_than_pickle(manager, tmp_path):
+    book = {f"Contact{i}": Record(f"Contact{i}", f"+38099{i:07d}", birthday=date(1990, 1, 1)) for i in range(100)}
+    binary_name = manager.save(book, "book")
+    pickle_name = PickleFileManager(str(tmp_path)).save(book, "book")
+
+    assert os.path.getsize(tmp_path / binary_name) < os.path.getsize(tmp_path / pickle_name) / 2
+
+
+def test_compressed_binary_snapshot(manager, tmp_path, state):
+    name = manager.save(state, "book", "gzip")
+
+    assert manager.legacy_manager.detect_codec(str(tmp_path / name)) == "gzip"
+    assert set(manager.load(name)) == set(state)
+
+
+def test_invalid_files_raise(manager, tmp_path, state):
+    (tmp_path / "garbage.abk").write_bytes(b"not a snapshot at all")
+    with pytest.raises(InvalidException):
+        manager.load("garbage.abk")
+
+    name = manager.save(state, "future")
+    data = bytearray((tmp_path / name).read_bytes())
+    data[4] = 99
+    (tmp_path / name).write_bytes(bytes(data))
+    with pytest.raises(InvalidException, match="schema version"):
+        manager.load(name)
+
+    name = manager.save(state, "truncated")
+    (tmp_path / name).write_bytes((tmp_path / name).read_bytes()[:-5])
+    with pytest.raises(InvalidException, match="truncated"):
+        manager.load(name)
+
+
+def test_reads_and_migrates_legacy_pickle_chain(manager, tmp_path):
+    legacy = PickleFileManager(str(tmp_path))
+    storage = AddressBookStorage()
+    file_service = PickleFileService(legacy, storage, max_delta_chain=5)
+    records = RecordService(storage)
+    records.save(Record("John", "+380991112233"))
+    full_name = file_service.save_with_name("book")
+    records.save(Record("Jane", "+380987654321"))
+    delta_name = file_service.save_with_name()
+
+    assert set(manager.get_all_names()) == {full_name, delta_name}
+    assert isinstance(manager.load(delta_name), SnapshotDelta)
+
+    migrated = manager.migrate_legacy_files()
+
+    assert set(migrated) == {full_name, delta_name}
+    assert legacy.get_all_names() == []
+    assert manager.load(migrated[delta_name]).parent == migrated[full_name]
+
+    restored = AddressBookStorage()
+    PickleFileService(manager, restored).load_by_name(migrated[delta_name])
+    assert sorted(restored.export_state()) == ["Jane", "John"]
+
+
+def test_file_service_writes_binary_deltas(manager):
+    storage = AddressBookStorage()
+    file_service = PickleFileService(manager, storage, max_delta_chain=5)
+    records = RecordService(storage)
+    records.save(Record("John", "+380991112233"))
+    assert file_service.save_with_name("book").endswith(".abk")
+
+    records.delete("John")
+    records.save(Record("Jane", "+380987654321"))
+    delta_name = file_service.save_with_name()
+    assert isinstance(manager.load(delta_name), SnapshotDelta)
+
+    restored = AddressBookStorage()
+    PickleFileService(manager, restored).load_by_name(delta_name)
+    assert list(restored.export_state()) == ["Jane"]
+
+
+def test_record_from_normalized_skips_validation():
+    record = Record.from_normalized("John", ["+380991112233"], date(2000, 11, 5))
+
+    assert record == Record("John", "+380991112233")
+    assert record.birthday.value == date(2000, 11, 5)
+    assert Record.from_normalized("Empty", []).birthday is None
+
+
+def test_phone_that_cannot_be_encoded_raises_invalid(manager):
+    with pytest.raises(InvalidException):
+        manager.save({"Arabic": Record.from_normalized("Arabic", ["١٢٣٤٥٦٧٨٩٠"])}, "book")
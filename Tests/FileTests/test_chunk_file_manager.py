@@ -0,0 +1,158 @@
+import os
+
+import pytest
+from BLL.Services.PickleFileService.PickleFileService import PickleFileService
+from BLL.Services.RecordService.RecordService import RecordService
+from DAL.Entities.Record import Record
+from DAL.Entities.SnapshotDelta import SnapshotDelta
+from DAL.Exceptions.InvalidException import InvalidException
+from DAL.FileManagers.ChunkFileManager.ChunkFileManager import ChunkFileManager
+from DAL.FileManagers.PickleFileManager.PickleFileManager import PickleFileManager
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ChunkFileManager(base_dir=str(tmp_path))
+
+
+@pytest.fixture
+def state():
+    return {
+        "John": Record("John", "+380991112233", "0501234567", birthday="05.11.2000"),
+        "Олена": Record("Олена", "0000000001"),
+        "Empty": Record("Empty"),
+    }
+
+
+def as_tuples(records):
+    return {
+        name: ([p.value for p in r.phones], r.birthday.value if r.birthday else None)
+        for name, r in records.items()
+    }
+
+
+def test_save_and_load(manager, state):
+    name = manager.save(state, "book")
+
+    assert name == "book.cas"
+    assert manager.get_all_names() == ["book.cas"]
+    assert manager.get_snapshots()[0].record_count == 3
+    assert as_tuples(manager.load(name)) == as_tuples(state)
+    assert manager.get_chunk_count() == 3
+
+
+def test_unchanged_records_are_stored_once(manager, state):
+    manager.save(state, "first")
+    state["John"] = Record("John", "+380991112233")
+    manager.save(state, "second")
+
+    assert manager.get_chunk_count() == 4
+    assert as_tuples(manager.load("second.cas")) == as_tuples(state)
+
+
+def test_delta_is_stored_as_full_snapshot(manager, state):
+    manager.save(state, "base")
+    delta = SnapshotDelta("base.cas", 1, {"Bob": Record("Bob", "0631112233")}, ["Empty"])
+    name = manager.save(delta, "delta")
+
+    assert manager.get_snapshots()[-1].parent is None
+    assert sorted(manager.load(name)) == ["Bob", "John", "Олена"]
+
+
+def test_delete_removes_only_unshared_chunks(manager, state):
+    manager.save(state, "first")
+    state["Bob"] = Record("Bob")
+    manager.save(state, "second")
+
+    manager.delete("second.cas")
+    assert manager.get_chunk_count() == 3
+    assert as_tuples(manager.load("first.cas"))["John"][0] == ["+380991112233", "0501234567"]
+
+    manager.delete("first.cas")
+    assert manager.get_chunk_count() == 0
+    assert manager.get_all_names() == []
+
+
+def test_deletes_read_only_the_deleted_index(manager, state, monkeypatch):
+    for index in range(4):
+        state[f"Contact{index}"] = Record(f"Contact{index}")
+        manager.save(state, f"snap{index}")
+    manager.delete("snap0.cas")
+
+    loaded = []
+    load_index = manager._load_index
+    monkeypatch.setattr(manager, "_load_index", lambda name: loaded.append(name) or load_index(name))
+    manager.delete("snap1.cas")
+    manager.delete("snap2.cas")
+
+    assert loaded == ["snap1.cas", "snap2.cas"]
+    assert manager.get_chunk_count() == len(state)
+    assert as_tuples(manager.load("snap3.cas")) == as_tuples(state)
+
+
+def test_delete_keeps_chunks_of_snapshots_saved_by_another_instance(manager, state, tmp_path):
+    manager.save(state, "first")
+    manager.delete(manager.save({"Bob": Record("Bob")}, "counted"))
+
+    other = ChunkFileManager(base_dir=str(tmp_path))
+    other.save(state, "second")
+    manager.delete("first.cas")
+
+    assert as_tuples(manager.load("second.cas")) == as_tuples(state)
+
+
+def test_corrupted_chunk_is_detected(manager, state, tmp_path):
+    manager.save({"John": state["John"]}, "book")
+    chunk_dir = tmp_path / ChunkFileManager.CHUNK_DIR
+    (chunk_path,) = [os.path.join(root, file) for root, _, files in os.walk(chunk_dir) for file in files]
+    with open(chunk_path, "wb") as file:
+        file.write(b'["John",[],null]')
+
+    with pytest.raises(InvalidException):
+        manager.load("book.cas")
+
+
+def test_compressed_index_and_legacy_files(manager, state, tmp_path):
+    PickleFileManager(base_dir=str(tmp_path), manifest=manager.manifest).save(state, "old.pkl")
+    name = manager.save(state, "packed", "gzip")
+
+    assert manager.get_all_names() == ["old.pkl", "packed.cas"]
+    assert manager.get_latest_name() == "packed.cas"
+    assert as_tuples(manager.load(name)) == as_tuples(manager.load("old.pkl"))
+
+
+def test_file_service_round_trip_with_deltas(manager):
+    storage = AddressBookStorage()
+    records = RecordService(storage)
+    file_service = PickleFileService(manager, storage, max_delta_chain=5)
+
+    records.save(Record("John", "+380991112233"))
+    records.save(Record("Jane", "+380987654321"))
+    file_service.save_with_name("book")
+    records.delete("Jane")
+    records.save(Record("Bob", "0631112233"))
+    latest = file_service.save_with_name("book")
+
+    restored_storage = AddressBookStorage()
+    PickleFileService(manager, restored_storage).load_by_name(latest)
+    assert sorted(restored_storage.export_state()) == ["Bob", "John"]
+    assert manager.get_chunk_count() == 3
+
+
+def test_first_save_after_switching_from_pickle(manager, tmp_path):
+    storage = AddressBookStorage()
+    records = RecordService(storage)
+    records.save(Record("John", "+380991112233"))
+    legacy_service = PickleFileService(PickleFileManager(base_dir=str(tmp_path)), storage, max_delta_chain=5)
+    legacy_service.save_with_name()
+    records.save(Record("Jane", "+380987654321"))
+    legacy_name = legacy_service.save_with_name()
+
+    file_service = PickleFileService(manager, AddressBookStorage(), max_delta_chain=5)
+    file_service.load_by_name(legacy_name)
+    RecordService(file_service.storage).save(Record("Bob", "0631112233"))
+    name = file_service.save_with_name()
+
+    assert name.endswith(".cas")
+    assert sorted(manager.load(name)) == ["Bob", "Jane", "John"]
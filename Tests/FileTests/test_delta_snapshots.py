@@ -0,0 +1,113 @@
+import pytest
+from BLL.Services.PickleFileService.PickleFileService import PickleFileService
+from BLL.Services.RecordService.RecordService import RecordService
+from DAL.FileManagers.PickleFileManager.PickleFileManager import PickleFileManager
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+from DAL.Entities.Record import Record
+from DAL.Entities.SnapshotDelta import SnapshotDelta
+from DAL.Exceptions.InvalidException import InvalidException
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return PickleFileManager(base_dir=str(tmp_path))
+
+
+@pytest.fixture
+def book(manager):
+    storage = AddressBookStorage()
+    file_service = PickleFileService(manager, storage, max_delta_chain=2)
+    record_service = RecordService(storage)
+    record_service.save(Record("John", "+380991112233"))
+    record_service.save(Record("Jane", "+380987654321"))
+    return record_service, file_service
+
+
+def reload(manager, name):
+    storage = AddressBookStorage()
+    PickleFileService(manager, storage).load_by_name(name)
+    return RecordService(storage)
+
+
+def test_second_save_writes_only_changes(book, manager):
+    record_service, file_service = book
+    base_name = file_service.save_with_name("base")
+
+    john = record_service.get_by_name("John").update().add_phone("+380665554433").build()
+    record_service.update("John", john)
+    record_service.rename("Jane", "Janet")
+    delta_name = file_service.save_with_name()
+
+    delta = manager.load(delta_name)
+    assert isinstance(delta, SnapshotDelta)
+    assert delta.parent == base_name
+    assert set(delta.upserts) == {"John", "Janet"}
+    assert delta.deletes == ["Jane"]
+
+    restored = reload(manager, delta_name)
+    assert len(restored.get_by_name("John").phones) == 2
+    assert restored.has("Janet") and not restored.has("Jane")
+
+
+def test_chain_is_rebased_when_too_long(book, manager):
+    record_service, file_service = book
+    file_service.save_with_name("s0")
+
+    names = []
+    for index in range(3):
+        record_service.save(Record(f"User{index}", "+380931234567"))
+        names.append(file_service.save_with_name())
+
+    assert isinstance(manager.load(names[0]), SnapshotDelta)
+    assert isinstance(manager.load(names[1]), SnapshotDelta)
+    assert isinstance(manager.load(names[2]), dict)
+    assert len(reload(manager, names[1]).get_all()) == 4
+
+
+def test_save_after_load_continues_chain(book, manager):
+    record_service, file_service = book
+    base_name = file_service.save_with_name("base")
+
+    storage = AddressBookStorage()
+    other_service = PickleFileService(manager, storage, max_delta_chain=2)
+    other_service.load_by_name(base_name)
+    storage.delete("John")
+    delta_name = other_service.save_with_name()
+
+    delta = manager.load(delta_name)
+    assert isinstance(delta, SnapshotDelta)
+    assert delta.deletes == ["John"] and delta.upserts == {}
+
+
+def test_missing_parent_raises(book, manager):
+    record_service, file_service = book
+    base_name = file_service.save_with_name("base")
+    record_service.delete("John")
+    delta_name = file_service.save_with_name()
+
+    manager.delete(base_name)
+
+    with pytest.raises(InvalidException, match="depends on missing file"):
+        reload(manager, delta_name)
+
+
+def test_named_saves_are_full_snapshots(book, manager):
+    record_service, file_service = book
+    file_service.save_with_name("base")
+    record_service.delete("John")
+
+    assert isinstance(manager.load(file_service.save_with_name("next")), dict)
+
+
+def test_delete_refuses_parents_of_deltas(book, manager):
+    record_service, file_service = book
+    base_name = file_service.save_with_name("base")
+    record_service.delete("John")
+    delta_name = file_service.save_with_name()
+
+    with pytest.raises(InvalidException, match=delta_name):
+        file_service.delete_by_name(base_name)
+
+    file_service.delete_by_name(delta_name)
+    file_service.delete_by_name(base_name)
+    assert manager.get_all_names() == []
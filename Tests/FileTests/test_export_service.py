@@ -0,0 +1,98 @@
+import os
+
+import pytest
+from BLL.Services.ExportService.ExportService import ExportService
+from BLL.Services.ImportService.ImportService import ImportService
+from BLL.Services.RecordService.RecordService import RecordService
+from DAL.Entities.Record import Record
+from DAL.Exceptions.InvalidException import InvalidException
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+from DAL.Storages.SqliteAddressBookStorage import SqliteAddressBookStorage
+
+
+@pytest.fixture
+def storage():
+    storage = AddressBookStorage()
+    storage.add(Record("John", "+380991112233", "0501234567", birthday="05.11.2000"))
+    storage.add(Record("Jane,Jr.", "+380987654321"))
+    storage.add(Record("Олена", birthday="29.02.1996"))
+    return storage
+
+
+@pytest.fixture
+def export_service(storage):
+    return ExportService(RecordService(storage))
+
+
+def as_tuples(storage):
+    return {
+        record.name.value: ([p.value for p in record.phones], record.birthday.value if record.birthday else None)
+        for record in storage.all_values()
+    }
+
+
+@pytest.mark.parametrize("file_name", ["book.csv", "book.jsonl", "book.vcf"])
+def test_export_round_trip(export_service, storage, tmp_path, file_name):
+    path = str(tmp_path / file_name)
+    report = export_service.export_file(path)
+
+    restored = AddressBookStorage()
+    imported = ImportService(RecordService(restored)).import_file(path)
+
+    assert report.exported == 3 and "rows/s" in str(report)
+    assert (imported.imported, imported.failed) == (3, 0)
+    assert as_tuples(restored) == as_tuples(storage)
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_export_filters(export_service, tmp_path):
+    path = str(tmp_path / "book.jsonl")
+
+    assert export_service.export_file(path, name_prefix="j").exported == 2
+    assert export_service.export_file(path, has_birthday=True).exported == 2
+    assert export_service.export_file(path, name_prefix="j", has_birthday=True).exported == 1
+    with open(path, encoding="utf-8") as file:
+        assert '"name": "John"' in file.read()
+
+
+def test_export_is_point_in_time(storage):
+    snapshot = storage.iter_snapshot()
+    first = next(snapshot)
+
+    storage.update_item("John", storage.find("John").update().add_phone("+380670000000").build())
+    storage.delete("Олена")
+    storage.add(Record("Late", "+380991112233"))
+
+    names = [first.name.value] + [record.name.value for record in snapshot]
+    assert names == ["John", "Jane,Jr.", "Олена"]
+    assert [p.value for p in first.phones] == ["+380991112233", "0501234567"]
+
+
+def test_sqlite_export_is_point_in_time(tmp_path):
+    storage = SqliteAddressBookStorage(str(tmp_path / "book.db"))
+    storage.add_many([Record("Anna", "+380991112233"), Record("Bob", "+380991112233")])
+    try:
+        snapshot = storage.iter_snapshot()
+        assert next(snapshot).name.value == "Anna"
+
+        storage.delete("Bob")
+        storage.add(Record("Carl", "+380991112233"))
+
+        assert [record.name.value for record in snapshot] == ["Bob"]
+    finally:
+        storage.connection.close()
+
+
+def test_failed_export_leaves_no_file(export_service, tmp_path):
+    with pytest.raises(InvalidException):
+        export_service.export_file(str(tmp_path / "book.txt"))
+
+    class BrokenRecords(RecordService):
+        def iter_snapshot(self):
+            yield Record("John")
+            raise OSError("disk full")
+
+    broken = ExportService(BrokenRecords(AddressBookStorage()))
+    with pytest.raises(OSError):
+        broken.export_file(str(tmp_path / "book.csv"))
+    assert os.listdir(tmp_path) == []
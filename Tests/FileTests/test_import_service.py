@@ -0,0 +1,159 @@
+from datetime import date
+
+import pytest
+from BLL.Services.ImportService.ImportService import ImportService
+from BLL.Services.RecordService.RecordService import RecordService
+from DAL.Entities.Record import Record
+from DAL.Exceptions.InvalidException import InvalidException
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+
+
+@pytest.fixture
+def storage():
+    return AddressBookStorage()
+
+
+@pytest.fixture
+def import_service(storage):
+    return ImportService(RecordService(storage))
+
+
+def write(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+def test_import_csv(import_service, storage, tmp_path):
+    path = write(tmp_path, "contacts.csv",
+                 "name,phones,birthday\n"
+                 "John,+380991112233;0501234567,05.11.2000\n"
+                 "Jane,+380 (98) 765-43-21,\n")
+
+    report = import_service.import_file(path)
+
+    assert (report.imported, report.failed) == (2, 0)
+    assert [p.value for p in storage.find("John").phones] == ["+380991112233", "0501234567"]
+    assert storage.find("John").birthday.value == date(2000, 11, 5)
+    assert storage.find("Jane").phones[0].value == "+380987654321"
+    assert "rows/s" in str(report)
+
+
+def test_import_jsonl_reports_row_errors_without_aborting(import_service, storage, tmp_path):
+    storage.add(Record("Existing", "+380991112233"))
+    path = write(tmp_path, "contacts.jsonl", "\n".join([
+        '{"name": "John", "phones": ["+380991112233"], "birthday": "05.11.2000"}',
+        '{"name": "Bad phone", "phones": ["12"]}',
+        'not json',
+        '{"name": "John", "phones": []}',
+        '{"name": "Existing", "phone": "+380991112233"}',
+        '{"name": "Future", "birthday": "01.01.2999"}',
+        '{"phones": ["+380991112233"]}',
+        '{"name": "Jane", "phone": "+380987654321"}',
+    ]))
+
+    report = import_service.import_file(path)
+
+    assert report.imported == 2
+    assert sorted(storage.data) == ["Existing", "Jane", "John"]
+    assert [line for line, _ in report.errors] == [2, 3, 4, 5, 6, 7]
+    assert "already exists" in dict(report.errors)[4]
+
+
+def test_import_vcard(import_service, storage, tmp_path):
+    path = write(tmp_path, "contacts.vcf", "\r\n".join([
+        "BEGIN:VCARD", "VERSION:3.0", "FN:John Smith", "TEL;TYPE=CELL:+380 99 111 22 33",
+        "TEL:050-123-45-67", "BDAY:2000-11-05", "END:VCARD",
+        "BEGIN:VCARD", "VERSION:4.0", "N:Doe;Jane;;;", "item1.TEL:tel:+380987654321", "END:VCARD",
+        "BEGIN:VCARD", "FN:No ", " Year", "BDAY:--0501", "END:VCARD",
+    ]))
+
+    report = import_service.import_file(path)
+
+    assert report.imported == 2
+    john = storage.find("John_Smith")
+    assert [p.value for p in john.phones] == ["+380991112233", "0501234567"]
+    assert john.birthday.value == date(2000, 11, 5)
+    assert storage.find("Jane_Doe").phones[0].value == "+380987654321"
+    assert report.errors == [(13, "Unsupported BDAY value '--0501'")]
+
+
+def test_imported_names_can_be_used_as_one_argument(import_service, storage, tmp_path):
+    csv_path = write(tmp_path, "contacts.csv", "name,phones\nAnna  Maria\t Lee,+380991112233\n   ,+380991112233\n")
+    vcard_path = write(tmp_path, "contacts.vcf", "\r\n".join([
+        "BEGIN:VCARD", "N:O\\;Brien;Pat\\, Jr;;;", "END:VCARD",
+    ]))
+
+    csv_report = import_service.import_file(csv_path)
+    import_service.import_file(vcard_path)
+
+    assert storage.has("Anna_Maria_Lee")
+    assert csv_report.errors == [(3, "Name is required")]
+    assert storage.has("Pat,_Jr_O;Brien")
+
+
+def test_import_stores_in_batches(import_service, storage, tmp_path):
+    notifications = []
+    storage.add_listener(notifications.append)
+    import_service.BATCH_SIZE = 2
+    path = write(tmp_path, "contacts.csv", "name,phones\n" + "".join(f"Contact{i},+38099111223{i}\n" for i in range(5)))
+
+    report = import_service.import_file(path)
+
+    assert report.imported == 5
+    assert [len(changes) for changes in notifications] == [2, 2, 1]
+
+
+def test_import_format_errors(import_service, tmp_path):
+    with pytest.raises(InvalidException):
+        import_service.import_file(str(tmp_path / "missing.csv"))
+
+    path = write(tmp_path, "contacts.txt", "name\nJohn\n")
+    with pytest.raises(InvalidException):
+        import_service.import_file(path)
+    with pytest.raises(InvalidException):
+        import_service.import_file(path, "xml")
+    assert import_service.import_file(path, "csv").imported == 1
+
+    no_header = write(tmp_path, "broken.csv", "John,+380991112233\n")
+    with pytest.raises(InvalidException):
+        import_service.import_file(no_header)
+
+
+def test_parallel_import_matches_single_process(storage, tmp_path):
+    storage.add(Record("Existing", "+380991112233"))
+    path = write(tmp_path, "contacts.jsonl", "\n".join([
+        '{"name": "John", "phones": ["+380 99 111 22 33"], "birthday": "05.11.2000"}',
+        '{"name": "Bad phone", "phones": ["12"]}',
+        'not json',
+        '{"name": "John", "phones": []}',
+        '{"name": "Existing", "phone": "+380991112233"}',
+        '{"name": "Future", "birthday": "01.01.2999"}',
+    ] + [f'{{"name": "Contact{i}", "phone": "+38099111{i:04}"}}' for i in range(20)]))
+
+    single_storage = AddressBookStorage()
+    single_storage.add(Record("Existing", "+380991112233"))
+    single = ImportService(RecordService(single_storage)).import_file(path)
+
+    parallel_service = ImportService(RecordService(storage), workers=2)
+    parallel_service.PARALLEL_MIN_BYTES = 0
+    parallel_service.SHARD_SIZE = 3
+    parallel = parallel_service.import_file(path)
+
+    assert parallel.imported == single.imported == 21
+    assert parallel.errors == single.errors
+    john = storage.find("John")
+    assert [p.value for p in john.phones] == ["+380991112233"]
+    assert john.birthday.value == date(2000, 11, 5)
+    assert storage.find("Contact19").phones[0].value == "+380991110019"
+
+
+def test_small_files_are_imported_without_workers(storage, tmp_path, monkeypatch):
+    service = ImportService(RecordService(storage), workers=4)
+    monkeypatch.setattr(service, "_import_in_workers", lambda rows, report: pytest.fail("started workers"))
+    path = write(tmp_path, "contacts.csv", "name,phones\nJohn,+380991112233\n")
+
+    assert service.import_file(path).imported == 1
+
+    with pytest.raises(InvalidException):
+        ImportService(RecordService(storage), workers=0)
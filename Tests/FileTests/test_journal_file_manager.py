@@ -0,0 +1,69 @@
+import os
+import pytest
+from DAL.FileManagers.JournalFileManager.JournalFileManager import JournalFileManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    jm = JournalFileManager(base_dir=str(tmp_path))
+    yield jm
+    jm.close()
+
+
+def test_append_and_read_entries(manager):
+    manager.append([["u", "John", ["+380991112233"], None]])
+    manager.append([["d", "John"]])
+
+    assert list(manager.read_entries(0)) == [["u", "John", ["+380991112233"], None], ["d", "John"]]
+
+
+def test_rotate_starts_new_segment(manager):
+    manager.append([["d", "A"]])
+    sealed = manager.rotate()
+    manager.append([["d", "B"]])
+
+    assert manager.get_segments() == [sealed, sealed + 1]
+    assert list(manager.read_entries(0, up_to_segment=sealed)) == [["d", "A"]]
+    assert list(manager.read_entries(sealed)) == [["d", "B"]]
+
+
+def test_torn_last_line_is_ignored(manager, tmp_path):
+    manager.append([["d", "A"]])
+    manager.close()
+    with open(os.path.join(str(tmp_path), "journal_000001.log"), "a", encoding="utf-8") as file:
+        file.write('["u","B",["12')
+
+    assert list(JournalFileManager(base_dir=str(tmp_path)).read_entries(0)) == [["d", "A"]]
+
+
+def test_checkpoint_roundtrip_and_segment_cleanup(manager):
+    assert manager.load_checkpoint() == (0, {})
+
+    manager.append([["d", "A"]])
+    sealed = manager.rotate()
+    manager.save_checkpoint(sealed, {"John": (("+380991112233",), None)})
+    manager.delete_segments(sealed)
+
+    assert manager.load_checkpoint() == (sealed, {"John": (("+380991112233",), None)})
+    assert manager.get_segments() == [sealed + 1]
+
+
+def test_restart_after_torn_line_keeps_new_entries(manager, tmp_path):
+    manager.append([["d", "A"]])
+    manager.close()
+    with open(os.path.join(str(tmp_path), "journal_000001.log"), "a", encoding="utf-8") as file:
+        file.write('["u","B",["12')
+
+    restarted = JournalFileManager(base_dir=str(tmp_path))
+    restarted.append([["d", "C"]])
+    restarted.close()
+
+    assert list(JournalFileManager(base_dir=str(tmp_path)).read_entries(0)) == [["d", "A"], ["d", "C"]]
+
+
+def test_damaged_line_does_not_hide_later_entries(manager, tmp_path):
+    manager.close()
+    with open(os.path.join(str(tmp_path), "journal_000001.log"), "w", encoding="utf-8") as file:
+        file.write('["d","A"]\n["u","B",["12["d","C"]\n["d","D"]\n')
+
+    assert list(JournalFileManager(base_dir=str(tmp_path)).read_entries(0)) == [["d", "A"], ["d", "D"]]
@@ -0,0 +1,78 @@
+from BLL.Services.JournalService.JournalService import JournalService
+from BLL.Services.RecordService.RecordService import RecordService
+from DAL.FileManagers.JournalFileManager.JournalFileManager import JournalFileManager
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+from DAL.Entities.Record import Record
+
+
+def open_book(path, threshold=4 * 1024 * 1024):
+    storage = AddressBookStorage()
+    journal = JournalService(JournalFileManager(base_dir=str(path)), storage, compaction_threshold=threshold)
+    journal.restore()
+    return storage, RecordService(storage), journal
+
+
+def test_changes_survive_restart(tmp_path):
+    storage, service, journal = open_book(tmp_path)
+    service.save(Record("John", "+380991112233", birthday="05.11.2000"))
+    service.save(Record("Jane", "+380987654321"))
+    john = service.get_by_name("John").update().add_phone("+380665554433").build()
+    service.update("John", john)
+    service.rename("Jane", "Janet")
+    journal.close()
+
+    storage, service, journal = open_book(tmp_path)
+    assert [p.value for p in service.get_by_name("John").phones] == ["+380991112233", "+380665554433"]
+    assert service.get_by_name("John").birthday.value.year == 2000
+    assert service.has("Janet") and not service.has("Jane")
+    assert service.get_by_phone("+380665554433")[0].name.value == "John"
+    journal.close()
+
+
+def test_compaction_folds_journal_into_checkpoint(tmp_path):
+    storage, service, journal = open_book(tmp_path, threshold=200)
+    for index in range(20):
+        service.save(Record(f"User{index}", f"+3809911122{index:02d}"))
+    service.delete("User0")
+    journal.compact(wait=True)
+    assert journal.last_error is None
+    journal.close()
+
+    manager = JournalFileManager(base_dir=str(tmp_path))
+    segment, records = manager.load_checkpoint()
+    assert segment > 0
+    assert len(manager.get_segments()) == 1
+    manager.close()
+
+    storage, service, journal = open_book(tmp_path)
+    assert len(service.get_all()) == 19
+    assert not service.has("User0")
+    journal.close()
+
+
+def test_import_state_writes_checkpoint(tmp_path):
+    storage, service, journal = open_book(tmp_path)
+    service.save(Record("John", "+380991112233"))
+    storage.import_state({"Mike": Record("Mike", "+380931234567")})
+    journal.close()
+
+    storage, service, journal = open_book(tmp_path)
+    assert service.has("Mike")
+    assert not service.has("John")
+    journal.close()
+
+
+def test_changes_after_crash_and_restart_are_restored(tmp_path):
+    storage, service, journal = open_book(tmp_path)
+    service.save(Record("John", "+380991112233"))
+    journal.close()
+    with open(tmp_path / f"journal_{journal.journal_manager.active_segment:06d}.log", "a", encoding="utf-8") as file:
+        file.write('["u","Torn",["+3809')
+
+    storage, service, journal = open_book(tmp_path)
+    service.save(Record("Jane", "+380987654321"))
+    journal.close()
+
+    storage, service, journal = open_book(tmp_path)
+    assert service.has("John") and service.has("Jane") and not service.has("Torn")
+    journal.close()
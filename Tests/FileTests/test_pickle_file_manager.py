@@ -1,7 +1,9 @@
 import os
 import pickle
 import pytest
+from DAL.Exceptions.InvalidException import InvalidException
 from DAL.FileManagers.PickleFileManager.PickleFileManager import PickleFileManager
+from DAL.FileManagers.SnapshotManifest.SnapshotManifest import SnapshotManifest
 
 
 @pytest.fixture
@@ -74,3 +76,50 @@ def test_has_file_with_name(manager):
     manager.save(data, "arr.pkl")
     assert manager.has_file_with_name("arr.pkl")
     assert not manager.has_file_with_name("missing.pkl")
+
+
+def test_failed_save_leaves_no_file(manager):
+    with pytest.raises(Exception):
+        manager.save({"bad": lambda x: x}, "broken.pkl")
+
+    assert manager.get_all_names() == []
+    assert os.listdir(manager.base_dir) == [SnapshotManifest.FILE_NAME]
+
+
+def test_save_returns_written_name(manager):
+    assert manager.save({"a": 1}, "dup.pkl") == "dup.pkl"
+    assert manager.save({"a": 1}, "dup.pkl") == "dup_1.pkl"
+
+
+@pytest.mark.parametrize("codec, magic", [
+    ("gzip", b"\x1f\x8b"),
+    ("bz2", b"BZh"),
+    ("lzma", b"\xfd7zXZ\x00"),
+])
+def test_compressed_save_is_detected_on_load(manager, temp_dir, codec, magic):
+    data = {f"name{i}": "x" * 100 for i in range(100)}
+    name = manager.save(data, "compressed.pkl", codec)
+
+    with open(os.path.join(temp_dir, name), "rb") as file:
+        assert file.read(len(magic)) == magic
+    assert os.path.getsize(os.path.join(temp_dir, name)) < len(pickle.dumps(data))
+    assert manager.detect_codec(os.path.join(temp_dir, name)) == codec
+    assert manager.load(name) == data
+
+
+def test_default_codec_and_plain_files(temp_dir):
+    compressing = PickleFileManager(base_dir=str(temp_dir), codec="gzip")
+    compressing.save({"a": 1}, "default.pkl")
+    name = compressing.save({"b": 2}, "plain.pkl", "none")
+
+    assert compressing.detect_codec(os.path.join(temp_dir, "default.pkl")) == "gzip"
+    assert compressing.detect_codec(os.path.join(temp_dir, name)) == "none"
+    assert compressing.load(name) == {"b": 2}
+
+
+def test_unknown_codec_raises(manager, temp_dir):
+    with pytest.raises(InvalidException):
+        manager.save({"a": 1}, "bad.pkl", "zip")
+    with pytest.raises(InvalidException):
+        PickleFileManager(base_dir=str(temp_dir), codec="zip")
+    assert manager.get_all_names() == []
@@ -9,6 +9,8 @@ from BLL.Services.PickleFileService.PickleFileService import PickleFileService
 def mock_file_manager():
     fm = MagicMock()
     fm.get_all_names.return_value = ["file1.pkl", "file2.pkl"]
+    fm.save.side_effect = lambda obj, name, codec=None: name
+    fm.FILE_EXTENSION = ".pkl"
     return fm
 
 
@@ -16,6 +18,8 @@ def mock_file_manager():
 def mock_storage():
     st = MagicMock()
     st.export_state.return_value = {"a": 1}
+    st.is_empty.return_value = False
+    st.get_generation.return_value = 1
     return st
 
 
@@ -37,6 +41,13 @@ def test_save_with_name_success(service, mock_file_manager, mock_storage):
     assert args[1].endswith(".pkl")
 
 
+def test_save_with_name_passes_codec(service, mock_file_manager):
+    service.save_with_name("backup", "lzma")
+
+    args, _ = mock_file_manager.save.call_args
+    assert args[2] == "lzma"
+
+
 def test_save_with_name_uses_default_name(service, mock_file_manager):
     service.save_with_name()  # без аргументу
 
@@ -52,11 +63,50 @@ def test_save_with_name_empty_data_raises(service, mock_storage):
         service.save_with_name("test")
 
 
-def test_save_with_name_pickle_error(service, mock_storage):
-    # lambda неможливо серіалізувати
-    mock_storage.export_state.return_value = {"bad": lambda x: x}
+def test_save_with_name_pickle_error(service, mock_file_manager):
+    # серіалізація відбувається лише у файловому менеджері
+    mock_file_manager.save.side_effect = pickle.PicklingError("lambda")
     with pytest.raises(InvalidException, match="Cannot serialize data"):
         service.save_with_name("broken")
+    assert service.is_save_able()
+
+
+def test_save_with_name_skips_unchanged_state(service, mock_file_manager, mock_storage):
+    first = service.save_with_name("backup")
+    second = service.save_with_name("backup")
+
+    assert first == second
+    mock_file_manager.save.assert_called_once()
+    mock_storage.mark_clean.assert_called_once()
+
+
+# --- IS_SAVE_ABLE --- #
+
+def test_is_save_able_tracks_generation(service, mock_storage):
+    assert service.is_save_able()
+
+    service.save_with_name("backup")
+    assert not service.is_save_able()
+
+    mock_storage.get_generation.return_value = 2
+    assert service.is_save_able()
+
+
+def test_is_save_able_empty_storage(service, mock_storage):
+    mock_storage.is_empty.return_value = True
+    assert not service.is_save_able()
+    # The check never builds the whole book
+    mock_storage.export_state.assert_not_called()
+
+
+def test_is_save_able_false_after_load(service, mock_file_manager, mock_storage):
+    mock_file_manager.has_file_with_name.return_value = True
+    mock_file_manager.load.return_value = {"a": 1}
+
+    service.load_by_name("backup.pkl")
+
+    assert not service.is_save_able()
+    mock_storage.mark_clean.assert_called_once()
 
 
 # --- LOAD_BY_NAME --- #
@@ -0,0 +1,167 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from BLL.Services.PickleFileService.PickleFileService import PickleFileService
+from BLL.Services.RetentionService.RetentionService import RetentionService
+from DAL.Entities.Record import Record
+from DAL.Entities.RetentionPolicy import RetentionPolicy
+from DAL.Entities.SnapshotDelta import SnapshotDelta
+from DAL.Entities.SnapshotInfo import SnapshotInfo
+from DAL.Exceptions.InvalidException import InvalidException
+from DAL.FileManagers.BinaryFileManager.BinaryFileManager import BinaryFileManager
+from DAL.FileManagers.PickleFileManager.PickleFileManager import PickleFileManager
+from DAL.FileManagers.SnapshotManifest.SnapshotManifest import SnapshotManifest
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+
+NOW = datetime(2025, 3, 10, 12, 0)
+
+
+def snapshot(name, hours_ago, size=100, parent=None):
+    return SnapshotInfo(name, NOW - timedelta(hours=hours_ago), size, parent=parent)
+
+
+def planned_names(policy, snapshots, protected=()):
+    return sorted(s.name for s in RetentionService(None, policy).plan(snapshots, NOW, protected))
+
+
+def test_keeps_last_files():
+    snapshots = [snapshot(f"s{i}", 100 - i) for i in range(5)]
+    policy = RetentionPolicy(keep_last=2, hourly_for_hours=0, daily_for_days=0)
+
+    assert planned_names(policy, snapshots) == ["s0", "s1", "s2"]
+
+
+def test_keeps_newest_file_of_each_hour_and_day():
+    snapshots = [
+        snapshot("old_day", 72.5), snapshot("old_day_newest", 72.2),
+        snapshot("hour_a", 3.6), snapshot("hour_a_newest", 3.4),
+        snapshot("latest", 0.1),
+    ]
+    hourly = RetentionPolicy(keep_last=1, hourly_for_hours=6, daily_for_days=0)
+    daily = RetentionPolicy(keep_last=1, hourly_for_hours=0, daily_for_days=5)
+
+    assert planned_names(hourly, snapshots) == ["hour_a", "old_day", "old_day_newest"]
+    assert planned_names(daily, snapshots) == ["hour_a", "hour_a_newest", "old_day"]
+
+
+def test_parents_of_kept_deltas_are_kept():
+    snapshots = [
+        snapshot("full", 50),
+        snapshot("delta1", 49, parent="full"),
+        snapshot("other", 48),
+        snapshot("delta2", 47, parent="delta1"),
+    ]
+    policy = RetentionPolicy(keep_last=1, hourly_for_hours=0, daily_for_days=0)
+
+    assert planned_names(policy, snapshots) == ["other"]
+
+
+def test_size_limit_drops_oldest_chains_but_not_the_latest():
+    snapshots = [
+        snapshot("full_a", 50, 400),
+        snapshot("delta_a", 49, 50, parent="full_a"),
+        snapshot("full_b", 48, 400),
+        snapshot("latest", 47, 400),
+    ]
+    policy = RetentionPolicy(keep_last=10, hourly_for_hours=0, daily_for_days=0, max_total_bytes=900)
+    assert planned_names(policy, snapshots) == ["delta_a", "full_a"]
+
+    tiny = RetentionPolicy(keep_last=10, hourly_for_hours=0, daily_for_days=0, max_total_bytes=1)
+    assert planned_names(tiny, snapshots, protected=["full_b"]) == ["delta_a", "full_a"]
+
+
+def test_invalid_policy():
+    with pytest.raises(InvalidException):
+        RetentionPolicy(keep_last=0)
+    with pytest.raises(InvalidException):
+        RetentionPolicy(max_total_bytes=0)
+
+
+def test_collect_deletes_files_and_reports_space(tmp_path):
+    manager = PickleFileManager(base_dir=str(tmp_path))
+    for i in range(4):
+        manager.save({"name": "x" * 100 * i}, f"snap{i}.pkl")
+    sizes = {info.name: info.size for info in manager.get_snapshots()}
+
+    service = RetentionService(manager, RetentionPolicy(keep_last=2, hourly_for_hours=0, daily_for_days=0))
+    report = service.collect()
+
+    assert sorted(report.deleted) == ["snap0.pkl", "snap1.pkl"]
+    assert report.reclaimed_bytes == sizes["snap0.pkl"] + sizes["snap1.pkl"]
+    assert report.kept_count == 2
+    assert manager.get_all_names() == ["snap2.pkl", "snap3.pkl"]
+    assert "Deleted 2 files" in str(report)
+    assert "Nothing to delete" in str(service.collect())
+
+
+def test_file_service_prunes_only_autosaves_after_save(tmp_path):
+    manager = PickleFileManager(base_dir=str(tmp_path))
+    storage = AddressBookStorage()
+    retention = RetentionService(manager, RetentionPolicy(keep_last=2, hourly_for_hours=0, daily_for_days=0))
+    file_service = PickleFileService(manager, storage, max_delta_chain=0, retention_service=retention)
+
+    storage.add(Record("Backup", "+380991112233"))
+    file_service.save_with_name("my_backup.pkl")
+    for i in range(4):
+        storage.add(Record(f"Contact{i}", "+380991112233"))
+        file_service.save_with_name()
+
+    names = manager.get_all_names()
+    assert names[0] == "my_backup.pkl"
+    assert len(names) == 3 and all(name.startswith("autosave_") for name in names[1:])
+    assert len(file_service.last_retention_report.deleted) == 1
+
+    # Only gc-files prunes named saves
+    assert file_service.collect_garbage().deleted == ["my_backup.pkl"]
+
+
+def test_prefix_keeps_parents_of_other_files(tmp_path):
+    manager = PickleFileManager(base_dir=str(tmp_path))
+    manager.save({"a": 1}, "autosave_1.pkl")
+    manager.save(SnapshotDelta("autosave_1.pkl", 1, {}, []), "named.pkl")
+    manager.save({"a": 2}, "autosave_2.pkl")
+    manager.save({"a": 3}, "autosave_3.pkl")
+
+    retention = RetentionService(manager, RetentionPolicy(keep_last=1, hourly_for_hours=0, daily_for_days=0))
+    assert retention.collect(name_prefix="autosave_").deleted == ["autosave_2.pkl"]
+
+
+def test_collect_garbage_requires_policy(tmp_path):
+    file_service = PickleFileService(PickleFileManager(base_dir=str(tmp_path)), AddressBookStorage())
+    with pytest.raises(InvalidException):
+        file_service.collect_garbage()
+
+
+def test_files_of_unknown_origin_keep_everything_older():
+    snapshots = [
+        snapshot("full", 50),
+        snapshot("unknown", 49),
+        snapshot("other", 48),
+        snapshot("latest", 47),
+    ]
+    snapshots[1].parent_known = False
+    policy = RetentionPolicy(keep_last=3, hourly_for_hours=0, daily_for_days=0)
+    assert planned_names(policy, snapshots) == []
+
+    sized = RetentionPolicy(keep_last=3, hourly_for_hours=0, daily_for_days=0, max_total_bytes=200)
+    assert planned_names(sized, snapshots) == ["full", "unknown"]
+
+
+@pytest.mark.parametrize("manager_class", [PickleFileManager, BinaryFileManager])
+def test_collect_after_manifest_rebuild_keeps_delta_parents(tmp_path, manager_class):
+    storage = AddressBookStorage()
+    file_service = PickleFileService(manager_class(base_dir=str(tmp_path)), storage, max_delta_chain=10)
+    for i in range(4):
+        storage.add(Record(f"Contact{i}", "+380991112233"))
+        file_service.save_with_name()
+    os.remove(tmp_path / SnapshotManifest.FILE_NAME)
+
+    manager = manager_class(base_dir=str(tmp_path))
+    assert [info.parent is None for info in manager.get_snapshots()] == [True, False, False, False]
+    retention = RetentionService(manager, RetentionPolicy(keep_last=1, hourly_for_hours=0, daily_for_days=0))
+    assert retention.collect().deleted == []
+
+    restored = AddressBookStorage()
+    PickleFileService(manager, restored).load_by_name(manager.get_latest_name())
+    assert sorted(restored.export_state()) == [f"Contact{i}" for i in range(4)]
@@ -0,0 +1,135 @@
+import json
+import os
+import pickle
+
+import pytest
+from BLL.Services.PickleFileService.PickleFileService import PickleFileService
+from DAL.Entities.Record import Record
+from DAL.Entities.SnapshotDelta import SnapshotDelta
+from DAL.FileManagers.BinaryFileManager.BinaryFileManager import BinaryFileManager
+from DAL.FileManagers.PickleFileManager.PickleFileManager import PickleFileManager
+from DAL.FileManagers.SnapshotManifest.SnapshotManifest import SnapshotManifest
+from DAL.Storages.AddressBookStorage import AddressBookStorage
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return PickleFileManager(base_dir=str(tmp_path))
+
+
+def test_save_records_metadata(manager, tmp_path):
+    name = manager.save({"John": Record("John"), "Jane": Record("Jane")}, "book.pkl")
+    delta_name = manager.save(SnapshotDelta(name, 1, {"Bob": Record("Bob")}, ["Jane"]), "delta.pkl")
+
+    full, delta = manager.get_snapshots()
+    assert (full.name, full.record_count, full.parent) == ("book.pkl", 2, None)
+    assert full.size == os.path.getsize(tmp_path / name)
+    assert full.checksum == SnapshotManifest.checksum(str(tmp_path / name))
+    assert (delta.name, delta.record_count, delta.parent) == (delta_name, 1, "book.pkl")
+
+
+def test_latest_is_by_creation_not_by_name(manager):
+    manager.save({"a": 1}, "zzz.pkl")
+    manager.save({"a": 2}, "aaa.pkl")
+
+    assert manager.get_latest_name() == "aaa.pkl"
+    assert manager.get_all_names() == ["zzz.pkl", "aaa.pkl"]
+
+
+def test_delete_and_missing_files_leave_the_manifest(manager, tmp_path):
+    manager.save({"a": 1}, "first.pkl")
+    manager.save({"a": 2}, "second.pkl")
+    manager.delete("first.pkl")
+    os.remove(tmp_path / "second.pkl")
+
+    # Listing reads only the manifest, the missing file is noticed when it is asked for
+    assert manager.get_all_names() == ["second.pkl"]
+    assert not manager.has_file_with_name("second.pkl")
+    assert manager.get_latest_name() is None
+    assert manager.get_all_names() == []
+    assert json.loads((tmp_path / SnapshotManifest.FILE_NAME).read_text())["snapshots"] == []
+
+
+def test_listing_does_not_touch_snapshot_files(manager, monkeypatch):
+    for index in range(3):
+        manager.save({"a": index}, f"book{index}.pkl")
+
+    def fail(path):
+        raise AssertionError(f"listing checked {path}")
+
+    monkeypatch.setattr(os.path, "exists", fail)
+    assert manager.get_all_names() == ["book0.pkl", "book1.pkl", "book2.pkl"]
+    assert manager.get_latest_name() == "book2.pkl"
+
+
+def test_latest_file_skips_files_removed_outside(tmp_path):
+    manager = PickleFileManager(base_dir=str(tmp_path))
+    manager.save({"a": 1}, "first.pkl")
+    manager.save({"a": 2}, "second.pkl")
+    os.remove(tmp_path / "second.pkl")
+
+    assert PickleFileService(manager, AddressBookStorage()).get_latest_file_name() == "first.pkl"
+    assert manager.get_all_names() == ["first.pkl"]
+
+
+def test_rebuilds_from_existing_files(tmp_path):
+    for index, name in enumerate(["old.pkl", "new.pkl"]):
+        with open(tmp_path / name, "wb") as file:
+            pickle.dump({"a": index}, file)
+        os.utime(tmp_path / name, (1_000_000 + index, 1_000_000 + index))
+
+    manager = PickleFileManager(base_dir=str(tmp_path))
+
+    assert manager.get_all_names() == ["old.pkl", "new.pkl"]
+    assert manager.get_latest_name() == "new.pkl"
+    assert manager.get_snapshots()[0].record_count is None
+
+
+def test_corrupt_manifest_is_rebuilt(manager, tmp_path):
+    manager.save({"a": 1}, "book.pkl")
+    (tmp_path / SnapshotManifest.FILE_NAME).write_text("{not json")
+
+    assert PickleFileManager(base_dir=str(tmp_path)).get_all_names() == ["book.pkl"]
+
+
+def test_instances_see_each_others_changes(manager, tmp_path):
+    other = PickleFileManager(base_dir=str(tmp_path))
+    other.save({"a": 1}, "book.pkl")
+
+    assert manager.get_all_names() == ["book.pkl"]
+    assert manager.save({"a": 2}, "book.pkl") == "book_1.pkl"
+
+
+def test_binary_manager_lists_both_formats(tmp_path):
+    PickleFileManager(base_dir=str(tmp_path)).save({"John": Record("John")}, "legacy.pkl")
+    binary = BinaryFileManager(base_dir=str(tmp_path))
+    binary.save({"John": Record("John")}, "book")
+
+    assert binary.get_all_names() == ["legacy.pkl", "book.abk"]
+    assert binary.legacy_manager.get_all_names() == ["legacy.pkl"]
+    assert binary.get_latest_name() == "book.abk"
+
+
+def test_rebuild_reads_parents_and_marks_unreadable_files(manager, tmp_path):
+    manager.save({"John": Record("John")}, "book.pkl")
+    manager.save(SnapshotDelta("book.pkl", 1, {"Bob": Record("Bob")}, []), "delta.pkl")
+    (tmp_path / "broken.pkl").write_bytes(b"not a pickle")
+    os.remove(tmp_path / SnapshotManifest.FILE_NAME)
+
+    book, delta, broken = PickleFileManager(base_dir=str(tmp_path)).get_snapshots()
+    assert (book.parent, book.parent_known) == (None, True)
+    assert (delta.parent, delta.parent_known) == ("book.pkl", True)
+    assert (broken.parent, broken.parent_known) == (None, False)
+
+
+def test_old_manifest_version_is_rebuilt(manager, tmp_path):
+    manager.save({"John": Record("John")}, "book.pkl")
+    manager.save(SnapshotDelta("book.pkl", 1, {"Bob": Record("Bob")}, []), "delta.pkl")
+    path = tmp_path / SnapshotManifest.FILE_NAME
+    data = json.loads(path.read_text())
+    data["version"] = 1
+    for entry in data["snapshots"]:
+        entry["parent"] = None
+    path.write_text(json.dumps(data))
+
+    assert [info.parent for info in PickleFileManager(base_dir=str(tmp_path)).get_snapshots()] == [None, "book.pkl"]
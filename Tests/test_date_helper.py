@@ -31,3 +31,13 @@ def test_parse_invalid_format():
 def test_parse_none_value():
     with pytest.raises(InvalidException):
         DateHelper.parse_to_date(None)
+
+def test_birthday_keys_include_feb_29_in_non_leap_year():
+    assert DateHelper.get_birthday_keys(date(2025, 2, 28)) == ((2, 28), (2, 29))
+    assert DateHelper.get_birthday_keys(date(2024, 2, 28)) == ((2, 28),)
+    assert DateHelper.get_birthday_keys(date(2024, 2, 29)) == ((2, 29),)
+
+def test_shift_from_weekend():
+    assert DateHelper.shift_from_weekend(date(2025, 5, 31)) == date(2025, 6, 2)
+    assert DateHelper.shift_from_weekend(date(2025, 6, 1)) == date(2025, 6, 2)
+    assert DateHelper.shift_from_weekend(date(2025, 6, 3)) == date(2025, 6, 3)
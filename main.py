@@ -1,43 +1,252 @@
+import argparse
+import os
+import sys
+
+from BLL.Services.BatchService.BatchService import BatchService
 from BLL.Services.CommandService.CommandService import CommandService
+from BLL.Services.CompletionService.CompletionService import CompletionService
+from BLL.Services.CompletionService.ICompletionService import ICompletionService
+from BLL.Services.ImportService.ImportService import ImportService
 from BLL.Services.InputService.InputService import InputService
+from BLL.Services.JournalService.IJournalService import IJournalService
 from BLL.Services.PickleFileService.PickleFileService import PickleFileService
 from BLL.Services.RecordService.RecordService import RecordService
+from BLL.Services.RetentionService.RetentionService import RetentionService
+from BLL.Services.StartupService.StartupService import StartupService
+from DAL.Entities.RetentionPolicy import RetentionPolicy
+from DAL.FileManagers.IFileManager import IFileManager
 from DAL.FileManagers.PickleFileManager.PickleFileManager import PickleFileManager
 from DAL.Storages.AddressBookStorage import AddressBookStorage
+from DAL.Storages.ISerializableStorage import ISerializableStorage
 from DAL.Exceptions.AlreadyExistException import AlreadyExistException
 from DAL.Exceptions.ExitBotException import ExitBotException
 from DAL.Exceptions.InvalidException import InvalidException
 from DAL.Exceptions.NotFoundException import NotFoundException
 
-def main():
-    book_storage = AddressBookStorage()
-    record_service = RecordService(book_storage)
-    file_manager = PickleFileManager()
-    file_service = PickleFileService(file_manager, book_storage)
-    command_service = CommandService(record_service, file_service)
-    input_service = InputService(command_service)
+def setup_autocompletion(completion_service: ICompletionService) -> None:
+    try:
+        import readline
+    except ImportError:
+        # readline is not available on Windows, the bot works without completion there
+        return
 
-    print('\n🤖 Welcome to the Assistant Bot!')
-    print("Type 'help' to see available commands.\n")
+    matches: list[str] = []
+
+    def complete(text: str, state: int) -> str | None:
+        if state == 0:
+            line_before = readline.get_line_buffer()[:readline.get_begidx()]
+            matches[:] = completion_service.get_candidates(line_before, text)
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(complete)
+    readline.set_completer_delims(" \t\n")
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Assistant Bot for managing an address book")
+    parser.add_argument(
+        "--storage",
+        choices=["memory", "columnar", "sqlite"],
+        default="memory",
+        help="memory: in-memory book persisted with pickle snapshots; "
+             "columnar: numpy-backed in-memory book for large books, persisted with pickle snapshots; "
+             "sqlite: book stored row by row in a database",
+    )
+    parser.add_argument("--db-path", default="data/address_book.db", help="SQLite database file for --storage sqlite")
+    parser.add_argument(
+        "--persistence",
+        choices=["snapshot", "journal"],
+        default="snapshot",
+        help="snapshot: pickle the whole book on save/exit; journal: append every change to a write-ahead log",
+    )
+    parser.add_argument("--journal-dir", default="data/journal", help="Journal directory for --persistence journal")
+    parser.add_argument(
+        "--codec",
+        choices=list(PickleFileManager.CODECS),
+        default="none",
+        help="Compression for snapshot files, 'save [name] [codec]' overrides it for one save",
+    )
+    parser.add_argument(
+        "--snapshot-format",
+        choices=["pickle", "binary", "chunked"],
+        default="pickle",
+        help="pickle: .pkl snapshots; binary: compact .abk snapshots that also read existing .pkl files; "
+             "chunked: .cas snapshots that store every unchanged contact once across all snapshots",
+    )
+    parser.add_argument(
+        "--autosave-delay",
+        type=float,
+        default=5.0,
+        help="Seconds without changes before the background autosave writes a snapshot, 0 turns it off",
+    )
+    parser.add_argument(
+        "--migrate-snapshots",
+        action="store_true",
+        help="Convert existing .pkl snapshots to the binary format on startup",
+    )
+    parser.add_argument("--keep-last", type=int, default=10, help="Snapshot files that are always kept, newest first")
+    parser.add_argument("--keep-hours", type=int, default=24, help="Keep the newest snapshot of every hour for this many hours")
+    parser.add_argument("--keep-days", type=int, default=7, help="Keep the newest snapshot of every day for this many days")
+    parser.add_argument(
+        "--max-data-mb",
+        type=float,
+        default=0,
+        help="Delete the oldest snapshots beyond this total size in megabytes, 0 means no limit",
+    )
+    parser.add_argument(
+        "--import-workers",
+        type=int,
+        default=1,
+        help="Processes that validate rows of large import files in parallel",
+    )
+    parser.add_argument(
+        "--script",
+        metavar="PATH",
+        help="Run the commands of a file, one per line, instead of prompting; '-' reads them from standard input",
+    )
+    parser.add_argument(
+        "--save-every",
+        type=int,
+        default=0,
+        help="With --script, save a snapshot after every N commands; 0 saves once when the script ends",
+    )
+    parser.add_argument("--stop-on-error", action="store_true", help="With --script, stop at the first failed command")
+    parser.add_argument("--quiet", action="store_true", help="With --script, print only failures and the summary")
+    parser.add_argument(
+        "--interactive",
+        action="store_true",
+        help="Prompt for commands even when standard input is not a terminal, which otherwise runs as --script -",
+    )
+    arguments = parser.parse_args(argv)
+
+    if arguments.script is None and not arguments.interactive and sys.stdin is not None and not sys.stdin.isatty():
+        # Commands piped in run as a script: no banner, no prompts, a summary and an exit code
+        arguments.script = "-"
+
+    if arguments.keep_last < 1 or arguments.keep_hours < 0 or arguments.keep_days < 0 or arguments.max_data_mb < 0:
+        parser.error("--keep-last must be at least 1, the other retention limits cannot be negative")
+
+    if arguments.import_workers < 1:
+        parser.error("--import-workers must be at least 1")
+
+    if arguments.save_every < 0:
+        parser.error("--save-every cannot be negative")
+
+    if arguments.script not in (None, "-") and not os.path.isfile(arguments.script):
+        parser.error(f"script file '{arguments.script}' does not exist")
+
+    if arguments.storage != "memory" and arguments.persistence == "journal":
+        parser.error("--persistence journal is only available with --storage memory")
+
+    if arguments.migrate_snapshots and arguments.snapshot_format != "binary":
+        parser.error("--migrate-snapshots requires --snapshot-format binary")
+
+    return arguments
+
+# Backends other than the defaults are imported only when selected,
+# numpy and sqlite3 alone take longer to import than the rest of the bot
+
+def create_storage(arguments: argparse.Namespace) -> ISerializableStorage:
+    if arguments.storage == "sqlite":
+        from DAL.Storages.SqliteAddressBookStorage import SqliteAddressBookStorage
+        return SqliteAddressBookStorage(arguments.db_path)
+    if arguments.storage == "columnar":
+        from DAL.Storages.ColumnarAddressBookStorage import ColumnarAddressBookStorage
+        return ColumnarAddressBookStorage()
+    return AddressBookStorage()
+
+def create_file_manager(arguments: argparse.Namespace) -> IFileManager:
+    if arguments.snapshot_format == "binary":
+        from DAL.FileManagers.BinaryFileManager.BinaryFileManager import BinaryFileManager
+        return BinaryFileManager(codec=arguments.codec)
+    if arguments.snapshot_format == "chunked":
+        from DAL.FileManagers.ChunkFileManager.ChunkFileManager import ChunkFileManager
+        return ChunkFileManager(codec=arguments.codec)
+    return PickleFileManager(codec=arguments.codec)
 
+def create_journal_service(arguments: argparse.Namespace, storage: AddressBookStorage) -> IJournalService:
+    from BLL.Services.JournalService.JournalService import JournalService
+    from DAL.FileManagers.JournalFileManager.JournalFileManager import JournalFileManager
+    return JournalService(JournalFileManager(arguments.journal_dir), storage)
+
+def load_previous_state(arguments, file_manager, file_service, journal_service) -> str:
+    if journal_service:
+        try:
+            restored_count = journal_service.restore()
+            return f"📂 Restored {restored_count} contacts from journal '{arguments.journal_dir}'"
+        except Exception as e:
+            return f"⚠️ Could not restore journal: {e}"
+
+    messages = []
     try:
+        if arguments.migrate_snapshots:
+            migrated = file_manager.migrate_legacy_files()
+            messages.append(f"🔁 Migrated {len(migrated)} snapshot files to the binary format")
+
         latest_file_name = file_service.get_latest_file_name()
         if latest_file_name:
             file_service.load_by_name(latest_file_name)
-            print(f"📂 Loaded last saved state from '{latest_file_name}'")
+            messages.append(f"📂 Loaded last saved state from '{latest_file_name}'")
         else:
-            print("📂 No saved state found, starting with empty address book.")
+            messages.append("📂 No saved state found, starting with empty address book.")
     except Exception as e:
-        print(f"⚠️ Could not load previous state: {e}")
+        messages.append(f"⚠️ Could not load previous state: {e}")
+
+    # Autosave starts after the load, otherwise the loaded book would count as unsaved changes.
+    # Scripts save on their own schedule instead
+    if arguments.autosave_delay > 0 and arguments.script is None:
+        file_service.start_autosave(arguments.autosave_delay)
+    return "\n".join(messages)
+
+def run_script(arguments: argparse.Namespace, input_service: InputService, file_service: PickleFileService | None) -> int:
+    batch_service = BatchService(
+        input_service,
+        file_service,
+        save_every=arguments.save_every,
+        stop_on_error=arguments.stop_on_error,
+        output=None if arguments.quiet else print,
+        error_output=lambda text: print(text, file=sys.stderr),
+    )
+
+    if arguments.script == "-":
+        report = batch_service.run(sys.stdin)
+    else:
+        with open(arguments.script, "r", encoding="utf-8") as file:
+            report = batch_service.run(file)
+
+    print(report)
+    return 1 if report.failed or report.save_errors else 0
+
+def run_interactive(arguments: argparse.Namespace, input_service: InputService, startup_service: StartupService | None) -> None:
+    print('\n🤖 Welcome to the Assistant Bot!')
+    print("Type 'help' to see available commands.\n")
+
+    if startup_service is None:
+        print(f"📂 Using SQLite address book at '{arguments.db_path}'")
+    else:
+        startup_service.start()
+        print("📂 Loading the address book in the background...")
 
     while True:
         try:
+            if startup_service and (message := startup_service.take_message()):
+                print(message)
+
             user_input = input('Enter a command: ')
 
             if not user_input:
                 continue
 
-            print(input_service.handle(user_input))
+            result = input_service.handle(user_input)
+            if isinstance(result, str):
+                print(result)
+            else:
+                # Streaming commands yield chunks, print each as soon as it is ready
+                for chunk in result:
+                    print(chunk, flush=True)
 
         except InvalidException as ic:
             print(ic)
@@ -59,5 +268,60 @@ def main():
             print(f'💥 Unexpected error: {ex}')
             break
 
+def main(argv: list[str] | None = None) -> int:
+    arguments = parse_arguments(argv)
+    use_sqlite = arguments.storage == "sqlite"
+    use_journal = arguments.persistence == "journal"
+
+    book_storage = create_storage(arguments)
+    record_service = RecordService(book_storage)
+    file_manager = create_file_manager(arguments)
+    retention_policy = RetentionPolicy(
+        keep_last=arguments.keep_last,
+        hourly_for_hours=arguments.keep_hours,
+        daily_for_days=arguments.keep_days,
+        max_total_bytes=int(arguments.max_data_mb * 1024 * 1024) or None,
+    )
+    file_service = PickleFileService(
+        file_manager,
+        book_storage,
+        max_delta_chain=10,
+        retention_service=RetentionService(file_manager, retention_policy),
+    )
+    journal_service = create_journal_service(arguments, book_storage) if use_journal else None
+    # SQLite and the journal write every change immediately, so there is nothing to autosave on exit
+    command_service = CommandService(
+        record_service,
+        file_service,
+        autosave_on_exit=not (use_sqlite or use_journal),
+        import_service=ImportService(record_service, workers=arguments.import_workers),
+    )
+    # The prompt shows at once, commands that need the contacts wait until the startup load finishes
+    startup_service = None if use_sqlite else StartupService(
+        lambda: load_previous_state(arguments, file_manager, file_service, journal_service)
+    )
+    input_service = InputService(command_service, startup_service)
+
+    exit_code = 0
+    if arguments.script is not None:
+        if startup_service:
+            # Scripts run against the loaded book, the load messages stay out of the command output
+            startup_service.start()
+            startup_service.wait()
+            if message := startup_service.take_message():
+                print(message, file=sys.stderr)
+        exit_code = run_script(arguments, input_service, None if use_sqlite or use_journal else file_service)
+    else:
+        setup_autocompletion(CompletionService(command_service, record_service))
+        run_interactive(arguments, input_service, startup_service)
+
+    if startup_service:
+        # The worker may still be loading, autosave must not start after it was stopped
+        startup_service.wait()
+    file_service.stop_autosave()
+    if journal_service:
+        journal_service.close()
+    return exit_code
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())